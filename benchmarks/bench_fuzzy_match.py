@@ -0,0 +1,119 @@
+"""Micro-benchmark: evidence verification's fuzzy match, indexed PageMatcher
+vs. the previous whole-page difflib.SequenceMatcher, on dense OCR-like
+pages.
+
+    python benchmarks/bench_fuzzy_match.py [--chars 12000] [--snippets 6] [--docs 20]
+
+Reports timings, how far the new scores land from the old ones in either
+direction, and how many found / not-found verdicts differ. Fails if any
+|new - old| exceeds ddgpt.extract.fuzzy_match.RATIO_TOLERANCE or any
+verdict changes.
+"""
+from __future__ import annotations
+
+import argparse
+import difflib
+import random
+import time
+
+from ddgpt.extract.fuzzy_match import RATIO_TOLERANCE, PageMatcher
+from ddgpt.extract.postprocess import FUZZY_MATCH_THRESHOLD, normalize
+
+WORDS = (
+    "fund capital partners portfolio management fee carried interest preferred return net irr tvpi "
+    "distributions committed investment period growth equity infrastructure enterprise software "
+    "valuation exit realized unrealized quarter report limited partnership agreement hurdle "
+    "vintage 2019 2021 2024 16.8% 2.00% 1.85x $4.2b december march q3 subject to clawback"
+).split()
+
+
+# --- previous implementation ---
+
+def legacy_fuzzy_match_ratio(snippet: str, page_text: str) -> float:
+    if not snippet:
+        return 0.0
+    if snippet in page_text:
+        return 1.0
+
+    matcher = difflib.SequenceMatcher(None, page_text, snippet, autojunk=False)
+    matched_chars = sum(block.size for block in matcher.get_matching_blocks())
+    return matched_chars / len(snippet)
+
+
+# --- workload ---
+
+def ocr_noise(text: str, rate: float, rng: random.Random) -> str:
+    """Substitutions, dropped characters and stray spaces/hyphens."""
+    out = []
+    for ch in text:
+        r = rng.random()
+        if r < rate / 3:
+            out.append(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789"))
+        elif r < 2 * rate / 3:
+            continue
+        elif r < rate:
+            out.append(ch + rng.choice(" -"))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def dense_page(n_chars: int, rng: random.Random) -> str:
+    words = []
+    while sum(len(w) + 1 for w in words) < n_chars:
+        words.append(rng.choice(WORDS))
+    return normalize(" ".join(words))
+
+
+def workload(n_docs: int, n_chars: int, n_snippets: int, seed: int = 0):
+    rng = random.Random(seed)
+    docs = []
+    for _ in range(n_docs):
+        page = dense_page(n_chars, rng)
+        snippets = []
+        for i in range(n_snippets):
+            length = rng.randint(60, 160)
+            start = rng.randint(0, len(page) - length)
+            # Mostly clean, some OCR-noisy evidence -- verification's usual mix.
+            rate = (0.0, 0.03, 0.08)[i % 3]
+            snippets.append(normalize(ocr_noise(page[start:start + length], rate, rng)))
+        docs.append((page, snippets))
+    return docs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=12000, help="characters per page")
+    parser.add_argument("--snippets", type=int, default=6, help="metrics citing each page")
+    parser.add_argument("--docs", type=int, default=20)
+    args = parser.parse_args()
+
+    docs = workload(args.docs, args.chars, args.snippets)
+
+    t0 = time.perf_counter()
+    old = [[legacy_fuzzy_match_ratio(s, page) for s in snippets] for page, snippets in docs]
+    t_old = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    new = []
+    for page, snippets in docs:
+        matcher = PageMatcher(page)  # once per page, as verify_and_score does
+        new.append([matcher.ratio(s) for s in snippets])
+    t_new = time.perf_counter() - t0
+
+    pairs = [(o, n) for olds, news in zip(old, new) for o, n in zip(olds, news)]
+    deltas = [n - o for o, n in pairs]
+    outside = sum(abs(d) > RATIO_TOLERANCE for d in deltas)
+    # Snippets whose found / not-found verdict differs from the old one.
+    flipped = sum((o >= FUZZY_MATCH_THRESHOLD) != (n >= FUZZY_MATCH_THRESHOLD) for o, n in pairs)
+    print(f"docs={args.docs} chars/page={args.chars} snippets/page={args.snippets}")
+    print(f"  difflib:     {t_old * 1000:9.2f} ms")
+    print(f"  PageMatcher: {t_new * 1000:9.2f} ms")
+    print(f"  speedup:     {t_old / t_new:9.2f}x")
+    print(f"  new - old:   min {min(deltas):+.3f}  max {max(deltas):+.3f}  "
+          f"|delta| > {RATIO_TOLERANCE}: {outside}/{len(deltas)}  verdict changed: {flipped}/{len(deltas)}")
+    assert outside == 0 and flipped == 0, "PageMatcher drifted from whole-page difflib"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Micro-benchmark: RegexExtractor vs. the previous implementation (one
+re.compile + full-page search() per pattern per call) on long documents.
+
+    python benchmarks/bench_regex_extractor.py [--pages 400] [--repeat 5]
+
+Asserts both produce identical ExtractedDocs before timing them.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from typing import List, Optional, Tuple
+
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.extract.schemas import ExtractedDoc
+from ddgpt.io.loaders import Page
+from ddgpt.provenance.evidence import Evidence
+
+# --- previous implementation, verbatim apart from names ---
+
+GAP = r"[\s\S]{0,80}?"
+
+def _legacy_find_in_pages(pages: List[Page], pattern: str) -> Tuple[Optional[str], Optional[int], str]:
+    rgx = re.compile(pattern, flags=re.IGNORECASE)
+    for pg in pages:
+        m = rgx.search(pg.text)
+        if m:
+            start = max(0, m.start() - 50)
+            end = min(len(pg.text), m.end() + 50)
+            snippet = re.sub(r"\s+", " ", pg.text[start:end]).strip()
+            words = snippet.split()
+            snippet = " ".join(words[:20])
+            return m.group(1), pg.page_num, snippet
+    return None, None, ""
+
+def _legacy_parse_billion_to_usd(x: str) -> float:
+    return float(x) * 1e9
+
+class LegacyRegexExtractor:
+    def extract(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
+        out = ExtractedDoc(doc_name=doc_name)
+
+        date, p, snip = _legacy_find_in_pages(pages, r"As-of Date:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})")
+        if date is None:
+            date, p, snip = _legacy_find_in_pages(pages, r"Effective Date:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})")
+        out.doc_date = date
+
+        aum_b, p_aum, sn_aum = _legacy_find_in_pages(pages, rf"AUM\){GAP}\$([0-9]+\.[0-9]+)B")
+        if aum_b is None:
+            aum_b, p_aum, sn_aum = _legacy_find_in_pages(pages, rf"Assets Under Management{GAP}\$([0-9]+\.[0-9]+)B")
+        if aum_b is not None:
+            out.aum.value = _legacy_parse_billion_to_usd(aum_b)
+            out.aum.confidence = 0.55
+            out.aum.evidence = Evidence(doc_name=doc_name, page=p_aum, snippet=sn_aum)
+        else:
+            out.missing_fields.append("aum.value")
+
+        net_irr, p_irr, sn_irr = _legacy_find_in_pages(pages, rf"Net IRR{GAP}:\s*([0-9]+\.[0-9]+)%")
+        if net_irr is None:
+            net_irr, p_irr, sn_irr = _legacy_find_in_pages(pages, rf"Net IRR{GAP}([0-9]+\.[0-9]+)%")
+        if net_irr is not None:
+            out.net_irr.value = float(net_irr)
+            out.net_irr.confidence = 0.55
+            out.net_irr.evidence = Evidence(doc_name=doc_name, page=p_irr, snippet=sn_irr)
+        else:
+            out.missing_fields.append("net_irr.value")
+
+        tvpi, p_tvpi, sn_tvpi = _legacy_find_in_pages(pages, rf"TVPI{GAP}:\s*([0-9]+\.[0-9]+)x")
+        if tvpi is None:
+            tvpi, p_tvpi, sn_tvpi = _legacy_find_in_pages(pages, rf"TVPI{GAP}([0-9]+\.[0-9]+)x")
+        if tvpi is not None:
+            out.tvpi.value = float(tvpi)
+            out.tvpi.confidence = 0.55
+            out.tvpi.evidence = Evidence(doc_name=doc_name, page=p_tvpi, snippet=sn_tvpi)
+        else:
+            out.missing_fields.append("tvpi.value")
+
+        target, p_t, sn_t = _legacy_find_in_pages(pages, rf"Target IRR{GAP}:\s*([0-9]+)%")
+        if target is None:
+            target, p_t, sn_t = _legacy_find_in_pages(pages, rf"Target IRR{GAP}([0-9]+)%")
+        if target is not None:
+            out.target_irr.value = float(target)
+            out.target_irr.confidence = 0.55
+            out.target_irr.evidence = Evidence(doc_name=doc_name, page=p_t, snippet=sn_t)
+        else:
+            out.missing_fields.append("target_irr.value")
+
+        fee, p_f, sn_f = _legacy_find_in_pages(pages, rf"Management Fee{GAP}:\s*([0-9]+\.[0-9]+)%")
+        if fee is None:
+            fee, p_f, sn_f = _legacy_find_in_pages(pages, rf"Management Fee{GAP}([0-9]+\.[0-9]+)%")
+        if fee is not None:
+            out.mgmt_fee.value = float(fee)
+            out.mgmt_fee.confidence = 0.55
+            out.mgmt_fee.evidence = Evidence(doc_name=doc_name, page=p_f, snippet=sn_f)
+        else:
+            out.missing_fields.append("mgmt_fee.value")
+
+        carry, p_c, sn_c = _legacy_find_in_pages(pages, r"Carry:\s*([0-9]+)%")
+        if carry is None:
+            carry, p_c, sn_c = _legacy_find_in_pages(pages, rf"carried interest{GAP}([0-9]+)%")
+        hurdle, p_h, sn_h = _legacy_find_in_pages(pages, r"over an\s*([0-9]+)%\s*preferred")
+        if hurdle is None:
+            hurdle, p_h, sn_h = _legacy_find_in_pages(pages, rf"hurdle{GAP}([0-9]+)%")
+
+        if carry is not None:
+            out.carry.value = float(carry)
+            out.carry.confidence = 0.55
+            sn = sn_c or sn_h
+            pg = p_c or p_h
+            out.carry.evidence = Evidence(doc_name=doc_name, page=pg, snippet=sn)
+        else:
+            out.missing_fields.append("carry.value")
+
+        if hurdle is not None:
+            out.carry.hurdle = float(hurdle)
+        else:
+            out.missing_fields.append("carry.hurdle")
+
+        return out
+
+
+# --- workload ---
+
+FILLER = (
+    "The Fund seeks to generate attractive risk-adjusted returns through control investments in "
+    "lower middle-market companies. Portfolio construction emphasises diversification across sectors, "
+    "vintages and geographies; 12.5% of commitments are reserved for follow-ons. "
+)
+
+FACT_PAGES = [
+    "Fund Overview\nAs-of Date: 2024-03-31\nAssets Under Management (AUM) of $4.20B across three funds.",
+    "Performance Summary\nNet IRR\n16.80%\nTVPI: 1.85x\nTarget IRR: 20%",
+    "Fund Terms\nManagement Fee\n2.00% on committed capital\nCarry: 20%\n8% hurdle over an 8% preferred return",
+]
+
+
+def build_document(n_pages: int) -> List[Page]:
+    # Facts sit near the end, so every pattern has to get through most of
+    # the document before it matches -- the realistic bad case for a long
+    # PPM where performance tables come after pages of narrative.
+    pages = [Page(page_num=i + 1, text=FILLER * 12) for i in range(n_pages)]
+    for offset, text in enumerate(FACT_PAGES, start=1):
+        idx = n_pages - len(FACT_PAGES) - 1 + offset
+        pages[idx] = Page(page_num=idx + 1, text=pages[idx].text + "\n" + text)
+    return pages
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = build_document(args.pages)
+    legacy, current = LegacyRegexExtractor(), RegexExtractor()
+
+    expected = legacy.extract("bench.pdf", pages)
+    actual = current.extract("bench.pdf", pages)
+    assert actual.model_dump() == expected.model_dump(), "RegexExtractor output diverged from the previous implementation"
+
+    t_legacy = _best_of(lambda: legacy.extract("bench.pdf", pages), args.repeat)
+    t_current = _best_of(lambda: current.extract("bench.pdf", pages), args.repeat)
+    chars = sum(len(p.text) for p in pages)
+    print(f"pages={len(pages)} chars={chars:,} (best of {args.repeat})")
+    print(f"  previous: {t_legacy * 1000:8.2f} ms")
+    print(f"  current:  {t_current * 1000:8.2f} ms")
+    print(f"  speedup:  {t_legacy / t_current:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
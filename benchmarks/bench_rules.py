@@ -0,0 +1,232 @@
+"""Micro-benchmark: cross-document rules on a large data room --
+NumericMismatchRule and DefinitionDriftRule on the shared FactFrame vs. the
+previous pure-Python pairwise loops.
+
+    python benchmarks/bench_rules.py [--docs 500] [--repeat 3] [--outlier-rate 0.02]
+
+Asserts both produce identical flags, in the same order, before timing.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from ddgpt.rules.base import Flag
+from ddgpt.rules.definition_drift import DefinitionDriftRule, _local_basis
+from ddgpt.rules.fact_frame import FactFrame
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule, pct_delta
+
+
+# --- previous implementations, verbatim apart from names ---
+
+class LegacyNumericMismatchRule:
+    def __init__(self, aum_tol_pct: float, fee_abs_pct: float, target_irr_abs: float):
+        self.aum_tol_pct = aum_tol_pct
+        self.fee_abs_pct = fee_abs_pct
+        self.target_irr_abs = target_irr_abs
+
+    def apply(self, extracted: List[dict]) -> List[Flag]:
+        flags: List[Flag] = []
+        for i in range(len(extracted)):
+            for j in range(i+1, len(extracted)):
+                A = extracted[i]; B = extracted[j]
+                docA = A["doc_name"]; docB = B["doc_name"]
+
+                aumA = A["aum"]["value"]; aumB = B["aum"]["value"]
+                if aumA is not None and aumB is not None:
+                    d = pct_delta(aumA, aumB)
+                    if d > self.aum_tol_pct:
+                        flags.append(Flag(
+                            severity="RED",
+                            type="AUM_MISMATCH",
+                            docs=f"{docA} vs {docB}",
+                            detail=f"AUM differs by {d*100:.1f}%",
+                            evidence=f'{docA} (p.{A["aum"]["evidence"]["page"]}): {A["aum"]["evidence"]["snippet"]} | {docB} (p.{B["aum"]["evidence"]["page"]}): {B["aum"]["evidence"]["snippet"]}',
+                            why_it_matters="AUM impacts scale, fees, and benchmarking; mismatches require reconciliation.",
+                            question_to_ask="Which document is authoritative for AUM as-of date? Provide supporting statement/capital account details."
+                        ))
+
+                feeA = A["mgmt_fee"]["value"]; feeB = B["mgmt_fee"]["value"]
+                if feeA is not None and feeB is not None:
+                    if abs(feeA - feeB) > self.fee_abs_pct:
+                        flags.append(Flag(
+                            severity="RED",
+                            type="MGMT_FEE_MISMATCH",
+                            docs=f"{docA} vs {docB}",
+                            detail=f"Management fee differs: {feeA:.2f}% vs {feeB:.2f}%",
+                            evidence=f'{docA} (p.{A["mgmt_fee"]["evidence"]["page"]}): {A["mgmt_fee"]["evidence"]["snippet"]} | {docB} (p.{B["mgmt_fee"]["evidence"]["page"]}): {B["mgmt_fee"]["evidence"]["snippet"]}',
+                            why_it_matters="Fee terms directly affect net returns and legal obligations; LPA typically governs.",
+                            question_to_ask="Confirm the controlling fee schedule and whether any side-letter modifies the base fee."
+                        ))
+
+                tA = A["target_irr"]["value"]; tB = B["target_irr"]["value"]
+                if tA is not None and tB is not None and abs(tA - tB) > self.target_irr_abs:
+                    flags.append(Flag(
+                        severity="YELLOW",
+                        type="TARGET_IRR_DRIFT",
+                        docs=f"{docA} vs {docB}",
+                        detail=f"Target IRR differs: {tA:.1f}% vs {tB:.1f}%",
+                        evidence=f'{docA} (p.{A["target_irr"]["evidence"]["page"]}): {A["target_irr"]["evidence"]["snippet"]} | {docB} (p.{B["target_irr"]["evidence"]["page"]}): {B["target_irr"]["evidence"]["snippet"]}',
+                        why_it_matters="Different stated targets can reflect marketing vs underwriting assumptions.",
+                        question_to_ask="Is one target marketing and the other underwriting base-case? Which governs IC decision-making?"
+                    ))
+        return flags
+
+
+class LegacyDefinitionDriftRule:
+    """Flags gross-vs-net (and equivalent before/after-fee) convention drift.
+
+    Two checks, because convention is often stated once per section rather
+    than once per number:
+    - cross-document: each document's *document-wide* inferred convention
+      (from Definitions/Terms/Performance Summary sections when available,
+      see ddgpt.layout.definitions) disagrees with another document's.
+    - within-document: the wording immediately next to the reported number
+      disagrees with the convention the same document states elsewhere.
+    """
+
+    def apply(self, extracted: List[dict]) -> List[Flag]:
+        flags: List[Flag] = []
+
+        for i in range(len(extracted)):
+            for j in range(i + 1, len(extracted)):
+                A = extracted[i]
+                B = extracted[j]
+                ctx_a = A.get("net_irr_basis")
+                ctx_b = B.get("net_irr_basis")
+                basis_a = (ctx_a or {}).get("basis")
+                basis_b = (ctx_b or {}).get("basis")
+
+                if not basis_a or not basis_b or basis_a == basis_b:
+                    continue
+
+                flags.append(Flag(
+                    severity="YELLOW",
+                    type="IRR_DEFINITION_DRIFT",
+                    docs=f'{A["doc_name"]} vs {B["doc_name"]}',
+                    detail=f'Documents state different IRR return conventions: "{basis_a}" vs "{basis_b}".',
+                    evidence=(
+                        f'{A["doc_name"]} (p.{ctx_a.get("page")}, {ctx_a.get("section") or "n/a"}): "{ctx_a.get("snippet")}" | '
+                        f'{B["doc_name"]} (p.{ctx_b.get("page")}, {ctx_b.get("section") or "n/a"}): "{ctx_b.get("snippet")}"'
+                    ),
+                    why_it_matters="Definition drift can mislead IC comparisons and skew underwriting decisions.",
+                    question_to_ask="Confirm whether IRR reported is net or gross and reconcile to a consistent definition."
+                ))
+
+        for doc in extracted:
+            net_irr = doc.get("net_irr") or {}
+            snippet = ((net_irr.get("evidence") or {}).get("snippet")) or ""
+            local_basis = _local_basis(snippet)
+
+            ctx = doc.get("net_irr_basis")
+            doc_basis = (ctx or {}).get("basis")
+
+            if not local_basis or not doc_basis or local_basis == doc_basis:
+                continue
+
+            flags.append(Flag(
+                severity="YELLOW",
+                type="IRR_DEFINITION_DRIFT_INTERNAL",
+                docs=doc["doc_name"],
+                detail=(
+                    f'The reported IRR figure reads as "{local_basis}" but this document defines its '
+                    f'convention as "{doc_basis}" elsewhere.'
+                ),
+                evidence=(
+                    f'Figure (p.{net_irr.get("evidence", {}).get("page")}): "{snippet}" | '
+                    f'Convention (p.{ctx.get("page")}, {ctx.get("section") or "n/a"}): "{ctx.get("snippet")}"'
+                ),
+                why_it_matters="Inconsistent gross/net language within a single document is a red flag for underwriting rigor and can misstate performance.",
+                question_to_ask="Confirm which convention actually governs the reported Net IRR figure."
+            ))
+
+        return flags
+
+
+# --- workload ---
+
+SECTIONS = ("Definitions", "Performance Summary", "Terms", None)
+
+
+def _metric(value, doc_name, rng):
+    return {
+        "value": value,
+        "confidence": 0.8,
+        "evidence": {"doc_name": doc_name, "page": rng.randint(1, 300), "snippet": f"value {value}"},
+    }
+
+
+def data_room(n_docs: int, seed: int = 0, outlier_rate: float = 0.02) -> List[dict]:
+    """One fund's data room: many documents that mostly agree on terms,
+    with missing values and a few outliers (stale decks, a side letter)."""
+    rng = random.Random(seed)
+
+    def maybe(value, outlier):
+        if rng.random() < 0.2:
+            return None
+        return outlier if rng.random() < outlier_rate else value
+
+    docs = []
+    for k in range(n_docs):
+        name = f"doc_{k:04d}.pdf"
+        basis = "gross" if rng.random() < outlier_rate else rng.choice(("net", "net", None, ""))
+        docs.append({
+            "doc_name": name,
+            "aum": _metric(maybe(4.2e9, 4.6e9), name, rng),
+            "mgmt_fee": _metric(maybe(2.0, 1.75), name, rng),
+            "target_irr": _metric(maybe(18.0, 22.0), name, rng),
+            "net_irr": _metric(maybe(16.8, 19.5), name, rng) | {
+                "evidence": {"page": 3, "snippet": rng.choice(("Net IRR: 16.8%", "IRR 16.8%", "Gross IRR: 19.5%"))}
+            },
+            "net_irr_basis": (
+                None if basis is None
+                else {"basis": basis, "snippet": basis, "page": 2, "section": rng.choice(SECTIONS)}
+            ),
+        })
+    return docs
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--outlier-rate", type=float, default=0.02,
+                        help="share of values that disagree with the rest (drives the flag count)")
+    args = parser.parse_args()
+
+    docs = data_room(args.docs, outlier_rate=args.outlier_rate)
+    legacy = [LegacyNumericMismatchRule(0.03, 0.10, 2.0), LegacyDefinitionDriftRule()]
+    current = [NumericMismatchRule(0.03, 0.10, 2.0), DefinitionDriftRule()]
+
+    def run_legacy():
+        return [f for rule in legacy for f in rule.apply(docs)]
+
+    def run_current():
+        frame = FactFrame(docs)  # as RiskEngine.evaluate does
+        return [f for rule in current for f in rule.apply_frame(frame)]
+
+    expected, actual = run_legacy(), run_current()
+    assert [f.model_dump() for f in actual] == [f.model_dump() for f in expected], "flags diverged"
+
+    t_legacy = _best_of(run_legacy, args.repeat)
+    t_current = _best_of(run_current, args.repeat)
+    pairs = args.docs * (args.docs - 1) // 2
+    print(f"docs={args.docs} pairs={pairs:,} flags={len(expected):,} (best of {args.repeat})")
+    print(f"  previous: {t_legacy * 1000:9.2f} ms")
+    print(f"  current:  {t_current * 1000:9.2f} ms")
+    print(f"  speedup:  {t_legacy / t_current:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
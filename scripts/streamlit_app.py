@@ -17,6 +17,14 @@ from ddgpt.config import Config
 
 from ddgpt.io.loaders import load_document
 
+from ddgpt.pipeline.events import (
+    DocumentLoaded,
+    DocumentVerified,
+    MemoReady,
+    RulesDone,
+    RunComplete
+)
+
 from ddgpt.render.pdf_report import (
     render_ic_pdf,
     clean_memo_text
@@ -204,23 +212,52 @@ if uploaded:
 
     if should_rerun:
 
-        docs = []
+        # Loaded lazily: run_iter extracts each document while the next
+        # one is still loading, and the page fills in as they finish.
+        docs = (
+            _load_document_cached(
+                f.getvalue(),
+                f.name,
+                cfg.ocr.enabled,
+                cfg.ocr.dpi,
+            )
+            for f in uploaded
+        )
+
+        with st.status(
+            "Running institutional diligence pipeline...",
+            expanded=True
+        ) as status:
+
+            progress = st.progress(0.0)
+            facts_placeholder = st.empty()
+            extracted_so_far = []
+            result = None
 
-        with st.spinner(
-            "Running institutional diligence pipeline..."
-        ):
+            for event in pipeline.run_iter(docs):
 
-            for f in uploaded:
-                docs.append(
-                    _load_document_cached(
-                        f.getvalue(),
-                        f.name,
-                        cfg.ocr.enabled,
-                        cfg.ocr.dpi,
+                if isinstance(event, DocumentLoaded):
+                    status.update(label=f"Extracting {event.doc_name}...")
+
+                elif isinstance(event, DocumentVerified):
+                    extracted_so_far.append(event.document)
+                    progress.progress(
+                        len(extracted_so_far) / len(uploaded),
+                        text=f"{len(extracted_so_far)}/{len(uploaded)} documents extracted"
+                    )
+                    facts_placeholder.dataframe(
+                        to_facts_table(extracted_so_far),
+                        use_container_width=True
                     )
-                )
 
-            result = pipeline.run(docs)
+                elif isinstance(event, RulesDone):
+                    status.update(label=f"{len(event.flags)} flags raised; drafting IC memo...")
+
+                elif isinstance(event, MemoReady):
+                    status.update(label="Rendering PDF report...")
+
+                elif isinstance(event, RunComplete):
+                    result = event.result
 
             facts_df = to_facts_table(
                 result["extracted"]
@@ -245,6 +282,8 @@ if uploaded:
             st.session_state.pdf_bytes = pdf_bytes
             st.session_state.last_upload_hash = current_hash
 
+            status.update(label="Pipeline complete", state="complete", expanded=False)
+
 # Display 
 
 if st.session_state.result:
@@ -2,25 +2,45 @@ from __future__ import annotations
 from pathlib import Path
 from datetime import datetime, UTC
 import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 import typer
 from dotenv import load_dotenv
-import pandas as pd
 from typing import List
 
 from ddgpt.config import Config
 from ddgpt.utils.logging import setup_logger
-from ddgpt.utils.cache import disk_cached, content_hash
-from ddgpt.pipeline.builders import build_extractors, build_rules, build_pipeline, build_chart_extractor, extractor_availability
+from ddgpt.utils.cache import content_hash, configure_memory_cache, disk_cache_get, disk_cache_put, MISSING
+from ddgpt.utils.cache_store import get_store
+from ddgpt.utils.hashing import file_fingerprint
+from ddgpt.pipeline.batch import DealJob, load_batch_manifest, run_batch
+from ddgpt.pipeline.checkpoint import RunCheckpoint
+from ddgpt.pipeline.events import DocumentVerified
+from ddgpt.pipeline.server import JobManager, make_server
+from ddgpt.pipeline.watch import DirectoryWatcher, WatchBatch, WatchSession
+from ddgpt.pipeline.stage_manifest import reusable_stages, stage_keys, write_stage_manifest
+from ddgpt.rules.registry import build_rules
 from ddgpt.risk.engine import RiskEngine
-from ddgpt.copilot.ic_copilot import ICCopilot
+from ddgpt.risk.incremental import RISK_STATE_FILE
 from ddgpt.copilot.recommendation_engine import determine_recommendation
-from ddgpt.report.tables import to_facts_table
-from ddgpt.render.pdf_report import render_ic_pdf
 from ddgpt.provenance.audit import build_inputs_manifest, build_audit_manifest
-from ddgpt.io.loaders import load_document
+
+# Only what every command needs is imported above. Extractors and the
+# pipeline (cohere, httpx, PyMuPDF), the facts table (pandas) and the PDF
+# report (reportlab, matplotlib) are imported inside the commands that use
+# them, so short-lived `flag`/`report`/`--help` invocations don't pay for
+# the rest. tests/test_cli_startup.py keeps it that way.
 
 app = typer.Typer(add_completion=False, help="DDGPT — Diligence extraction + contradiction flags (Cohere).")
 
+# render_ic_pdf draws charts through pyplot's process-global state, so
+# `serve` and `batch` workers take turns rendering.
+_PDF_LOCK = threading.Lock()
+
+cache_app = typer.Typer(add_completion=False, help="Inspect and maintain the on-disk cache (run.cache_dir).")
+app.add_typer(cache_app, name="cache")
+
 def discover_files(input_dir: str) -> List[str]:
     paths = []
     for ext in ("*.pdf", "*.txt"):
@@ -38,34 +58,86 @@ def _load_cfg(config_path: str | None) -> Config:
     import yaml
     return Config.model_validate(yaml.safe_load(p.read_text(encoding="utf-8")))
 
-def _load_docs(cfg: Config, paths: List[str]):
-    docs = []
-
-    for p in paths:
-        file_bytes = Path(p).read_bytes()
-        key = content_hash(file_bytes, str(cfg.ocr.enabled), str(cfg.ocr.dpi))
-
-        docs.append(
-            disk_cached(
-                cfg.run.cache_dir,
-                "loaded_documents",
-                key,
-                lambda p=p: load_document(p, ocr_enabled=cfg.ocr.enabled, ocr_dpi=cfg.ocr.dpi),
-                enabled=cfg.run.enable_disk_cache,
-            )
+def _configure_cache(cfg: Config) -> None:
+    """Push run.cache_budgets_mb into the cache database, where every
+    process writing to it (including loader/OCR workers) enforces them, and
+    size this process's in-memory tier."""
+    configure_memory_cache(int(cfg.run.memory_cache_mb * 1024 * 1024))
+    if cfg.run.enable_disk_cache:
+        get_store(cfg.run.cache_dir).set_budgets(
+            {ns: int(mb * 1024 * 1024) for ns, mb in cfg.run.cache_budgets_mb.items()}
         )
 
+def _load_docs(cfg: Config, paths: List[str], pool=None, configure_cache: bool = True):
+    """Loaded documents for paths, in order, from the disk cache where
+    possible. `pool` is a shared loader process pool (see load_documents);
+    callers loading many small sets through one (batch) configure the cache
+    once themselves and pass configure_cache=False."""
+    from ddgpt.io.loaders import LOADER_CACHE_VERSION, load_documents
+
+    if configure_cache:
+        _configure_cache(cfg)
+
+    keys = [
+        content_hash(
+            file_fingerprint(p),
+            str(cfg.ocr.enabled),
+            str(cfg.ocr.dpi),
+            str(cfg.tables.page_screening),
+            LOADER_CACHE_VERSION,
+        )
+        for p in paths
+    ]
+
+    # Resolve cache hits up front so only genuinely new documents are sent
+    # to the loader (and, with load_workers > 1, to a worker process).
+    docs = [
+        disk_cache_get(cfg.run.cache_dir, "loaded_documents", key) if cfg.run.enable_disk_cache else MISSING
+        for key in keys
+    ]
+    misses = [i for i, doc in enumerate(docs) if doc is MISSING]
+
+    loaded = load_documents(
+        [paths[i] for i in misses],
+        ocr_enabled=cfg.ocr.enabled,
+        ocr_dpi=cfg.ocr.dpi,
+        workers=cfg.run.load_workers,
+        ocr_workers=cfg.ocr.workers,
+        ocr_cache_dir=cfg.run.cache_dir if cfg.run.enable_disk_cache else None,
+        table_page_screening=cfg.tables.page_screening,
+        pool=pool,
+    )
+
+    for i, doc in zip(misses, loaded):
+        docs[i] = doc
+        if cfg.run.enable_disk_cache:
+            disk_cache_put(cfg.run.cache_dir, "loaded_documents", keys[i], doc)
+
     return docs
 
+def _risk_state_path(cfg: Config, out_path: Path) -> Path | None:
+    return out_path / RISK_STATE_FILE if cfg.run.incremental_risk else None
+
 @app.command()
 def run(
     input: str = typer.Option("sample_docs", "--input"),
     out: str = typer.Option("outputs/run_demo", "--out"),
     config: str = typer.Option(None, "--config"),
+    incremental: bool = typer.Option(
+        False, "--incremental",
+        help="Reuse stages of the previous run into --out whose inputs, config and prompts are unchanged "
+             "(see stage_manifest.json), e.g. only re-run rules/memo/report after a RuleConfig change.",
+    ),
+    resume: bool = typer.Option(
+        False, "--resume",
+        help="Continue a run into --out that stopped partway: documents (and the rules/memo) it finished, "
+             "saved in <out>/checkpoint/, are not loaded or extracted again.",
+    ),
 ):
     load_dotenv()
     cfg = _load_cfg(config)
     logger = setup_logger(str(Path(out) / "run.log"))
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline, extractor_availability
 
     extractors = build_extractors(cfg)
     rules = build_rules(cfg)
@@ -77,11 +149,116 @@ def run(
         logger.info(f"extractor {name}: {status}")
 
     paths = discover_files(input)
-    docs = _load_docs(cfg, paths)
+    out_path = Path(out)
 
-    result = pipeline.run(docs)
+    keys = stage_keys(cfg, paths, avail)
+    reused = reusable_stages(out_path, keys) if incremental else []
+    if incremental:
+        logger.info(f"incremental run: reusing stages {reused or 'none'}")
 
-    out_path = Path(out)
+    # Saved as the run goes and removed once its outputs are written; see
+    # ddgpt.pipeline.checkpoint.
+    checkpoint = RunCheckpoint(out_path, stage_keys(cfg, [], avail)["extract"], keys, resume=resume)
+
+    docs, resumed, result = _run_stages(cfg, pipeline, paths, out_path, reused, checkpoint)
+    if resume:
+        logger.info(f"resumed {len(resumed)} of {len(paths)} documents from {checkpoint.dir}")
+
+    resumed_documents = checkpoint.ingestion(resumed)
+    _write_run_outputs(
+        cfg, out_path, paths, docs, result, avail, keys, reused,
+        resumed_documents=resumed_documents if resume else None,
+    )
+    checkpoint.remove()
+
+    _write_run_summary(out_path, result, avail, stages_reused=reused,
+                       documents_resumed=list(resumed_documents))
+
+    logger.info(
+        f"✅ run complete | docs={len(result['extracted'])} | flags={len(result['flags'])} | "
+        f"risk_score={result['risk_score']:.3f} | "
+        f"recommendation={result['recommendation']['decision']} | "
+        f"stage_timings_s={result.get('timings')}"
+    )
+
+def _run_stages(cfg: Config, pipeline, paths: List[str], out_path: Path, reused: List[str],
+                checkpoint: RunCheckpoint | None = None):
+    """DiligencePipeline.run, except that stages listed in `reused` take
+    their output from the previous run's files in out_path instead of being
+    recomputed, and documents/stages already in `checkpoint` aren't redone.
+    Returns (loaded documents, or None if extraction was reused and nothing
+    was loaded; paths of the documents resumed from the checkpoint;
+    pipeline result dict)."""
+    timings: dict = {}
+    run_start = time.perf_counter()
+    docs = None
+    resumed: List[str] = []
+
+    if "extract" in reused:
+        extracted = json.loads((out_path / "extracted.json").read_text(encoding="utf-8"))
+    else:
+        resumed = checkpoint.completed(paths) if checkpoint else []
+        to_load = [p for p in paths if p not in set(resumed)]
+        docs = _load_docs(cfg, to_load)
+
+        # extracted.jsonl gets each document as soon as it's verified (in
+        # completion order), for tailing a long run; extracted.json is
+        # written in input order once extraction is done.
+        out_path.mkdir(parents=True, exist_ok=True)
+        with (out_path / "extracted.jsonl").open("w", encoding="utf-8") as stream:
+            stream_lock = threading.Lock()
+
+            def emit(event):
+                if isinstance(event, DocumentVerified):
+                    with stream_lock:
+                        stream.write(json.dumps(event.document) + "\n")
+                        stream.flush()
+
+            for p in resumed:
+                emit(DocumentVerified(doc_name=Path(p).name, document=checkpoint.document(p), resumed=True))
+            fresh = dict(zip(to_load, pipeline.extract_documents(docs, timings, checkpoint=checkpoint, emit=emit,
+                                                                 paths=to_load)))
+        extracted = [fresh[p] if p in fresh else checkpoint.document(p) for p in paths]
+
+    rules_output = checkpoint.stage("rules") if checkpoint else None
+    if "rules" in reused:
+        flags = json.loads((out_path / "flags.json").read_text(encoding="utf-8"))
+        risk_score = RiskEngine.score_from_severities([f["severity"] for f in flags])
+    elif rules_output is not None:
+        flags, risk_score = rules_output["flags"], rules_output["risk_score"]
+    else:
+        flags, risk_score = pipeline.evaluate_risk(extracted, timings, risk_state_path=_risk_state_path(cfg, out_path))
+        if checkpoint:
+            checkpoint.save_stage("rules", {"flags": flags, "risk_score": risk_score})
+
+    recommendation = determine_recommendation(flags)
+
+    memo = checkpoint.stage("memo") if checkpoint else None
+    if "memo" in reused:
+        memo = (out_path / "ic_memo.md").read_text()
+    elif memo is None:
+        memo = pipeline.generate_memo(extracted, flags, recommendation, timings)
+        if checkpoint:
+            checkpoint.save_stage("memo", memo)
+
+    timings["total_s"] = round(time.perf_counter() - run_start, 3)
+
+    return docs, resumed, {
+        "extracted": extracted,
+        "flags": flags,
+        "risk_score": risk_score,
+        "recommendation": recommendation,
+        "ic_memo": memo,
+        "timings": timings,
+    }
+
+def _write_run_outputs(cfg: Config, out_path: Path, paths: List[str], docs, result: dict, avail: dict,
+                       keys: dict, reused: List[str] = (), resumed_documents: dict | None = None) -> None:
+    """Every `run` artifact except run_summary.json, skipping the outputs
+    of `reused` stages (already on disk), plus the audit and stage
+    manifests. docs=None means extraction was reused and nothing loaded.
+    resumed_documents (doc_name -> ingestion record) are the documents a
+    --resume run took from its checkpoint instead of loading."""
     out_path.mkdir(parents=True, exist_ok=True)
 
     (out_path / "config.json").write_text(json.dumps(cfg.dict(), indent=2))
@@ -90,29 +267,37 @@ def run(
         json.dumps([m.dict() for m in build_inputs_manifest(paths)], indent=2)
     )
 
-    (out_path / "extracted.json").write_text(
-        json.dumps(result["extracted"], indent=2)
-    )
+    if "extract" not in reused:
+        (out_path / "extracted.json").write_text(
+            json.dumps(result["extracted"], indent=2)
+        )
 
-    (out_path / "flags.json").write_text(
-        json.dumps(result["flags"], indent=2)
-    )
+    if "rules" not in reused:
+        (out_path / "flags.json").write_text(
+            json.dumps(result["flags"], indent=2)
+        )
 
-    (out_path / "ic_memo.md").write_text(result["ic_memo"])
+    if "memo" not in reused:
+        (out_path / "ic_memo.md").write_text(result["ic_memo"])
 
-    facts_df = to_facts_table(result["extracted"])
-    facts_df.to_csv(out_path / "facts_table.csv", index=False)
+    if "report" not in reused:
+        from ddgpt.render.pdf_report import render_ic_pdf
+        from ddgpt.report.tables import to_facts_table
 
-    if cfg.run.enable_pdf_output:
-        render_ic_pdf(
-            output_path=str(out_path / "ic_memo.pdf"),
-            memo=result["ic_memo"],
-            flags=result["flags"],
-            facts_df=facts_df,
-            risk_score=result["risk_score"],
-            extracted=result["extracted"],
-            recommendation=result["recommendation"]
-        )
+        facts_df = to_facts_table(result["extracted"])
+        facts_df.to_csv(out_path / "facts_table.csv", index=False)
+
+        if cfg.run.enable_pdf_output:
+            with _PDF_LOCK:
+                render_ic_pdf(
+                    output_path=str(out_path / "ic_memo.pdf"),
+                    memo=result["ic_memo"],
+                    flags=result["flags"],
+                    facts_df=facts_df,
+                    risk_score=result["risk_score"],
+                    extracted=result["extracted"],
+                    recommendation=result["recommendation"]
+                )
 
     output_names = ["config.json", "inputs.json", "extracted.json", "flags.json", "ic_memo.md", "facts_table.csv"]
     if cfg.run.enable_pdf_output:
@@ -124,9 +309,20 @@ def run(
         cfg=cfg,
         extractor_availability=avail,
         result=result,
+        documents=docs,
     )
+    if docs is None:
+        # Documents weren't loaded this run; their ingestion record is
+        # unchanged from the run that extracted them.
+        manifest["ingestion"] = _previous_audit_manifest(out_path).get("ingestion", {})
+    if resumed_documents is not None:
+        manifest["ingestion"] = {**resumed_documents, **manifest["ingestion"]}
+        manifest["resumed_documents"] = list(resumed_documents)
     (out_path / "audit_manifest.json").write_text(json.dumps(manifest, indent=2))
 
+    write_stage_manifest(out_path, keys)
+
+def _write_run_summary(out_path: Path, result: dict, avail: dict, **extra) -> None:
     # Lightweight, per-run observability record -- distinct from the audit
     # manifest (which is a reproducibility/compliance record with hashes and
     # git commit): this is meant to be cheap to parse and concatenate across
@@ -137,8 +333,9 @@ def run(
 
     run_summary = {
         "generated_at_utc": datetime.now(UTC).isoformat(),
-        "document_count": len(docs),
+        "document_count": len(result["extracted"]),
         "timings_s": result.get("timings"),
+        **extra,
         "extractor_availability": avail,
         "flags_by_severity": severity_counts,
         "risk_score": result["risk_score"],
@@ -147,11 +344,287 @@ def run(
     }
     (out_path / "run_summary.json").write_text(json.dumps(run_summary, indent=2))
 
+def _previous_audit_manifest(out_path: Path) -> dict:
+    path = out_path / "audit_manifest.json"
+    try:
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    except ValueError:
+        return {}
+
+@app.command()
+def watch(
+    input: str = typer.Option("sample_docs", "--input"),
+    out: str = typer.Option("outputs/watch", "--out"),
+    config: str = typer.Option(None, "--config"),
+    poll_interval: float = typer.Option(1.0, "--poll-interval", help="Seconds between directory scans."),
+    debounce: float = typer.Option(
+        2.0, "--debounce", help="Quiet period (s) after the last change before a burst of files is processed.",
+    ),
+):
+    """Watch --input and refresh extracted.json, flags.json and run_summary.json
+    in --out as documents arrive, change or are removed. Only new or modified
+    documents are loaded and extracted; the memo and PDF are left to `run`/`report`."""
+    load_dotenv()
+    cfg = _load_cfg(config)
+    logger = setup_logger(str(Path(out) / "run.log"))
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline, extractor_availability
+
+    extractors = build_extractors(cfg)
+    rules = build_rules(cfg)
+    chart_extractor = build_chart_extractor(cfg)
+    pipeline = build_pipeline(cfg, extractors, rules, chart_extractor=chart_extractor)
+
+    avail = extractor_availability(cfg)
+    for name, status in avail.items():
+        logger.info(f"extractor {name}: {status}")
+
+    out_path = Path(out)
+    out_path.mkdir(parents=True, exist_ok=True)
+    watcher = DirectoryWatcher(lambda: discover_files(input), debounce_s=debounce)
+    session = WatchSession(pipeline, lambda paths: _load_docs(cfg, paths), risk_state_path=_risk_state_path(cfg, out_path))
+
+    logger.info(f"watching {input} (poll={poll_interval}s, debounce={debounce}s); Ctrl+C to stop")
+    try:
+        while True:
+            batch = watcher.poll()
+            if batch is not None:
+                _refresh_watch_outputs(session, watcher, batch, out_path, avail, logger)
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        logger.info("watch stopped")
+
+def _refresh_watch_outputs(session: WatchSession, watcher: DirectoryWatcher, batch: WatchBatch,
+                           out_path: Path, avail: dict, logger) -> None:
+    try:
+        result = session.refresh(batch)
+    except Exception as e:
+        logger.error(f"watch refresh failed for {batch.changed}: {e!r}")
+        watcher.retry(batch.changed, batch.first_seen)
+        return
+
+    # A file that can't be loaded yet (e.g. still being copied in) is
+    # retried in a later batch; the rest of this one goes through now.
+    for path, error in result["failed"].items():
+        logger.error(f"watch: skipping {path} until it loads: {error}")
+    watcher.retry(list(result["failed"]), batch.first_seen)
+
+    extracted_count = len(batch.changed) - len(result["failed"])
+    (out_path / "extracted.json").write_text(json.dumps(result["extracted"], indent=2))
+    (out_path / "flags.json").write_text(json.dumps(result["flags"], indent=2))
+    _write_run_summary(
+        out_path, result, avail,
+        documents_extracted=extracted_count,
+        documents_failed=sorted(result["failed"]),
+        documents_removed=len(batch.removed),
+    )
+
     logger.info(
-        f"✅ run complete | docs={len(docs)} | flags={len(result['flags'])} | "
-        f"risk_score={result['risk_score']:.3f} | "
-        f"recommendation={result['recommendation']['decision']} | "
-        f"stage_timings_s={result.get('timings')}"
+        f"stage=watch_refresh extracted={extracted_count} failed={len(result['failed'])} "
+        f"removed={len(batch.removed)} docs={len(result['extracted'])} flags={len(result['flags'])} "
+        f"risk_score={result['risk_score']:.3f} arrival_to_flags_s={result['timings']['arrival_to_flags_s']:.3f}"
+    )
+
+@app.command()
+def serve(
+    config: str = typer.Option(None, "--config"),
+    host: str = typer.Option(None, "--host", help="Overrides serve.host."),
+    port: int = typer.Option(None, "--port", help="Overrides serve.port."),
+    workers: int = typer.Option(None, "--workers", help="Overrides serve.workers."),
+):
+    """Local HTTP job API backed by a pool of warm pipelines:
+    POST /jobs {"paths": [...]} or {"input_dir": "..."}, then GET /jobs/<id>,
+    /jobs/<id>/events (Server-Sent Events) and /jobs/<id>/artifacts/<name>."""
+    load_dotenv()
+    cfg = _load_cfg(config)
+    serve_cfg = cfg.serve.model_copy(update={
+        k: v for k, v in {"host": host, "port": port, "workers": workers}.items() if v is not None
+    })
+    logger = setup_logger(str(Path(serve_cfg.jobs_dir) / "serve.log"))
+    from ddgpt.pipeline.builders import extractor_availability
+
+    avail = extractor_availability(cfg)
+    for name, status in avail.items():
+        logger.info(f"extractor {name}: {status}")
+
+    manager = _build_job_manager(cfg, serve_cfg, avail)
+    server = make_server(manager, _resolve_job_paths, host=serve_cfg.host, port=serve_cfg.port)
+    logger.info(
+        f"serving on http://{server.server_address[0]}:{server.server_address[1]} "
+        f"workers={serve_cfg.workers} max_queued_jobs={serve_cfg.max_queued_jobs}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("server stopped")
+    finally:
+        server.server_close()
+        manager.shutdown()
+
+def _build_job_manager(cfg: Config, serve_cfg, avail: dict) -> JobManager:
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline
+
+    _configure_cache(cfg)
+
+    def pipeline_factory():
+        return build_pipeline(cfg, build_extractors(cfg), build_rules(cfg), chart_extractor=build_chart_extractor(cfg))
+
+    def run_job(pipeline, job, emit):
+        docs = _load_docs(cfg, job.paths)
+        emit("documents_loaded", documents=[d.doc_name for d in docs])
+
+        result = pipeline.run(docs, paths=job.paths)
+        out_path = job.out_dir
+        _write_run_outputs(cfg, out_path, job.paths, docs, result, avail, stage_keys(cfg, job.paths, avail))
+        _write_run_summary(out_path, result, avail)
+
+        return {
+            "flags": len(result["flags"]),
+            "risk_score": result["risk_score"],
+            "recommendation": result["recommendation"]["decision"],
+            "timings_s": result["timings"],
+        }
+
+    return JobManager(
+        pipeline_factory,
+        run_job,
+        Path(serve_cfg.jobs_dir),
+        workers=serve_cfg.workers,
+        max_queued_jobs=serve_cfg.max_queued_jobs,
+        max_finished_jobs=serve_cfg.max_finished_jobs,
+    )
+
+def _resolve_job_paths(request: dict) -> List[str]:
+    if request.get("input_dir"):
+        if not Path(request["input_dir"]).is_dir():
+            raise ValueError(f"input_dir not found: {request['input_dir']}")
+        paths = discover_files(request["input_dir"])
+    else:
+        paths = [str(p) for p in request.get("paths") or []]
+        for p in paths:
+            if Path(p).suffix.lower() not in (".pdf", ".txt") or not Path(p).is_file():
+                raise ValueError(f"not a .pdf/.txt file: {p}")
+    if not paths:
+        raise ValueError('expected a non-empty "paths" list or an "input_dir" containing .pdf/.txt files')
+    return paths
+
+@app.command()
+def batch(
+    manifest: str = typer.Option(..., "--manifest", help="JSON/YAML list of deals: name, input, out and optional config."),
+    out: str = typer.Option("outputs/batch", "--out", help="Where batch_summary.json and batch.log go."),
+    config: str = typer.Option(None, "--config", help="Config for deals that don't name their own."),
+    workers: int = typer.Option(None, "--workers", help="Overrides batch.workers."),
+):
+    """Run many deals in one process. Every deal's document loads,
+    extractions and rules/memo/report steps share one worker pool (and the
+    process-wide LLM limiters and caches), and each deal's --out gets the
+    same artifacts as `ddgpt run`."""
+    load_dotenv()
+    cfg = _load_cfg(config)
+    try:
+        deals = load_batch_manifest(manifest).deals
+    except (OSError, ValueError) as e:
+        raise typer.BadParameter(f"Invalid batch manifest {manifest}: {e}")
+    for deal in deals:
+        if not Path(deal.input).is_dir():
+            raise typer.BadParameter(f"Input directory for deal {deal.name} not found: {deal.input}")
+    out_path = Path(out)
+    logger = setup_logger(str(out_path / "batch.log"))
+
+    # The cache budgets and in-memory tier are process-wide, so they're set
+    # once, from the batch's --config, rather than by every load (a
+    # BEGIN IMMEDIATE write each time) with deals overwriting each other's.
+    _configure_cache(cfg)
+    # Likewise one loader process pool for every deal's documents: loads
+    # are CPU-bound and would otherwise contend for the GIL on the batch's
+    # threads.
+    load_pool = ProcessPoolExecutor(max_workers=cfg.run.load_workers) if cfg.run.load_workers > 1 else None
+
+    # Deals with identical configs share one pipeline (extractor clients,
+    # Ollama probe, rules); DiligencePipeline is safe to use concurrently.
+    pipelines: dict = {}
+    jobs = []
+    for deal in deals:
+        deal_cfg = _load_cfg(deal.config) if deal.config else cfg
+        ignored = [f for f in ("cache_budgets_mb", "memory_cache_mb", "load_workers")
+                   if getattr(deal_cfg.run, f) != getattr(cfg.run, f)]
+        if ignored:
+            logger.warning(f"deal {deal.name}: run.{', run.'.join(ignored)} from its config ignored; "
+                           f"the batch --config's values apply to every deal")
+        key = deal_cfg.model_dump_json()
+        if key not in pipelines:
+            pipelines[key] = _build_batch_pipeline(deal_cfg)
+        pipeline, avail = pipelines[key]
+        jobs.append(_deal_job(deal.name, deal_cfg, pipeline, avail, discover_files(deal.input), Path(deal.out),
+                              load_pool))
+
+    batch_workers = workers or cfg.batch.workers
+    logger.info(f"batch: {len(jobs)} deals, {sum(len(j.paths) for j in jobs)} documents, workers={batch_workers}, "
+                f"load_workers={cfg.run.load_workers}")
+    try:
+        summary = run_batch(jobs, workers=batch_workers)
+    finally:
+        if load_pool is not None:
+            load_pool.shutdown()
+
+    out_path.mkdir(parents=True, exist_ok=True)
+    summary = {"generated_at_utc": datetime.now(UTC).isoformat(), "manifest": manifest, **summary}
+    (out_path / "batch_summary.json").write_text(json.dumps(summary, indent=2))
+
+    for deal in summary["deals"]:
+        if deal["status"] == "failed":
+            logger.error(f"deal {deal['name']} failed: {deal['error']}")
+    logger.info(
+        f"✅ batch complete | deals={summary['deal_count']} failed={summary['failed']} | "
+        f"wall_s={summary['wall_s']:.3f} deal_wall_sum_s={summary['deal_wall_sum_s']:.3f}"
+    )
+    if summary["failed"]:
+        raise typer.Exit(code=1)
+
+def _build_batch_pipeline(cfg: Config):
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline, extractor_availability
+
+    pipeline = build_pipeline(cfg, build_extractors(cfg), build_rules(cfg), chart_extractor=build_chart_extractor(cfg))
+    return pipeline, extractor_availability(cfg)
+
+def _deal_job(name: str, cfg: Config, pipeline, avail: dict, paths: List[str], out_path: Path,
+              load_pool=None) -> DealJob:
+    """One deal of a batch as the same stages and artifacts as `ddgpt run`
+    into out_path, including the stage manifest, so a later
+    `run --incremental` there can reuse them. Documents are loaded on
+    load_pool, the batch's shared loader processes, when it has one; the
+    batch configures the cache."""
+
+    def finish(docs, extracted, timings):
+        flags, risk_score = pipeline.evaluate_risk(extracted, timings, risk_state_path=_risk_state_path(cfg, out_path))
+        recommendation = determine_recommendation(flags)
+        memo = pipeline.generate_memo(extracted, flags, recommendation, timings)
+        result = {
+            "extracted": extracted,
+            "flags": flags,
+            "risk_score": risk_score,
+            "recommendation": recommendation,
+            "ic_memo": memo,
+            "timings": timings,
+        }
+
+        t0 = time.perf_counter()
+        _write_run_outputs(cfg, out_path, paths, docs, result, avail, stage_keys(cfg, paths, avail))
+        timings["report_s"] = round(time.perf_counter() - t0, 3)
+        _write_run_summary(out_path, result, avail)
+
+        return {
+            "out": str(out_path),
+            "flags": len(flags),
+            "risk_score": risk_score,
+            "recommendation": recommendation["decision"],
+        }
+
+    return DealJob(
+        name,
+        paths,
+        load=lambda path: _load_docs(cfg, [path], pool=load_pool, configure_cache=False)[0],
+        extract=pipeline.extract_document,
+        finish=finish,
     )
 
 @app.command()
@@ -163,6 +636,7 @@ def extract(
     load_dotenv()
     cfg = _load_cfg(config)
     logger = setup_logger(str(Path(out) / "run.log"))
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline, extractor_availability
 
     extractors = build_extractors(cfg)
     rules = build_rules(cfg)
@@ -175,7 +649,9 @@ def extract(
 
     extracted = []
     for doc in docs:
-        extracted_doc = pipeline.extractor.extract(doc.doc_name, doc.pages, doc.tables, doc.layout, path=doc.path)
+        extracted_doc = pipeline.extractor.extract(
+            doc.doc_name, doc.pages, doc.tables, doc.layout, path=doc.path, chart_pages=doc.chart_candidate_pages()
+        )
         extracted.append(extracted_doc.dict())
 
     Path(out).mkdir(parents=True, exist_ok=True)
@@ -201,7 +677,7 @@ def flag(
     rules = build_rules(cfg)
     risk_engine = RiskEngine(rules)
 
-    flags, risk_score = risk_engine.evaluate(extracted)
+    flags, risk_score = risk_engine.evaluate(extracted, state_path=_risk_state_path(cfg, Path(out)))
 
     (Path(out) / "flags.json").write_text(
         json.dumps([f.dict() for f in flags], indent=2)
@@ -217,6 +693,9 @@ def report(
     load_dotenv()
     cfg = _load_cfg(config)
     logger = setup_logger(str(Path(out) / "run.log"))
+    from ddgpt.pipeline.builders import build_copilot
+    from ddgpt.render.pdf_report import render_ic_pdf
+    from ddgpt.report.tables import to_facts_table
     extracted = json.loads((Path(out)/"extracted.json").read_text(encoding="utf-8"))
     flags = json.loads((Path(out)/"flags.json").read_text(encoding="utf-8")) if (Path(out)/"flags.json").exists() else []
 
@@ -228,7 +707,7 @@ def report(
     risk_score = RiskEngine.score_from_severities([f["severity"] for f in flags])
 
     # IC copilot (falls back to a deterministic template if CO_API_KEY is unset)
-    copilot = ICCopilot()
+    copilot = build_copilot(cfg)
     memo = copilot.generate(extracted, flags, recommendation=recommendation)
 
     (Path(out) / "ic_memo.md").write_text(memo)
@@ -254,6 +733,7 @@ def eval(
     load_dotenv()
     cfg = Config()
     logger = setup_logger(str(Path(out) / "run.log"))
+    from ddgpt.pipeline.builders import build_chart_extractor, build_extractors, build_pipeline, extractor_availability
 
     extractors = build_extractors(cfg)
     rules = build_rules(cfg)
@@ -264,7 +744,7 @@ def eval(
     paths = discover_files(str(input_dir))
     docs = _load_docs(cfg, paths)
 
-    result = pipeline.run(docs)
+    result = pipeline.run(docs, paths=paths)
 
     Path(out).mkdir(parents=True, exist_ok=True)
 
@@ -286,5 +766,55 @@ def eval(
         else:
             logger.info(f"eval FAIL\nexpected={exp_pairs}\nactual={act_pairs}")
 
+def _fmt_mb(n) -> str:
+    return "-" if n is None else f"{n / (1024 * 1024):.1f}"
+
+@cache_app.command("stats")
+def cache_stats(
+    config: str = typer.Option(None, "--config"),
+    as_json: bool = typer.Option(False, "--json", help="Print raw per-namespace counters as JSON."),
+):
+    cfg = _load_cfg(config)
+    stats = get_store(cfg.run.cache_dir).stats()
+
+    if as_json:
+        typer.echo(json.dumps(stats, indent=2))
+        return
+
+    typer.echo(f"{'namespace':<20} {'entries':>8} {'stored_mb':>10} {'budget_mb':>10} "
+               f"{'hits':>7} {'misses':>7} {'hit_rate':>8} {'evictions':>9}")
+    for s in stats:
+        hit_rate = "-" if s["hit_rate"] is None else f"{s['hit_rate']:.1%}"
+        typer.echo(f"{s['namespace']:<20} {s['entries']:>8} {_fmt_mb(s['bytes_stored']):>10} "
+                   f"{_fmt_mb(s['budget_bytes']):>10} {s['hits']:>7} {s['misses']:>7} "
+                   f"{hit_rate:>8} {s['evictions']:>9}")
+
+@cache_app.command("prune")
+def cache_prune(
+    config: str = typer.Option(None, "--config"),
+    namespace: str = typer.Option(None, "--namespace", help="Only prune this namespace."),
+    clear: bool = typer.Option(False, "--clear", help="Drop every entry in --namespace instead of enforcing its budget."),
+):
+    cfg = _load_cfg(config)
+    store = get_store(cfg.run.cache_dir)
+
+    if clear:
+        if not namespace:
+            raise typer.BadParameter("--clear requires --namespace")
+        typer.echo(f"{namespace}: cleared {store.clear(namespace)} entries")
+        return
+
+    _configure_cache(cfg)
+    for ns, evicted in store.prune(namespace).items():
+        typer.echo(f"{ns}: evicted {evicted} entries")
+
+@cache_app.command("vacuum")
+def cache_vacuum(config: str = typer.Option(None, "--config")):
+    cfg = _load_cfg(config)
+    store = get_store(cfg.run.cache_dir)
+    before = store.path.stat().st_size
+    store.vacuum()
+    typer.echo(f"{store.path}: {_fmt_mb(before)} MB -> {_fmt_mb(store.path.stat().st_size)} MB")
+
 if __name__ == "__main__":
     app()
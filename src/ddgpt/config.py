@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 from pydantic import BaseModel, Field
-from typing import Dict
+from typing import Dict, Optional
 
 class ModelConfig(BaseModel):
     provider: str = "cohere"
     model: str = "command-a-03-2025"
     temperature: float = 0.0
+    # Chunks of one long document sent to Cohere concurrently (results are
+    # still merged in chunk order).
+    max_concurrent_chunks: int = 4
+    # Ceiling on Cohere requests in flight to this model across every
+    # document, chunk and memo call in the process. The actual limit adapts
+    # below it (AIMD, see ddgpt.utils.concurrency): halved on an error/429
+    # or a call slower than latency_target_s, grown back as calls recover.
+    max_in_flight: int = 8
+    latency_target_s: float = 60.0
 
 class OllamaConfig(BaseModel):
     # Second, independent LLM extractor backed by a local open-weight model.
@@ -17,6 +26,13 @@ class OllamaConfig(BaseModel):
     model: str = "llama3.2:3b"
     temperature: float = 0.0
     host: str = "http://localhost:11434"
+    # A single local server only decodes OLLAMA_NUM_PARALLEL requests at
+    # once; more in flight than that just queue on the server.
+    max_concurrent_chunks: int = 2
+    # Adaptive ceiling on requests in flight to this model on this server
+    # across every document (same AIMD behaviour as model.max_in_flight).
+    max_in_flight: int = 2
+    latency_target_s: float = 120.0
 
 class VisionConfig(BaseModel):
     # Chart/graph extraction from page images -- a genuinely different,
@@ -40,6 +56,11 @@ class VisionConfig(BaseModel):
     # Safety cap: a 150-page LPA shouldn't silently trigger 150 vision calls
     # the first time someone flips this flag on.
     max_pages: int = 20
+    # Pages of one document sent to the vision model concurrently, and the
+    # adaptive ceiling on vision calls across all documents.
+    max_concurrent_pages: int = 2
+    max_in_flight: int = 2
+    latency_target_s: float = 180.0
     prompt: str = "chart_extract_v1.txt"
 
 class RuleConfig(BaseModel):
@@ -57,6 +78,19 @@ class RuleConfig(BaseModel):
 class OCRConfig(BaseModel):
     enabled: bool = True
     dpi: int = 300
+    # Scanned pages within one document OCR'd in parallel across a process
+    # pool. Each OCR'd page is also cached on disk (run.cache_dir, when
+    # run.enable_disk_cache is on), keyed on its rendered pixels + dpi.
+    # Only applies to documents loaded in-process: with run.load_workers > 1
+    # (or in a batch with a loader pool) each loader process OCRs serially,
+    # so parallelism is load_workers processes, not load_workers x workers.
+    workers: int = 1
+
+class TableConfig(BaseModel):
+    # Run Camelot/pdfplumber only on pages whose text looks tabular (numeric
+    # density, %/$/x values, AUM/IRR/TVPI labels) instead of every page.
+    # Skipped pages are recorded per document in audit_manifest.json.
+    page_screening: bool = True
 
 class TrustConfig(BaseModel):
     """Extractor trust priors and document-authority weights. Previously
@@ -90,6 +124,49 @@ class RunConfig(BaseModel):
     cache_dir: str = ".cache"
     enable_disk_cache: bool = True
 
+    # Per-namespace size budget (MB) for the disk cache; least-recently-read
+    # entries are evicted past it. Namespaces not listed are unbounded.
+    cache_budgets_mb: Dict[str, float] = Field(default_factory=lambda: {
+        "loaded_documents": 2048,
+        "ocr_pages": 1024,
+        "extractions": 512,
+        "chart_extractions": 256,
+    })
+
+    # In-process LRU tier in front of the disk cache (MB of pickled size):
+    # repeated runs over the same data room inside one long-lived process
+    # (Streamlit, batch) skip SQLite and unpickling entirely. 0 disables it.
+    memory_cache_mb: float = 256
+
+    # Documents loaded in parallel across a process pool (PDF parsing, OCR
+    # and table extraction are CPU-bound). 1 keeps the original serial,
+    # in-process loading. Loader processes don't start OCR pools of their
+    # own (see ocr.workers).
+    load_workers: int = 1
+
+    # Run the extractor ensemble (Cohere, Ollama, regex) and chart
+    # extraction for a document concurrently rather than one after another.
+    concurrent_extractors: bool = False
+
+    # Documents extracted + verified in parallel by DiligencePipeline.run.
+    # Provider calls stay bounded by model.max_in_flight/ollama.max_in_flight
+    # however many documents are in flight.
+    document_workers: int = 1
+
+    # Estimated-token budget per document for Cohere/Ollama extraction. When
+    # set, pages are scored by financial-signal density (performance/terms/
+    # fees sections, IRR mentions, field labels) and only the top pages that
+    # fit are sent; the rest are listed as skipped in extracted.json and
+    # audit_manifest.json. None sends every page.
+    llm_page_token_budget: Optional[int] = None
+
+    # Keep per-pair and per-document rule results in <out>/risk_state.json
+    # and, on the next run into the same directory, only re-evaluate rules
+    # for documents that were added or changed. Flags and risk score are
+    # identical to a full evaluation; changed rule parameters invalidate
+    # the stored results.
+    incremental_risk: bool = True
+
     prompts_dir: str = "prompts"
 
     extract_prompt: str = "extract_v1.txt"
@@ -108,6 +185,30 @@ class RunConfig(BaseModel):
     # leaves the machine at all regardless of this flag.
     redact_before_llm: bool = False
 
+class ServeConfig(BaseModel):
+    # `ddgpt serve`: local HTTP job API. Binds to loopback by default --
+    # jobs name files on this machine's disk, so it isn't meant to be
+    # exposed beyond it.
+    host: str = "127.0.0.1"
+    port: int = 8765
+    # Warm DiligencePipeline workers, each running one job at a time.
+    workers: int = 2
+    # Jobs waiting for a worker; submissions past this get HTTP 503.
+    max_queued_jobs: int = 16
+    # Finished jobs whose status stays queryable; older ones are dropped
+    # from memory (GET /jobs/<id> then returns 404) but their artifacts
+    # are left in jobs_dir.
+    max_finished_jobs: int = 256
+    # Each job's artifacts land in <jobs_dir>/<job_id>/.
+    jobs_dir: str = "outputs/jobs"
+
+class BatchConfig(BaseModel):
+    # `ddgpt batch`: threads shared by every deal's load, extraction and
+    # report tasks. LLM calls stay bounded by the providers' max_in_flight
+    # however large this is; the extra threads keep loading and reporting
+    # other deals while some wait on the model.
+    workers: int = 4
+
 class Config(BaseModel):
     model: ModelConfig = Field(default_factory=ModelConfig)
 
@@ -119,6 +220,12 @@ class Config(BaseModel):
 
     ocr: OCRConfig = Field(default_factory=OCRConfig)
 
+    tables: TableConfig = Field(default_factory=TableConfig)
+
     trust: TrustConfig = Field(default_factory=TrustConfig)
 
     run: RunConfig = Field(default_factory=RunConfig)
+
+    serve: ServeConfig = Field(default_factory=ServeConfig)
+
+    batch: BatchConfig = Field(default_factory=BatchConfig)
@@ -5,13 +5,17 @@ import time
 import cohere
 
 from ddgpt.report.ic_memo import generate_ic_summary
+from ddgpt.utils.concurrency import limited, provider_limiter
 
 logger = logging.getLogger("ddgpt")
 
 
 class ICCopilot:
-    def __init__(self, model="command-a-03-2025"):
+    def __init__(self, model="command-a-03-2025", max_in_flight=None, latency_target_s=None):
         self.model = model
+        # Same limiter key as CohereExtractor on this model, so memo calls
+        # share its adaptive concurrency window.
+        self.limiter = provider_limiter(f"cohere:{model}", max_in_flight, latency_target_s)
 
         api_key = os.getenv("CO_API_KEY")
 
@@ -63,11 +67,12 @@ for an institutional IC memo.
 
         call_start = time.perf_counter()
         try:
-            resp = self.client.chat(
-                model=self.model,
-                message=prompt,
-                temperature=0.2
-            )
+            with limited(self.limiter):
+                resp = self.client.chat(
+                    model=self.model,
+                    message=prompt,
+                    temperature=0.2
+                )
         except Exception as e:
             latency = time.perf_counter() - call_start
             logger.error(
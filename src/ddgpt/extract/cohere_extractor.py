@@ -3,15 +3,17 @@ import json
 import logging
 import os
 import time
-from typing import List
+from typing import List, Optional
 
 from ddgpt.io.loaders import Page
 from ddgpt.extract.base import Extractor
 from ddgpt.extract.schemas import ExtractedDoc
 from ddgpt.utils.json_parser import safe_parse_json
+from ddgpt.utils.concurrency import backoff_delay, limited, provider_limiter
 from ddgpt.extract.regex_extractor import RegexExtractor
 from ddgpt.extract.llm_common import (
     chunk_pages,
+    extract_chunks,
     build_schema_hint,
     sanitize_extraction,
     merge_chunk_docs,
@@ -39,7 +41,8 @@ class CohereExtractor(Extractor):
     # cfg.run.redact_before_llm is enabled (see ddgpt.utils.redaction).
     IS_LLM_BACKED = True
 
-    def __init__(self, model: str, temperature: float, prompt_text: str):
+    def __init__(self, model: str, temperature: float, prompt_text: str, max_concurrency: int = 1,
+                 max_in_flight: Optional[int] = None, latency_target_s: Optional[float] = None):
         if cohere is None:
             raise RuntimeError("cohere not installed. pip install -r requirements.txt")
         api_key = os.getenv("CO_API_KEY")
@@ -49,6 +52,12 @@ class CohereExtractor(Extractor):
         self.model = model
         self.temperature = temperature
         self.prompt_text = prompt_text
+        # Chunk requests in flight at once for one long document.
+        self.max_concurrency = max_concurrency
+        # Adaptive cap on requests in flight to this model across *all*
+        # documents and chunks in the process (see ddgpt.utils.concurrency);
+        # max_in_flight=None means unlimited.
+        self.limiter = provider_limiter(f"cohere:{model}", max_in_flight, latency_target_s)
 
     def extract(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
         chunks = chunk_pages(pages, MAX_CHARS_PER_CALL)
@@ -56,7 +65,7 @@ class CohereExtractor(Extractor):
         if len(chunks) == 1:
             return self._extract_chunk(doc_name, chunks[0])
 
-        chunk_docs = [self._extract_chunk(doc_name, chunk) for chunk in chunks]
+        chunk_docs = extract_chunks(self._extract_chunk, doc_name, chunks, self.max_concurrency)
         return merge_chunk_docs(doc_name, chunk_docs, source_label="Cohere")
 
     def _extract_chunk(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
@@ -76,9 +85,10 @@ DOCUMENT:
         for attempt in range(RETRY_ATTEMPTS):
             call_start = time.perf_counter()
             try:
-                resp = self.client.chat(model=self.model,
-                                        message=msg,
-                                        temperature=self.temperature)
+                with limited(self.limiter):
+                    resp = self.client.chat(model=self.model,
+                                            message=msg,
+                                            temperature=self.temperature)
                 latency = time.perf_counter() - call_start
                 logger.info(
                     f"llm_call provider=cohere model={self.model} doc={doc_name} "
@@ -103,7 +113,7 @@ DOCUMENT:
                 )
 
                 if attempt < RETRY_ATTEMPTS - 1:
-                    time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                    time.sleep(backoff_delay(RETRY_BACKOFF_SECONDS, attempt))
 
         logger.error(
             f"llm_call provider=cohere model={self.model} doc={doc_name} "
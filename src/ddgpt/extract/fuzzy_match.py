@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import bisect
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+# Character n-gram length for the page index. Any common block at least
+# this long is found through the index; shorter ones (only ever left
+# between longer blocks, or on a page sharing nothing longer with the
+# snippet) are found with str.find.
+NGRAM = 4
+
+# Documented tolerance against the previous implementation, difflib's
+# SequenceMatcher of the snippet against the whole page, in either
+# direction: none. PageMatcher computes the same matching blocks -- the
+# same greedy longest-match recursion with the same tie-breaks -- so
+# |new - old| is 0 for every snippet and no verification verdict changes.
+# benchmarks/bench_fuzzy_match.py checks this on every run.
+RATIO_TOLERANCE = 0.0
+
+
+class PageMatcher:
+    """Approximate-substring matcher over one page of (normalized) text.
+
+    The page is indexed once by character n-gram. Scoring a snippet then
+    replays difflib.SequenceMatcher's matching-blocks recursion (longest
+    common block, then recurse either side of it), but finds each longest
+    block from the index postings of the snippet's n-grams instead of
+    scanning the page range character by character -- which is what makes
+    whole-page difflib close to quadratic in page length, repeated for
+    every snippet cited on the page. The index is only built once a
+    snippet isn't an exact substring, so verbatim evidence never pays for
+    it."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._index: Optional[Dict[str, List[int]]] = None
+
+    def _ngram_index(self) -> Dict[str, List[int]]:
+        if self._index is None:
+            index: Dict[str, List[int]] = defaultdict(list)
+            text = self.text
+            for i in range(len(text) - NGRAM + 1):
+                index[text[i:i + NGRAM]].append(i)
+            self._index = dict(index)
+        return self._index
+
+    def ratio(self, snippet: str) -> float:
+        """Fraction of snippet's characters coverable by in-order matching
+        blocks against the page; 1.0 for an exact substring, 0.0 for an
+        empty snippet. Identical to the old whole-page difflib ratio (see
+        RATIO_TOLERANCE)."""
+        if not snippet:
+            return 0.0
+        if snippet in self.text:
+            return 1.0
+
+        matched = 0
+        ranges = [(0, len(self.text), 0, len(snippet))]
+        while ranges:
+            alo, ahi, blo, bhi = ranges.pop()
+            i, j, k = self._longest_match(snippet, alo, ahi, blo, bhi)
+            if k:
+                matched += k
+                if alo < i and blo < j:
+                    ranges.append((alo, i, blo, j))
+                if i + k < ahi and j + k < bhi:
+                    ranges.append((i + k, ahi, j + k, bhi))
+        return matched / len(snippet)
+
+    def _longest_match(self, snippet: str, alo: int, ahi: int, blo: int, bhi: int) -> Tuple[int, int, int]:
+        """SequenceMatcher.find_longest_match(alo, ahi, blo, bhi) with the
+        page as `a` and no junk: the longest block text[i:i+k] ==
+        snippet[j:j+k] inside the ranges, earliest i then earliest j on
+        ties; (alo, blo, 0) if there is none."""
+        text = self.text
+        best_i, best_j, best_k = alo, blo, 0
+
+        if bhi - blo >= NGRAM and ahi - alo >= NGRAM:
+            index = self._ngram_index()
+            for j in range(blo, bhi - NGRAM + 1):
+                postings = index.get(snippet[j:j + NGRAM])
+                if not postings:
+                    continue
+                lo = bisect.bisect_left(postings, alo)
+                hi = bisect.bisect_right(postings, ahi - NGRAM)
+                for p in range(lo, hi):
+                    i = postings[p]
+                    if i > alo and j > blo and text[i - 1] == snippet[j - 1]:
+                        continue  # inside a block starting further left
+                    limit = min(ahi - i, bhi - j)
+                    if limit < best_k:
+                        continue
+                    k = NGRAM
+                    while k < limit and text[i + k] == snippet[j + k]:
+                        k += 1
+                    if k > best_k or (k == best_k and (i, j) < (best_i, best_j)):
+                        best_i, best_j, best_k = i, j, k
+            if best_k:
+                return best_i, best_j, best_k
+
+        # Nothing as long as an n-gram: try each shorter length, longest
+        # first, taking the earliest page position.
+        for size in range(min(NGRAM - 1, bhi - blo, ahi - alo), 0, -1):
+            found = None
+            for j in range(blo, bhi - size + 1):
+                i = text.find(snippet[j:j + size], alo, ahi)
+                if i >= 0 and (found is None or i < found[0]):
+                    found = (i, j)
+            if found:
+                return found[0], found[1], size
+        return best_i, best_j, best_k
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
 
 from ddgpt.io.loaders import Page
 from ddgpt.extract.schemas import ExtractedDoc
@@ -29,6 +30,22 @@ def chunk_pages(pages: List[Page], max_chars: int) -> List[List[Page]]:
     return chunks or [pages]
 
 
+def extract_chunks(
+    extract_chunk: Callable[[str, List[Page]], ExtractedDoc],
+    doc_name: str,
+    chunks: List[List[Page]],
+    max_concurrency: int = 1,
+) -> List[ExtractedDoc]:
+    """Run extract_chunk over every chunk, up to max_concurrency requests in
+    flight at once. Results always come back in chunk order (not completion
+    order), so merge_chunk_docs' tie-breaking stays deterministic."""
+    if max_concurrency <= 1 or len(chunks) <= 1:
+        return [extract_chunk(doc_name, chunk) for chunk in chunks]
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as pool:
+        return list(pool.map(lambda chunk: extract_chunk(doc_name, chunk), chunks))
+
+
 def build_schema_hint(doc_name: str) -> dict:
     return {
         "doc_name": doc_name,
@@ -1,15 +1,16 @@
 from __future__ import annotations
+import asyncio
 import json
 import logging
 import time
-from typing import List
-
-import requests
+from typing import List, Optional
 
 from ddgpt.io.loaders import Page
 from ddgpt.extract.base import Extractor
 from ddgpt.extract.schemas import ExtractedDoc
 from ddgpt.utils.json_parser import safe_parse_json
+from ddgpt.utils.concurrency import backoff_delay, limited_async, provider_limiter
+from ddgpt.extract import transport
 from ddgpt.extract.regex_extractor import RegexExtractor
 from ddgpt.extract.llm_common import (
     chunk_pages,
@@ -35,9 +36,9 @@ def ollama_is_available(host: str = DEFAULT_OLLAMA_HOST, timeout: float = 1.0) -
     (like CohereExtractor skips itself when CO_API_KEY is unset) rather than
     fail per-document once the pipeline is already running."""
     try:
-        resp = requests.get(f"{host}/api/version", timeout=timeout)
-        return resp.status_code == 200
-    except requests.RequestException:
+        transport.get_json(host, "/api/version", call_type="probe", timeout=timeout)
+        return True
+    except transport.TransportError:
         return False
 
 
@@ -49,22 +50,42 @@ class OllamaExtractor(Extractor):
     same underlying model.
     """
 
-    def __init__(self, model: str, temperature: float, prompt_text: str, host: str = DEFAULT_OLLAMA_HOST):
+    def __init__(self, model: str, temperature: float, prompt_text: str, host: str = DEFAULT_OLLAMA_HOST,
+                 max_concurrency: int = 1, max_in_flight: Optional[int] = None,
+                 latency_target_s: Optional[float] = None):
         self.model = model
         self.temperature = temperature
         self.prompt_text = prompt_text
         self.host = host
+        # Chunk requests in flight at once for one long document -- keep it
+        # at or below the server's OLLAMA_NUM_PARALLEL, or the extra requests
+        # just queue server-side.
+        self.max_concurrency = max_concurrency
+        # Adaptive cap on requests in flight to this model on this server,
+        # across all documents; max_in_flight=None means unlimited.
+        self.limiter = provider_limiter(f"ollama:{host}:{model}", max_in_flight, latency_target_s)
 
     def extract(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
+        return transport.run_sync(self.extract_async(doc_name, pages))
+
+    async def extract_async(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
         chunks = chunk_pages(pages, MAX_CHARS_PER_CALL)
 
         if len(chunks) == 1:
-            return self._extract_chunk(doc_name, chunks[0])
+            return await self._extract_chunk(doc_name, chunks[0])
+
+        # Chunks fan out as coroutines on the shared transport loop -- no
+        # thread per request -- and gather keeps them in chunk order.
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
 
-        chunk_docs = [self._extract_chunk(doc_name, chunk) for chunk in chunks]
-        return merge_chunk_docs(doc_name, chunk_docs, source_label="Ollama")
+        async def bounded(chunk):
+            async with semaphore:
+                return await self._extract_chunk(doc_name, chunk)
 
-    def _extract_chunk(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
+        chunk_docs = await asyncio.gather(*(bounded(chunk) for chunk in chunks))
+        return merge_chunk_docs(doc_name, list(chunk_docs), source_label="Ollama")
+
+    async def _extract_chunk(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
         pages_block = "\n\n".join([f"--- PAGE {p.page_num} ---\n{p.text}" for p in pages])
 
         prompt = f"""{self.prompt_text}
@@ -81,25 +102,26 @@ DOCUMENT:
         for attempt in range(RETRY_ATTEMPTS):
             call_start = time.perf_counter()
             try:
-                resp = requests.post(
-                    f"{self.host}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "options": {"temperature": self.temperature},
-                        "format": "json",
-                        "stream": False,
-                    },
-                    timeout=180,
-                )
-                resp.raise_for_status()
+                async with limited_async(self.limiter):
+                    body = await transport.post_json_async(
+                        self.host,
+                        "/api/generate",
+                        {
+                            "model": self.model,
+                            "prompt": prompt,
+                            "options": {"temperature": self.temperature},
+                            "format": "json",
+                            "stream": False,
+                        },
+                        call_type="generate",
+                    )
                 latency = time.perf_counter() - call_start
                 logger.info(
                     f"llm_call provider=ollama model={self.model} doc={doc_name} "
                     f"attempt={attempt + 1} status=ok latency_s={latency:.3f}"
                 )
 
-                text = resp.json()["response"].strip()
+                text = body["response"].strip()
 
                 data = safe_parse_json(text)
                 data = sanitize_extraction(data)
@@ -118,7 +140,7 @@ DOCUMENT:
                 )
 
                 if attempt < RETRY_ATTEMPTS - 1:
-                    time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                    await asyncio.sleep(backoff_delay(RETRY_BACKOFF_SECONDS, attempt))
 
         logger.error(
             f"llm_call provider=ollama model={self.model} doc={doc_name} "
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ddgpt.io.loaders import Page
+from ddgpt.layout.irr_mentions import find_irr_mentions
+from ddgpt.layout.models import DocumentLayout
+from ddgpt.layout.section_parser import CANONICAL_PATTERNS, HEADING_MAX_WORDS
+from ddgpt.extract.regex_extractor import FIELD_LABEL_RE
+
+# Sections whose pages carry the fields we extract. Risk factors and
+# definitions are deliberately absent: they are most of a long LPA's tokens
+# and almost none of its numbers.
+SECTION_WEIGHTS = {
+    "performance_summary": 5.0,
+    "terms": 4.0,
+    "fees_and_expenses": 4.0,
+}
+HEADING_WEIGHT = 2.0
+IRR_MENTION_WEIGHT = 3.0
+LABEL_WEIGHT = 1.0
+
+# Rough chars-per-token for budgeting; only needs to be the right order of
+# magnitude, not tokenizer-exact.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+def score_pages(pages: Iterable[Page], layout: Optional[DocumentLayout] = None) -> Dict[int, float]:
+    """Financial-signal score per page: being inside a performance/terms/
+    fees section (DocumentLayout), carrying one of those headings itself
+    (CANONICAL_PATTERNS, for text docs without font metadata), IRR mentions
+    (find_irr_mentions) and regex-extractor field labels."""
+    scores = {p.page_num: 0.0 for p in pages}
+
+    if layout is not None:
+        for canonical_type, weight in SECTION_WEIGHTS.items():
+            for section in layout.sections_of_type(canonical_type):
+                for page_num in range(section.page_start, section.page_end + 1):
+                    if page_num in scores:
+                        scores[page_num] += weight
+
+    for page in pages:
+        for line in (page.text or "").splitlines():
+            if len(line.split()) > HEADING_MAX_WORDS:
+                continue
+            for canonical_type, pattern in CANONICAL_PATTERNS:
+                if canonical_type in SECTION_WEIGHTS and pattern.search(line):
+                    scores[page.page_num] += HEADING_WEIGHT
+                    break
+
+        scores[page.page_num] += LABEL_WEIGHT * len(FIELD_LABEL_RE.findall(page.text or ""))
+
+    for mention in find_irr_mentions(pages):
+        scores[mention["page"]] += IRR_MENTION_WEIGHT
+
+    return scores
+
+
+def select_pages(
+    pages: Iterable[Page],
+    layout: Optional[DocumentLayout],
+    token_budget: int,
+) -> Tuple[List[int], dict]:
+    """Highest-scoring pages that fit in token_budget, returned in document
+    order, plus an audit record of what was sent and skipped. Pages with no
+    signal at all only fill whatever budget is left over; the single best
+    page is always sent, even if it alone exceeds the budget."""
+    scores = score_pages(pages, layout)
+    tokens = {p.page_num: estimate_tokens(p.text) for p in pages}
+
+    # Stable on ties: earlier pages first.
+    ranked = sorted(pages, key=lambda p: (-scores[p.page_num], p.page_num))
+
+    sent = []
+    used = 0
+    for page in ranked:
+        cost = tokens[page.page_num]
+        if sent and used + cost > token_budget:
+            continue
+        sent.append(page.page_num)
+        used += cost
+
+    sent_set = set(sent)
+    record = {
+        "token_budget": token_budget,
+        "estimated_tokens_sent": used,
+        "pages_sent": sorted(sent_set),
+        "pages_skipped": [p.page_num for p in pages if p.page_num not in sent_set],
+        "page_scores": {str(n): round(s, 2) for n, s in scores.items()},
+    }
+    return sorted(sent_set), record
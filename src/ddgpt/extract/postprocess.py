@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import re
-import difflib
-from typing import List
+from typing import Dict, List
 from datetime import datetime, UTC
 
 from ddgpt.io.loaders import Page
+from ddgpt.io.page_index import PageIndex, normalize
 from ddgpt.extract.schemas import ExtractedDoc
+from ddgpt.extract.fuzzy_match import PageMatcher
 from ddgpt.pipeline.scoring import final_confidence
 
 # A snippet scoring at or above this on the fuzzy match is treated as "found,
@@ -47,34 +47,28 @@ def temporal_weight(doc_date: str | None) -> float:
     except Exception:
         return 0.50
 
-def normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip().lower()
-
-def get_page_text(pages: List[Page], page_num: int | None) -> str:
-    if page_num is None:
-        return ""
-
-    for p in pages:
-        if p.page_num == page_num:
-            return p.text or ""
-
-    return ""
+def get_page_text(pages: List[Page] | PageIndex, page_num: int | None) -> str:
+    return PageIndex.of(pages).text(page_num)
 
 def fuzzy_match_ratio(snippet: str, page_text: str) -> float:
     """Fraction of snippet's characters coverable by matching blocks against
     page_text, in order. 1.0 for an exact substring; degrades gracefully for
     OCR substitutions, hyphenation breaks, or ligature differences instead of
-    an all-or-nothing verbatim check."""
-    if not snippet:
-        return 0.0
-    if snippet in page_text:
-        return 1.0
+    an all-or-nothing verbatim check.
+
+    Scoring several snippets against one page? Build a PageMatcher once and
+    call .ratio() instead -- this indexes page_text on every call."""
+    return PageMatcher(page_text).ratio(snippet)
 
-    matcher = difflib.SequenceMatcher(None, page_text, snippet, autojunk=False)
-    matched_chars = sum(block.size for block in matcher.get_matching_blocks())
-    return matched_chars / len(snippet)
+def page_matcher(index: PageIndex, page_num: int | None, matchers: Dict[int | None, PageMatcher]) -> PageMatcher:
+    """Matcher over a cited page's normalized text, built on first use and
+    shared by every metric citing the same page."""
+    matcher = matchers.get(page_num)
+    if matcher is None:
+        matcher = matchers[page_num] = PageMatcher(index.normalized_text(page_num))
+    return matcher
 
-def verify_metric(metric, key: str, pages, authority, recency, notes, missing_fields):
+def verify_metric(metric, key: str, pages, authority, recency, notes, missing_fields, matchers=None):
     if metric.value is None:
         if f"{key}.value" not in missing_fields:
             missing_fields.append(f"{key}.value")
@@ -84,7 +78,6 @@ def verify_metric(metric, key: str, pages, authority, recency, notes, missing_fi
     extraction_conf = metric.confidence
 
     snippet = normalize(metric.evidence.snippet)
-    page_text = normalize(get_page_text(pages, metric.evidence.page))
 
     evidence_score = 1.0
 
@@ -93,7 +86,8 @@ def verify_metric(metric, key: str, pages, authority, recency, notes, missing_fi
         notes.append(f"{key}: missing evidence snippet")
 
     else:
-        match_ratio = fuzzy_match_ratio(snippet, page_text)
+        matchers = {} if matchers is None else matchers
+        match_ratio = page_matcher(PageIndex.of(pages), metric.evidence.page, matchers).ratio(snippet)
 
         if match_ratio >= 1.0:
             pass  # exact verbatim match
@@ -120,12 +114,17 @@ def verify_metric(metric, key: str, pages, authority, recency, notes, missing_fi
 
 def verify_and_score(
     doc: ExtractedDoc,
-    pages: List[Page],
+    pages: List[Page] | PageIndex,
     authority_weights: dict | None = None,
     authority_default_weight: float = 0.50,
 ) -> ExtractedDoc:
     authority = authority_weight(doc.doc_name, authority_weights, authority_default_weight)
     recency = temporal_weight(doc.doc_date)
+    # One page lookup index per document (reused if the caller already built
+    # one); metrics often cite the same page, so its normalized text and
+    # n-gram matcher are built once too.
+    pages = PageIndex.of(pages)
+    matchers: Dict[int | None, PageMatcher] = {}
 
     verify_metric(
         doc.aum,
@@ -134,7 +133,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     verify_metric(
@@ -144,7 +144,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     verify_metric(
@@ -154,7 +155,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     verify_metric(
@@ -164,7 +166,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     verify_metric(
@@ -174,7 +177,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     verify_metric(
@@ -184,7 +188,8 @@ def verify_and_score(
         authority,
         recency,
         doc.notes,
-        doc.missing_fields
+        doc.missing_fields,
+        matchers
     )
 
     return doc
@@ -1,7 +1,7 @@
 \
 from __future__ import annotations
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from ddgpt.io.loaders import Page
 from ddgpt.extract.base import Extractor
@@ -10,19 +10,114 @@ from ddgpt.provenance.evidence import Evidence
 
 GAP = r"[\s\S]{0,80}?"
 
-def _find_in_pages(pages: List[Page], pattern: str) -> Tuple[Optional[str], Optional[int], str]:
-    rgx = re.compile(pattern, flags=re.IGNORECASE)
-    for pg in pages:
-        m = rgx.search(pg.text)
-        if m:
-            start = max(0, m.start() - 50)
-            end = min(len(pg.text), m.end() + 50)
-            snippet = re.sub(r"\s+", " ", pg.text[start:end]).strip()
-            words = snippet.split()
-            snippet = " ".join(words[:20])
-            return m.group(1), pg.page_num, snippet
+# Every label the field patterns below anchor on. Also used to score pages
+# by financial-signal density before LLM extraction (see page_selection).
+FIELD_LABEL_RE = re.compile(
+    r"As-of Date|Effective Date|\bAUM\b|Assets Under Management|Net IRR|TVPI|Target IRR|"
+    r"Management Fee|Carry:|carried interest|preferred|hurdle",
+    re.IGNORECASE,
+)
+
+
+class _Anchored:
+    """A field pattern that always starts with a literal label (its anchor).
+    A match can only start where the anchor occurs, so instead of search()
+    rescanning every page from the top, the pattern is match()ed only at the
+    anchor offsets found by the page's prefilter pass -- and the lazy GAP
+    only ever runs from a real label."""
+
+    def __init__(self, anchor: str, tail: str):
+        self.anchor = anchor
+        self.needle = anchor.lower()
+        self.regex = re.compile(re.escape(anchor) + tail, re.IGNORECASE)
+
+
+# (primary, fallback) per field: the fallback is only tried if the primary
+# matches nowhere in the document -- the same priority as always.
+DOC_DATE = (_Anchored("As-of Date:", r"\s*([0-9]{4}-[0-9]{2}-[0-9]{2})"),
+            _Anchored("Effective Date:", r"\s*([0-9]{4}-[0-9]{2}-[0-9]{2})"))
+AUM = (_Anchored("AUM)", rf"{GAP}\$([0-9]+\.[0-9]+)B"),
+       _Anchored("Assets Under Management", rf"{GAP}\$([0-9]+\.[0-9]+)B"))
+NET_IRR = (_Anchored("Net IRR", rf"{GAP}:\s*([0-9]+\.[0-9]+)%"),
+           _Anchored("Net IRR", rf"{GAP}([0-9]+\.[0-9]+)%"))
+TVPI = (_Anchored("TVPI", rf"{GAP}:\s*([0-9]+\.[0-9]+)x"),
+        _Anchored("TVPI", rf"{GAP}([0-9]+\.[0-9]+)x"))
+TARGET_IRR = (_Anchored("Target IRR", rf"{GAP}:\s*([0-9]+)%"),
+              _Anchored("Target IRR", rf"{GAP}([0-9]+)%"))
+MGMT_FEE = (_Anchored("Management Fee", rf"{GAP}:\s*([0-9]+\.[0-9]+)%"),
+            _Anchored("Management Fee", rf"{GAP}([0-9]+\.[0-9]+)%"))
+CARRY = (_Anchored("Carry:", r"\s*([0-9]+)%"),
+         _Anchored("carried interest", rf"{GAP}([0-9]+)%"))
+HURDLE = (_Anchored("over an", r"\s*([0-9]+)%\s*preferred"),
+          _Anchored("hurdle", rf"{GAP}([0-9]+)%"))
+
+_FIELDS = (DOC_DATE, AUM, NET_IRR, TVPI, TARGET_IRR, MGMT_FEE, CARRY, HURDLE)
+_NEEDLES = tuple(dict.fromkeys(p.needle for field in _FIELDS for p in field))
+
+# Non-ASCII characters re.IGNORECASE treats as equal to an ASCII letter,
+# mapped to that letter. After this, str.lower() is length-preserving and
+# finds every offset a case-insensitive regex would, so prefilter offsets
+# index straight into the original text.
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _scan_page(text: str) -> Dict[str, List[int]]:
+    """One pass over the page's lowercased text: needle -> ascending offsets
+    where that label starts. str.find runs at memchr speed, far faster than
+    any case-insensitive regex alternation over the same text."""
+    folded = text.translate(_CASE_FOLD).lower()
+    offsets: Dict[str, List[int]] = {}
+    for needle in _NEEDLES:
+        pos = folded.find(needle)
+        while pos != -1:
+            offsets.setdefault(needle, []).append(pos)
+            pos = folded.find(needle, pos + 1)
+    return offsets
+
+
+def _snippet(text: str, m: re.Match) -> str:
+    start = max(0, m.start() - 50)
+    end = min(len(text), m.end() + 50)
+    snippet = re.sub(r"\s+", " ", text[start:end]).strip()
+    words = snippet.split()
+    return " ".join(words[:20])
+
+
+class _PageScans:
+    """Prefilter offsets per page, computed the first time a pattern reaches
+    that page and shared by every pattern after it -- so a document whose
+    facts are all on page 1 never scans the rest."""
+
+    def __init__(self, pages: List[Page]):
+        self.pages = pages
+        self._scans: List[Optional[Dict[str, List[int]]]] = [None] * len(pages)
+
+    def offsets(self, i: int) -> Dict[str, List[int]]:
+        scan = self._scans[i]
+        if scan is None:
+            scan = self._scans[i] = _scan_page(self.pages[i].text)
+        return scan
+
+
+def _find_in_pages(scans: _PageScans, pattern: _Anchored) -> Tuple[Optional[str], Optional[int], str]:
+    # First page with a match, leftmost match on that page -- exactly what
+    # pattern.search() page by page would return.
+    for i, pg in enumerate(scans.pages):
+        for pos in scans.offsets(i).get(pattern.needle, ()):
+            m = pattern.regex.match(pg.text, pos)
+            if m:
+                return m.group(1), pg.page_num, _snippet(pg.text, m)
     return None, None, ""
 
+
+def _find_with_fallback(scans: _PageScans, patterns: Tuple[_Anchored, _Anchored]):
+    primary, fallback = patterns
+    found = _find_in_pages(scans, primary)
+    if found[0] is None:
+        found = _find_in_pages(scans, fallback)
+    return found
+
+
 def _parse_billion_to_usd(x: str) -> float:
     return float(x) * 1e9
 
@@ -30,14 +125,12 @@ class RegexExtractor(Extractor):
     def extract(self, doc_name: str, pages: List[Page]) -> ExtractedDoc:
         out = ExtractedDoc(doc_name=doc_name)
 
-        date, p, snip = _find_in_pages(pages, r"As-of Date:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})")
-        if date is None:
-            date, p, snip = _find_in_pages(pages, r"Effective Date:\s*([0-9]{4}-[0-9]{2}-[0-9]{2})")
+        scans = _PageScans(pages)
+
+        date, p, snip = _find_with_fallback(scans, DOC_DATE)
         out.doc_date = date
 
-        aum_b, p_aum, sn_aum = _find_in_pages(pages, rf"AUM\){GAP}\$([0-9]+\.[0-9]+)B")
-        if aum_b is None:
-            aum_b, p_aum, sn_aum = _find_in_pages(pages, rf"Assets Under Management{GAP}\$([0-9]+\.[0-9]+)B")
+        aum_b, p_aum, sn_aum = _find_with_fallback(scans, AUM)
         if aum_b is not None:
             out.aum.value = _parse_billion_to_usd(aum_b)
             out.aum.confidence = 0.55
@@ -45,9 +138,7 @@ class RegexExtractor(Extractor):
         else:
             out.missing_fields.append("aum.value")
 
-        net_irr, p_irr, sn_irr = _find_in_pages(pages, rf"Net IRR{GAP}:\s*([0-9]+\.[0-9]+)%")
-        if net_irr is None:
-            net_irr, p_irr, sn_irr = _find_in_pages(pages, rf"Net IRR{GAP}([0-9]+\.[0-9]+)%")
+        net_irr, p_irr, sn_irr = _find_with_fallback(scans, NET_IRR)
         if net_irr is not None:
             out.net_irr.value = float(net_irr)
             out.net_irr.confidence = 0.55
@@ -55,9 +146,7 @@ class RegexExtractor(Extractor):
         else:
             out.missing_fields.append("net_irr.value")
 
-        tvpi, p_tvpi, sn_tvpi = _find_in_pages(pages, rf"TVPI{GAP}:\s*([0-9]+\.[0-9]+)x")
-        if tvpi is None:
-            tvpi, p_tvpi, sn_tvpi = _find_in_pages(pages, rf"TVPI{GAP}([0-9]+\.[0-9]+)x")
+        tvpi, p_tvpi, sn_tvpi = _find_with_fallback(scans, TVPI)
         if tvpi is not None:
             out.tvpi.value = float(tvpi)
             out.tvpi.confidence = 0.55
@@ -65,9 +154,7 @@ class RegexExtractor(Extractor):
         else:
             out.missing_fields.append("tvpi.value")
 
-        target, p_t, sn_t = _find_in_pages(pages, rf"Target IRR{GAP}:\s*([0-9]+)%")
-        if target is None:
-            target, p_t, sn_t = _find_in_pages(pages, rf"Target IRR{GAP}([0-9]+)%")
+        target, p_t, sn_t = _find_with_fallback(scans, TARGET_IRR)
         if target is not None:
             out.target_irr.value = float(target)
             out.target_irr.confidence = 0.55
@@ -75,9 +162,7 @@ class RegexExtractor(Extractor):
         else:
             out.missing_fields.append("target_irr.value")
 
-        fee, p_f, sn_f = _find_in_pages(pages, rf"Management Fee{GAP}:\s*([0-9]+\.[0-9]+)%")
-        if fee is None:
-            fee, p_f, sn_f = _find_in_pages(pages, rf"Management Fee{GAP}([0-9]+\.[0-9]+)%")
+        fee, p_f, sn_f = _find_with_fallback(scans, MGMT_FEE)
         if fee is not None:
             out.mgmt_fee.value = float(fee)
             out.mgmt_fee.confidence = 0.55
@@ -85,12 +170,8 @@ class RegexExtractor(Extractor):
         else:
             out.missing_fields.append("mgmt_fee.value")
 
-        carry, p_c, sn_c = _find_in_pages(pages, r"Carry:\s*([0-9]+)%")
-        if carry is None:
-            carry, p_c, sn_c = _find_in_pages(pages, rf"carried interest{GAP}([0-9]+)%")
-        hurdle, p_h, sn_h = _find_in_pages(pages, r"over an\s*([0-9]+)%\s*preferred")
-        if hurdle is None:
-            hurdle, p_h, sn_h = _find_in_pages(pages, rf"hurdle{GAP}([0-9]+)%")
+        carry, p_c, sn_c = _find_with_fallback(scans, CARRY)
+        hurdle, p_h, sn_h = _find_with_fallback(scans, HURDLE)
 
         if carry is not None:
             out.carry.value = float(carry)
@@ -81,3 +81,7 @@ class ExtractedDoc(BaseModel):
 
     # Charts/graphs detected on page images by the (opt-in) vision extractor.
     chart_extractions: List[dict] = Field(default_factory=list)
+
+    # Which pages LLM-backed extractors were sent vs skipped when relevance
+    # page selection is on (see ddgpt.extract.page_selection); None when off.
+    llm_page_selection: Optional[dict] = None
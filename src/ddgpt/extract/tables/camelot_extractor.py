@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import camelot
-import pandas as pd
-
 from pathlib import Path
+from typing import List, Optional
 
 from ddgpt.extract.tables.table_models import ExtractedTable
 
@@ -17,19 +15,27 @@ FLAVOR_CONFIDENCE = {
 }
 
 class CamelotTableExtractor:
-    def extract(self, pdf_path: str):
+    def extract(self, pdf_path: str, pages: Optional[List[int]] = None):
+        """pages: 1-indexed page numbers to read; None reads every page."""
+        page_spec = "all" if pages is None else ",".join(str(p) for p in pages)
+
         for flavor in ("lattice", "stream"):
-            extracted = self._extract_with_flavor(pdf_path, flavor)
+            extracted = self._extract_with_flavor(pdf_path, flavor, page_spec)
             if extracted:
                 return extracted
 
         return []
 
-    def _extract_with_flavor(self, pdf_path: str, flavor: str):
+    def _extract_with_flavor(self, pdf_path: str, flavor: str, page_spec: str = "all"):
+        # Imported on first use: camelot drags in matplotlib and OpenCV
+        # (~0.6 s), which every module that only needs a Page model would
+        # otherwise pay for via ddgpt.io.loaders.
+        import camelot
+
         try:
             tables = camelot.read_pdf(
                 pdf_path,
-                pages="all",
+                pages=page_spec,
                 flavor=flavor
             )
         except Exception as e:
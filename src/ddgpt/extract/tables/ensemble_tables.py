@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List, Optional
+
 from ddgpt.extract.tables.camelot_extractor import CamelotTableExtractor
 from ddgpt.extract.tables.pdfplumber_extractor import PDFPlumberTableExtractor
 
@@ -11,21 +13,29 @@ class EnsembleTableExtractor:
         ]
         self.cache = {}
 
-    def extract(self, pdf_path: str):
-        if pdf_path in self.cache:
-            return self.cache[pdf_path]
-        
+    def extract(self, pdf_path: str, pages: Optional[List[int]] = None):
+        """pages: 1-indexed page numbers to run the backends on (see
+        page_screen.screen_table_pages); None means every page, and an empty
+        list skips both backends entirely."""
+        cache_key = (pdf_path, None if pages is None else tuple(pages))
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+
+        if pages is not None and not pages:
+            self.cache[cache_key] = []
+            return []
+
         all_tables = []
 
         for extractor in self.extractors:
             try:
-                tables = extractor.extract(pdf_path)
+                tables = extractor.extract(pdf_path, pages=pages)
 
                 all_tables.extend(tables)
 
             except Exception as e:
                 print(f"table extractor failed: {e}")
         
-        self.cache[pdf_path] = all_tables
+        self.cache[cache_key] = all_tables
 
         return all_tables
\ No newline at end of file
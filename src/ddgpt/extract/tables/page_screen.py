@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import re
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from ddgpt.extract.tables.financial_table_parser import AUM_LABEL_RE, IRR_LABEL_RE, TVPI_LABEL_RE
+
+# Cheap, text-only pre-screen for which pages are worth running Camelot/
+# pdfplumber on at all. Both backends cost roughly the same per page
+# whether or not a table is there, and on a long LPA almost every page is
+# prose -- so pages are picked from the text the loader already has, and
+# only those are handed to the table backends.
+
+NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+WORD_RE = re.compile(r"\S+")
+PERCENT_RE = re.compile(r"\d\s*%")
+DOLLAR_RE = re.compile(r"\$\s*\d")
+MULTIPLE_RE = re.compile(r"\b\d+(?:\.\d+)?\s*x\b", re.IGNORECASE)
+
+LABEL_PATTERNS = (AUM_LABEL_RE, IRR_LABEL_RE, TVPI_LABEL_RE)
+
+# A page qualifies on any one of: several value-shaped tokens (%, $, Nx);
+# a headline-metric label next to at least one of them; or a dense run of
+# bare numbers (e.g. a capital-account table with no units in the cells).
+MIN_VALUE_MARKERS = 3
+MIN_NUMERIC_TOKENS = 8
+MIN_NUMERIC_DENSITY = 0.15
+
+
+class TableScreen(BaseModel):
+    """Which pages were sent to the table backends and which were skipped,
+    kept on the LoadedDocument so the choice is visible in the audit trail."""
+    candidate_pages: List[int] = Field(default_factory=list)
+    skipped_pages: List[int] = Field(default_factory=list)
+
+
+def is_table_candidate(text: str) -> bool:
+    text = text or ""
+
+    value_markers = (
+        len(PERCENT_RE.findall(text))
+        + len(DOLLAR_RE.findall(text))
+        + len(MULTIPLE_RE.findall(text))
+    )
+    if value_markers >= MIN_VALUE_MARKERS:
+        return True
+
+    if value_markers and any(p.search(text) for p in LABEL_PATTERNS):
+        return True
+
+    numeric_tokens = len(NUMBER_RE.findall(text))
+    word_tokens = len(WORD_RE.findall(text)) or 1
+    return numeric_tokens >= MIN_NUMERIC_TOKENS and numeric_tokens / word_tokens >= MIN_NUMERIC_DENSITY
+
+
+def screen_table_pages(pages) -> TableScreen:
+    screen = TableScreen()
+    for page in pages:
+        if is_table_candidate(page.text):
+            screen.candidate_pages.append(page.page_num)
+        else:
+            screen.skipped_pages.append(page.page_num)
+    return screen
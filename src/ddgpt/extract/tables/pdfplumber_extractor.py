@@ -1,15 +1,24 @@
 from __future__ import annotations
 
-import pdfplumber
+from typing import List, Optional
 
 from ddgpt.extract.tables.table_models import ExtractedTable
 
 class PDFPlumberTableExtractor:
-    def extract(self, pdf_path: str):
+    def extract(self, pdf_path: str, pages: Optional[List[int]] = None):
+        """pages: 1-indexed page numbers to read; None reads every page."""
+        import pdfplumber  # on first use, like camelot in CamelotTableExtractor
+
         extracted = []
 
         with pdfplumber.open(pdf_path) as pdf:
-            for page_idx, page in enumerate(pdf.pages):
+            if pages is None:
+                page_indices = range(len(pdf.pages))
+            else:
+                page_indices = [p - 1 for p in pages if 1 <= p <= len(pdf.pages)]
+
+            for page_idx in page_indices:
+                page = pdf.pages[page_idx]
                 tables = page.extract_tables()
 
                 for t_idx, table in enumerate(tables):
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Per-call-type timeouts (seconds). A reachability probe should fail fast; a
+# local model generating a long chunk or reading a page image legitimately
+# takes minutes.
+TIMEOUTS = {
+    "probe": 2.0,
+    "generate": 180.0,
+    "vision": 180.0,
+}
+CONNECT_TIMEOUT = 5.0
+
+# Connections kept per host. Requests beyond this wait in httpx's pool
+# rather than opening more sockets; the real provider-side cap is the
+# shared limiter in ddgpt.utils.concurrency.
+MAX_CONNECTIONS_PER_HOST = 64
+MAX_KEEPALIVE_PER_HOST = 16
+
+
+class TransportError(RuntimeError):
+    """Any transport-level failure (connect, timeout, non-2xx status), so
+    callers don't need to import httpx to handle them."""
+
+
+class _Transport:
+    """One background event loop per process, with one pooled keep-alive
+    AsyncClient per host living on it. Sync callers (extractor threads,
+    the pipeline's document workers) bridge in through run_sync; every
+    in-flight request is a coroutine on that loop, not a blocked thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            # A forked worker inherits _loop but not the thread running it.
+            if self._loop is None or self._pid != os.getpid():
+                self._loop = asyncio.new_event_loop()
+                self._pid = os.getpid()
+                self._clients = {}
+                threading.Thread(target=self._loop.run_forever, name="ddgpt-transport", daemon=True).start()
+            return self._loop
+
+    def client(self, host: str) -> httpx.AsyncClient:
+        # Only ever called from coroutines running on the transport loop.
+        client = self._clients.get(host)
+        if client is None:
+            client = self._clients[host] = httpx.AsyncClient(
+                base_url=host,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS_PER_HOST,
+                    max_keepalive_connections=MAX_KEEPALIVE_PER_HOST,
+                ),
+            )
+        return client
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+_transport = _Transport()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run `coro` on the transport loop and block until it finishes. If the
+    caller is interrupted (KeyboardInterrupt, a cancelled worker), the
+    coroutine -- and every request it has in flight -- is cancelled too."""
+    future = asyncio.run_coroutine_threadsafe(coro, _transport.loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def _timeout(call_type: str, timeout: Optional[float]) -> httpx.Timeout:
+    total = timeout if timeout is not None else TIMEOUTS[call_type]
+    return httpx.Timeout(total, connect=min(total, CONNECT_TIMEOUT))
+
+
+async def _request(method: str, host: str, path: str, call_type: str, timeout: Optional[float],
+                   payload: Optional[dict] = None) -> Any:
+    try:
+        resp = await _transport.client(host).request(method, path, json=payload, timeout=_timeout(call_type, timeout))
+        resp.raise_for_status()
+        return resp.json()
+    except (httpx.HTTPError, ValueError) as e:
+        raise TransportError(f"{method} {host}{path} failed: {e!r}") from e
+
+
+async def post_json_async(host: str, path: str, payload: dict, call_type: str = "generate",
+                          timeout: Optional[float] = None) -> Any:
+    return await _request("POST", host, path, call_type, timeout, payload)
+
+
+async def get_json_async(host: str, path: str, call_type: str = "probe", timeout: Optional[float] = None) -> Any:
+    return await _request("GET", host, path, call_type, timeout)
+
+
+def get_json(host: str, path: str, call_type: str = "probe", timeout: Optional[float] = None) -> Any:
+    return run_sync(get_json_async(host, path, call_type, timeout))
+
+
+def close() -> None:
+    """Close every pooled connection (e.g. at the end of a long-running
+    server process); the next request reopens them."""
+    run_sync(_transport.aclose())
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 import time
 from pathlib import Path
-from typing import List
-
-import requests
+from typing import List, Optional
 
 from ddgpt.extract.schemas import ChartExtraction
 from ddgpt.provenance.evidence import Evidence
 from ddgpt.utils.json_parser import safe_parse_json
+from ddgpt.utils.concurrency import backoff_delay, limited_async, provider_limiter
+from ddgpt.extract import transport
 from ddgpt.ingestion.page_render import render_pages_png
 
 DEFAULT_OLLAMA_HOST = "http://localhost:11434"
@@ -35,17 +36,16 @@ def ollama_vision_is_available(host: str = DEFAULT_OLLAMA_HOST, model: str = DEF
     has actually been pulled, since an unpulled model fails per-page instead
     of at pipeline build time."""
     try:
-        resp = requests.get(f"{host}/api/tags", timeout=timeout)
-        if resp.status_code != 200:
-            return False
-        installed = {
-            m.get("name", "").split(":")[0]
-            for m in resp.json().get("models", [])
-        }
-        return model.split(":")[0] in installed
-    except requests.RequestException:
+        tags = transport.get_json(host, "/api/tags", call_type="probe", timeout=timeout)
+    except transport.TransportError:
         return False
 
+    installed = {
+        m.get("name", "").split(":")[0]
+        for m in tags.get("models", [])
+    }
+    return model.split(":")[0] in installed
+
 
 class OllamaVisionExtractor:
     """Detects and extracts data from charts/graphs embedded as images on PDF
@@ -67,6 +67,9 @@ class OllamaVisionExtractor:
         temperature: float = 0.0,
         dpi: int = DEFAULT_DPI,
         max_pages: int = 20,
+        max_in_flight: Optional[int] = None,
+        max_concurrent_pages: int = 1,
+        latency_target_s: Optional[float] = None,
     ):
         self.prompt_text = prompt_text
         self.model = model
@@ -74,13 +77,25 @@ class OllamaVisionExtractor:
         self.temperature = temperature
         self.dpi = dpi
         self.max_pages = max_pages
-
-    def extract_charts(self, doc_name: str, path: str) -> List[dict]:
+        # Adaptive cap on vision calls to this model across all documents;
+        # max_in_flight=None means unlimited.
+        self.limiter = provider_limiter(f"ollama:{host}:{model}", max_in_flight, latency_target_s)
+        # Pages of one document sent to the model at once.
+        self.max_concurrent_pages = max_concurrent_pages
+
+    def extract_charts(self, doc_name: str, path: str, page_numbers: Optional[List[int]] = None) -> List[dict]:
+        """page_numbers restricts rendering/model calls to a pre-screened
+        subset (see LoadedDocument.chart_candidate_pages); None means every
+        page, still subject to max_pages."""
         if Path(path).suffix.lower() != ".pdf":
             return []
 
+        if page_numbers is not None and not page_numbers:
+            logger.info(f"vision_extract doc={doc_name} pages_processed=0 (no chart candidate pages)")
+            return []
+
         try:
-            page_images = render_pages_png(path, dpi=self.dpi)
+            page_images = render_pages_png(path, dpi=self.dpi, page_numbers=page_numbers)
         except Exception as e:
             logger.error(f"vision_extract doc={doc_name} status=error stage=render error={e!r}")
             return []
@@ -92,12 +107,20 @@ class OllamaVisionExtractor:
                 f"pages_processed={len(page_numbers)} (max_pages cap)"
             )
 
-        results = []
-        for page_num in page_numbers:
-            results.extend(self._extract_page(doc_name, page_num, page_images[page_num]))
-        return results
+        return transport.run_sync(self._extract_pages(doc_name, page_numbers, page_images))
 
-    def _extract_page(self, doc_name: str, page_num: int, png_bytes: bytes) -> List[dict]:
+    async def _extract_pages(self, doc_name: str, page_numbers: List[int], page_images: dict) -> List[dict]:
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_pages))
+
+        async def bounded(page_num):
+            async with semaphore:
+                return await self._extract_page(doc_name, page_num, page_images[page_num])
+
+        # gather keeps page order regardless of which page the model finishes first.
+        per_page = await asyncio.gather(*(bounded(page_num) for page_num in page_numbers))
+        return [chart for charts in per_page for chart in charts]
+
+    async def _extract_page(self, doc_name: str, page_num: int, png_bytes: bytes) -> List[dict]:
         """Returns a list because a single page can legitimately contain
         multiple charts (e.g. a bar chart next to a separate pie chart) --
         confirmed with a real document during development, where an earlier
@@ -109,22 +132,23 @@ class OllamaVisionExtractor:
         for attempt in range(RETRY_ATTEMPTS):
             call_start = time.perf_counter()
             try:
-                resp = requests.post(
-                    f"{self.host}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": self.prompt_text,
-                        "images": [b64],
-                        "options": {"temperature": self.temperature},
-                        "format": "json",
-                        "stream": False,
-                    },
-                    timeout=180,
-                )
-                resp.raise_for_status()
+                async with limited_async(self.limiter):
+                    body = await transport.post_json_async(
+                        self.host,
+                        "/api/generate",
+                        {
+                            "model": self.model,
+                            "prompt": self.prompt_text,
+                            "images": [b64],
+                            "options": {"temperature": self.temperature},
+                            "format": "json",
+                            "stream": False,
+                        },
+                        call_type="vision",
+                    )
                 latency = time.perf_counter() - call_start
 
-                text = resp.json()["response"].strip()
+                text = body["response"].strip()
                 data = safe_parse_json(text)
 
                 charts = data.get("charts", [])
@@ -177,7 +201,7 @@ class OllamaVisionExtractor:
                     f"page={page_num} attempt={attempt + 1} status=error latency_s={latency:.3f} error={e!r}"
                 )
                 if attempt < RETRY_ATTEMPTS - 1:
-                    time.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                    await asyncio.sleep(backoff_delay(RETRY_BACKOFF_SECONDS, attempt))
 
         logger.error(
             f"llm_call provider=ollama_vision model={self.model} doc={doc_name} "
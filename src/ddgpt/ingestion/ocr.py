@@ -1,24 +1,105 @@
 from __future__ import annotations
 
 import fitz
-import pytesseract
-from PIL import Image
 import io
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional
+
+from ddgpt.utils.cache import content_hash, disk_cache_get, disk_cache_put, MISSING
 
 DEFAULT_OCR_DPI = 300
 
+OCR_CACHE_NAMESPACE = "ocr_pages"
+
 
 def ocr_page_image(page, dpi: int = DEFAULT_OCR_DPI) -> str:
     """OCR a single already-open fitz page object; returns extracted text."""
     pix = page.get_pixmap(dpi=dpi)
-    img = Image.open(io.BytesIO(pix.tobytes("png")))
+    return ocr_png_bytes(pix.tobytes("png"))
+
+
+def ocr_png_bytes(png_bytes: bytes) -> str:
+    """OCR an already-rendered page image. Takes plain bytes rather than a
+    fitz page so it can run in a worker process (fitz objects don't pickle)."""
+    # Imported here: pytesseract pulls in pandas, and most runs never OCR.
+    import pytesseract
+    from PIL import Image
+
+    img = Image.open(io.BytesIO(png_bytes))
     return pytesseract.image_to_string(img)
 
 
-def ocr_pdf(path: str, dpi: int = DEFAULT_OCR_DPI):
+def ocr_page_cache_key(pix, dpi: int) -> str:
+    """Keyed on the rendered pixels (not the PDF path or page number), so the
+    same scanned page reused in another file/deal still hits the cache, and
+    a page whose content changed misses it."""
+    return content_hash(
+        "ocr_page",
+        str(dpi),
+        f"{pix.width}x{pix.height}x{pix.n}",
+        pix.samples,
+    )
+
+
+def ocr_pages(
+    fitz_doc,
+    page_indices,
+    dpi: int = DEFAULT_OCR_DPI,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+) -> Dict[int, str]:
+    """OCR the given 0-indexed pages of an open fitz document, returning
+    {page_index: text}.
+
+    Each page is rendered once in this process; its pixels are hashed into a
+    per-page cache key, and only cache misses are sent to Tesseract -- across
+    a process pool when workers > 1, so rendering of later pages overlaps
+    with OCR of earlier ones.
+    """
+    page_indices = list(page_indices)
+    results: Dict[int, str] = {}
+    keys: Dict[int, str] = {}
+    pending: Dict[int, Future] = {}
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(page_indices) > 1 else None
+
+    try:
+        for idx in page_indices:
+            pix = fitz_doc[idx].get_pixmap(dpi=dpi)
+
+            if cache_dir is not None:
+                keys[idx] = ocr_page_cache_key(pix, dpi)
+                cached = disk_cache_get(cache_dir, OCR_CACHE_NAMESPACE, keys[idx])
+                if cached is not MISSING:
+                    results[idx] = cached
+                    continue
+
+            png_bytes = pix.tobytes("png")
+            del pix  # a 300dpi RGB pixmap is ~25MB; don't hold one per page
+
+            if pool is not None:
+                pending[idx] = pool.submit(ocr_png_bytes, png_bytes)
+            else:
+                results[idx] = ocr_png_bytes(png_bytes)
+                if cache_dir is not None:
+                    disk_cache_put(cache_dir, OCR_CACHE_NAMESPACE, keys[idx], results[idx])
+
+        for idx, future in pending.items():
+            results[idx] = future.result()
+            if cache_dir is not None:
+                disk_cache_put(cache_dir, OCR_CACHE_NAMESPACE, keys[idx], results[idx])
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    return results
+
+
+def ocr_pdf(path: str, dpi: int = DEFAULT_OCR_DPI, workers: int = 1, cache_dir: Optional[str] = None):
     """OCR every page of a PDF from scratch. Returns a list of (page_num, text)."""
     doc = fitz.open(path)
     try:
-        return [(i + 1, ocr_page_image(page, dpi=dpi)) for i, page in enumerate(doc)]
+        texts = ocr_pages(doc, range(len(doc)), dpi=dpi, workers=workers, cache_dir=cache_dir)
+        return [(i + 1, texts[i]) for i in range(len(doc))]
     finally:
         doc.close()
@@ -1,31 +1,67 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
+from typing import List, Optional
 from pydantic import BaseModel, Field
 import fitz
 
 from ddgpt.extract.tables.ensemble_tables import EnsembleTableExtractor
-from ddgpt.ingestion.ocr import ocr_page_image
+from ddgpt.extract.tables.page_screen import TableScreen, screen_table_pages
+from ddgpt.ingestion.ocr import ocr_pages
 from ddgpt.layout.models import DocumentLayout
-from ddgpt.layout.section_parser import parse_sections, parse_sections_from_text
+from ddgpt.layout.section_parser import collect_page_lines, parse_sections_from_lines, parse_sections_from_text
 from ddgpt.layout.footnote_linker import attach_footnotes_to_tables
 
 # pdfminer (used internally by pdfplumber/Camelot for table extraction) logs
 # a routine, harmless notice at WARNING level whenever a PDF page omits an
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 
+logger = logging.getLogger("ddgpt")
+
 # A page whose native text layer is shorter than this is treated as a
 # scanned/image page and re-read via OCR instead of silently kept as
 # (near-)empty text.
 MIN_TEXT_LAYER_CHARS = 20
 
+# Same text flags get_text("text") uses (so text rebuilt from the dict is
+# identical to it), plus vector-graphics blocks for the drawing inventory.
+# Deliberately *not* TEXT_PRESERVE_IMAGES: that decodes every embedded image
+# into the result, which is most of the cost on image-heavy decks -- image
+# inventory comes from the page's resource list instead.
+SCAN_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT | fitz.TEXT_COLLECT_VECTORS
+
+# A page with no embedded image needs at least this many vector paths
+# (bars, axes, gridlines, pie wedges) to be worth a vision-model call.
+CHART_MIN_VECTOR_PATHS = 12
+
+# Bumped whenever LoadedDocument gains fields, so pickled entries from an
+# older loader miss the loaded_documents cache instead of being reused.
+LOADER_CACHE_VERSION = "3"
+
 
 class Page(BaseModel):
     page_num: int
     text: str
 
 
+class PageInventory(BaseModel):
+    """Cheap per-page facts gathered during the single ingestion pass, for
+    later stages to decide which pages are worth an expensive pass (table
+    extraction, vision-model chart reading) without reopening the PDF."""
+    page_num: int
+    char_count: int = 0
+    line_count: int = 0
+    image_count: int = 0
+    vector_count: int = 0
+    ocr_applied: bool = False
+
+    def may_contain_chart(self) -> bool:
+        return self.image_count > 0 or self.vector_count >= CHART_MIN_VECTOR_PATHS
+
+
 class LoadedDocument(BaseModel):
     doc_name: str
 
@@ -37,8 +73,29 @@ class LoadedDocument(BaseModel):
 
     layout: DocumentLayout = Field(default_factory=DocumentLayout)
 
+    # Empty for plain-text documents (nothing to inventory).
+    inventory: list[PageInventory] = []
+
+    # Which pages the table backends ran on / skipped; None when every page
+    # was sent (screening disabled) or there was nothing to screen (.txt).
+    table_screen: Optional[TableScreen] = None
 
-def load_document(path: str, ocr_enabled: bool = True, ocr_dpi: int = 300) -> LoadedDocument:
+    def chart_candidate_pages(self) -> Optional[List[int]]:
+        """Pages with any image or substantial vector drawing. None when no
+        inventory was collected, meaning "no pre-screen: consider every page"."""
+        if not self.inventory:
+            return None
+        return [inv.page_num for inv in self.inventory if inv.may_contain_chart()]
+
+
+def load_document(
+    path: str,
+    ocr_enabled: bool = True,
+    ocr_dpi: int = 300,
+    ocr_workers: int = 1,
+    ocr_cache_dir: Optional[str] = None,
+    table_page_screening: bool = True,
+) -> LoadedDocument:
     ext = Path(path).suffix.lower()
 
     if ext == ".txt":
@@ -47,7 +104,75 @@ def load_document(path: str, ocr_enabled: bool = True, ocr_dpi: int = 300) -> Lo
     if ext != ".pdf":
         raise ValueError(f"Unsupported file type: {ext} (supported: .pdf, .txt)")
 
-    return _load_pdf_document(path, ocr_enabled=ocr_enabled, ocr_dpi=ocr_dpi)
+    return _load_pdf_document(
+        path,
+        ocr_enabled=ocr_enabled,
+        ocr_dpi=ocr_dpi,
+        ocr_workers=ocr_workers,
+        ocr_cache_dir=ocr_cache_dir,
+        table_page_screening=table_page_screening,
+    )
+
+
+def load_documents(
+    paths: List[str],
+    ocr_enabled: bool = True,
+    ocr_dpi: int = 300,
+    workers: int = 1,
+    ocr_workers: int = 1,
+    ocr_cache_dir: Optional[str] = None,
+    table_page_screening: bool = True,
+    pool: Optional[Executor] = None,
+) -> List[LoadedDocument]:
+    """Load several documents, in input order.
+
+    PDF loading (text layer, OCR fallback, section parsing, two table
+    backends) is CPU-bound and independent per file, so with workers > 1 the
+    files are spread across a process pool instead of loaded one after
+    another. LoadedDocument is a plain pydantic model, so it pickles back to
+    the parent process as-is.
+
+    `pool` is an already-running process pool to load on instead (e.g. one
+    shared by every deal of a batch); it is used whatever `workers` and the
+    number of paths, and is left running.
+
+    Documents loaded on a process pool OCR their scanned pages serially
+    (ocr_workers is only used for in-process loading): the pool already
+    keeps the cores busy, and an OCR pool per loader process would start
+    workers x ocr_workers processes.
+    """
+    if pool is not None:
+        return _map_load(pool, paths, ocr_enabled, ocr_dpi, ocr_cache_dir, table_page_screening)
+    if workers <= 1 or len(paths) <= 1:
+        return [
+            load_document(
+                p,
+                ocr_enabled=ocr_enabled,
+                ocr_dpi=ocr_dpi,
+                ocr_workers=ocr_workers,
+                ocr_cache_dir=ocr_cache_dir,
+                table_page_screening=table_page_screening,
+            )
+            for p in paths
+        ]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+        return _map_load(pool, paths, ocr_enabled, ocr_dpi, ocr_cache_dir, table_page_screening)
+
+
+def _map_load(pool: Executor, paths, ocr_enabled, ocr_dpi, ocr_cache_dir, table_page_screening):
+    # Executor.map yields results in submission order regardless of which
+    # worker finishes first. OCR stays in-process in each worker (see
+    # load_documents).
+    return list(pool.map(
+        load_document,
+        paths,
+        repeat(ocr_enabled),
+        repeat(ocr_dpi),
+        repeat(1),
+        repeat(ocr_cache_dir),
+        repeat(table_page_screening),
+    ))
 
 
 def _load_text_document(path: str) -> LoadedDocument:
@@ -63,33 +188,65 @@ def _load_text_document(path: str) -> LoadedDocument:
     )
 
 
-def _load_pdf_document(path: str, ocr_enabled: bool = True, ocr_dpi: int = 300) -> LoadedDocument:
+def _load_pdf_document(
+    path: str,
+    ocr_enabled: bool = True,
+    ocr_dpi: int = 300,
+    ocr_workers: int = 1,
+    ocr_cache_dir: Optional[str] = None,
+    table_page_screening: bool = True,
+) -> LoadedDocument:
     doc = fitz.open(path)
 
-    pages = []
-
+    # One get_text("dict") traversal per page feeds plain text, layout lines
+    # (for section/footnote parsing) and the image/drawing inventory.
+    texts = []
+    lines = []
+    inventory = []
     for i, page in enumerate(doc):
-        text = page.get_text("text")
+        text, page_lines, page_inventory = _scan_page(page, i + 1)
+        texts.append(text)
+        lines.extend(page_lines)
+        inventory.append(page_inventory)
 
-        if ocr_enabled and len(text.strip()) < MIN_TEXT_LAYER_CHARS:
-            ocr_text = ocr_page_image(page, dpi=ocr_dpi)
-            if len(ocr_text.strip()) > len(text.strip()):
-                text = ocr_text
+    if ocr_enabled:
+        # Pages are OCR'd as one batch after the text-layer pass (rather than
+        # inline, one at a time) so scanned pages can go out to a worker pool
+        # and hit the per-page OCR cache.
+        scanned = [i for i, text in enumerate(texts) if len(text.strip()) < MIN_TEXT_LAYER_CHARS]
+        ocr_texts = ocr_pages(doc, scanned, dpi=ocr_dpi, workers=ocr_workers, cache_dir=ocr_cache_dir)
 
-        pages.append(
-            Page(
-                page_num=i + 1,
-                text=text
-            )
+        for i, ocr_text in ocr_texts.items():
+            if len(ocr_text.strip()) > len(texts[i].strip()):
+                texts[i] = ocr_text
+                inventory[i].char_count = len(ocr_text)
+                inventory[i].ocr_applied = True
+
+    doc.close()
+
+    pages = [
+        Page(
+            page_num=i + 1,
+            text=text
         )
+        for i, text in enumerate(texts)
+    ]
 
-    sections, footnotes = parse_sections(doc)
+    sections, footnotes = parse_sections_from_lines(lines)
 
-    doc.close()
+    table_screen = None
+    table_pages = None
+    if table_page_screening:
+        table_screen = screen_table_pages(pages)
+        table_pages = table_screen.candidate_pages
+        logger.info(
+            f"table_screen doc={Path(path).name} candidate_pages={table_screen.candidate_pages} "
+            f"skipped_pages={table_screen.skipped_pages}"
+        )
 
     table_extractor = EnsembleTableExtractor()
 
-    tables = table_extractor.extract(path)
+    tables = table_extractor.extract(path, pages=table_pages)
     tables = attach_footnotes_to_tables(tables, footnotes)
 
     return LoadedDocument(
@@ -98,4 +255,35 @@ def _load_pdf_document(path: str, ocr_enabled: bool = True, ocr_dpi: int = 300)
         pages=pages,
         tables=tables,
         layout=DocumentLayout(sections=sections, footnotes=footnotes),
+        inventory=inventory,
+        table_screen=table_screen,
+    )
+
+
+def _scan_page(page, page_num: int):
+    """Plain text, layout lines and inventory for one page, from a single
+    get_text("dict") call (text rebuilt line-by-line exactly as
+    get_text("text") would produce it)."""
+    raw = page.get_text("dict", flags=SCAN_TEXT_FLAGS)
+
+    text_parts = []
+    vector_count = 0
+    for block in raw.get("blocks", []):
+        if block.get("type") == 3:
+            vector_count += 1
+            continue
+        for line in block.get("lines", []):
+            text_parts.append("".join(s.get("text", "") for s in line.get("spans", [])) + "\n")
+    text = "".join(text_parts)
+
+    page_lines = collect_page_lines(raw, page_num, page.rect.height)
+
+    inventory = PageInventory(
+        page_num=page_num,
+        char_count=len(text),
+        line_count=len(page_lines),
+        image_count=len(page.get_images()),
+        vector_count=vector_count,
     )
+
+    return text, page_lines, inventory
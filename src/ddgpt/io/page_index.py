@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ddgpt.io.loaders import Page
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Whitespace-collapsed, lowercased text -- the form evidence snippets
+    are compared in."""
+    return _WHITESPACE_RE.sub(" ", text or "").strip().lower()
+
+
+class PageIndex:
+    """Per-document page lookup, built once and shared by every stage that
+    looks pages up by number (evidence verification) or walks them in
+    order (IRR mention and definition scans).
+
+    Lookup by page number is a dict hit instead of a scan over the pages
+    list, and each page's normalized text is computed the first time it's
+    asked for and reused by every later metric citing the same page. Whole-
+    document scans (e.g. IRR mentions, wanted by both page selection and
+    the post-extraction pass) are memoized per index too. Iterates like the
+    pages list it was built from."""
+
+    def __init__(self, pages: Iterable[Page]):
+        self.pages: List[Page] = list(pages)
+        self._by_num: Dict[int, Page] = {}
+        for page in self.pages:
+            # First page wins on duplicate numbers, as the old linear scan did.
+            self._by_num.setdefault(page.page_num, page)
+        self._normalized: Dict[int, str] = {}
+        self._memo: Dict[str, Any] = {}
+
+    @classmethod
+    def of(cls, pages: "Iterable[Page] | PageIndex") -> "PageIndex":
+        """The index itself if already built, else a new one over pages."""
+        return pages if isinstance(pages, PageIndex) else cls(pages)
+
+    def __iter__(self) -> Iterator[Page]:
+        return iter(self.pages)
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def get(self, page_num: Optional[int]) -> Optional[Page]:
+        if page_num is None:
+            return None
+        return self._by_num.get(page_num)
+
+    def text(self, page_num: Optional[int]) -> str:
+        """Raw page text; "" for an unknown page or no page at all."""
+        page = self.get(page_num)
+        return (page.text or "") if page is not None else ""
+
+    def normalized_text(self, page_num: Optional[int]) -> str:
+        if page_num not in self._by_num:
+            return ""
+        text = self._normalized.get(page_num)
+        if text is None:
+            text = self._normalized[page_num] = normalize(self._by_num[page_num].text)
+        return text
+
+    def memo(self, key: str, compute: Callable[[], Any]) -> Any:
+        """compute() once per index; later calls with the same key get the
+        same object back, so callers must not mutate it."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
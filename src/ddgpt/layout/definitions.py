@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import re
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from ddgpt.io.loaders import Page
 from ddgpt.layout.models import DocumentLayout
 
+if TYPE_CHECKING:
+    # Annotation only; DefinitionDriftRule imports this module for its
+    # patterns and shouldn't pull in PyMuPDF via the loaders.
+    from ddgpt.io.loaders import Page
+
 # Broader than a literal "gross"/"net" keyword match: covers the common
 # ways funds phrase the same convention without using either word.
 NET_PATTERNS = [
@@ -41,7 +45,7 @@ def _scan_text_for_basis(text: str):
     return None, None
 
 
-def infer_irr_basis(pages: List[Page], layout: Optional[DocumentLayout]) -> Optional[dict]:
+def infer_irr_basis(pages: Iterable[Page], layout: Optional[DocumentLayout]) -> Optional[dict]:
     """Infer the document-wide gross/net return convention.
 
     Convention is often stated once -- in a Definitions/Terms/Performance
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from ddgpt.io.loaders import Page
+from ddgpt.io.page_index import PageIndex
 
 # Catches "Net IRR: 16.8%", "Target IRR: 18%", "gross IRR of 20%" -- a
 # gross/net qualifier and/or "target" before "IRR", then a percentage within
@@ -33,7 +34,7 @@ def _overlaps(span: Tuple[int, int], existing: List[Tuple[int, int]]) -> bool:
     return any(not (end <= s or start >= e) for s, e in existing)
 
 
-def find_irr_mentions(pages: List[Page]) -> List[dict]:
+def find_irr_mentions(pages: Iterable[Page]) -> List[dict]:
     """Every IRR-shaped percentage mention across the whole document -- not
     just the one a field extractor latched onto for target_irr/net_irr.
 
@@ -42,7 +43,17 @@ def find_irr_mentions(pages: List[Page]) -> List[dict]:
     on its own; this makes it visible so a rule can compare it against
     whatever *did* get extracted, instead of the discrepancy silently
     living only in an LLM's free-text notes.
+
+    Given a PageIndex, the scan runs once per document however many stages
+    ask; each caller gets its own copy of the mention dicts.
     """
+    if isinstance(pages, PageIndex):
+        mentions = pages.memo("irr_mentions", lambda: _scan_irr_mentions(pages.pages))
+        return [dict(m) for m in mentions]
+    return _scan_irr_mentions(pages)
+
+
+def _scan_irr_mentions(pages: Iterable[Page]) -> List[dict]:
     mentions: List[dict] = []
     spans_by_page: Dict[int, List[Tuple[int, int]]] = {}
 
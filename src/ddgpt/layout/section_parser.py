@@ -39,24 +39,32 @@ def _collect_lines(fitz_doc) -> List[dict]:
     """Flatten every text line across the document with page, size, boldness, vertical position."""
     lines = []
     for page_index, page in enumerate(fitz_doc):
-        raw = page.get_text("dict")
-        page_height = page.rect.height or 1.0
-        for block in raw.get("blocks", []):
-            for line in block.get("lines", []):
-                spans = line.get("spans", [])
-                text = "".join(s.get("text", "") for s in spans).strip()
-                if not text:
-                    continue
-                sizes = [s.get("size", 0.0) for s in spans]
-                flags = [s.get("flags", 0) for s in spans]
-                y0 = line["bbox"][1]
-                lines.append({
-                    "page_num": page_index + 1,
-                    "text": text,
-                    "size": max(sizes) if sizes else 0.0,
-                    "bold": any(_is_bold(f) for f in flags),
-                    "y_frac": y0 / page_height,
-                })
+        lines.extend(collect_page_lines(page.get_text("dict"), page_index + 1, page.rect.height))
+    return lines
+
+
+def collect_page_lines(raw: dict, page_num: int, page_height: float) -> List[dict]:
+    """Layout lines for one page from an already-computed get_text("dict")
+    result, so a loader that walks each page once can share it with section
+    parsing instead of this module re-walking the whole document."""
+    page_height = page_height or 1.0
+    lines = []
+    for block in raw.get("blocks", []):
+        for line in block.get("lines", []):
+            spans = line.get("spans", [])
+            text = "".join(s.get("text", "") for s in spans).strip()
+            if not text:
+                continue
+            sizes = [s.get("size", 0.0) for s in spans]
+            flags = [s.get("flags", 0) for s in spans]
+            y0 = line["bbox"][1]
+            lines.append({
+                "page_num": page_num,
+                "text": text,
+                "size": max(sizes) if sizes else 0.0,
+                "bold": any(_is_bold(f) for f in flags),
+                "y_frac": y0 / page_height,
+            })
     return lines
 
 
@@ -87,7 +95,11 @@ def _extract_footnote_marker(text: str) -> str:
 
 def parse_sections(fitz_doc) -> Tuple[List[Section], List[Footnote]]:
     """Reconstruct section hierarchy + footnotes from a layout-rich (PDF) document."""
-    lines = _collect_lines(fitz_doc)
+    return parse_sections_from_lines(_collect_lines(fitz_doc))
+
+
+def parse_sections_from_lines(lines: List[dict]) -> Tuple[List[Section], List[Footnote]]:
+    """parse_sections over pre-collected layout lines (see collect_page_lines)."""
     if not lines:
         return [], []
 
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger("ddgpt")
+
+
+class BatchDeal(BaseModel):
+    name: str
+    input: str
+    out: str
+    # Config file for this deal; the batch's --config when omitted.
+    config: Optional[str] = None
+
+
+class BatchManifest(BaseModel):
+    deals: List[BatchDeal]
+
+
+def load_batch_manifest(path: str) -> BatchManifest:
+    """Manifest of deals to run, from JSON or YAML:
+
+        deals:
+          - {name: atlas, input: atlas/docs, out: out/atlas}
+          - {name: birch, input: birch/docs, out: out/birch, config: birch.yaml}
+
+    `name` defaults to the input directory's name. Relative input, out and
+    config paths are resolved against the manifest's directory, so a
+    manifest can live next to the data rooms it lists. Raises ValueError
+    for duplicate names or output directories."""
+    p = Path(path)
+    text = p.read_text(encoding="utf-8")
+    if p.suffix.lower() == ".json":
+        raw = json.loads(text)
+    else:
+        import yaml
+        raw = yaml.safe_load(text)
+
+    base = p.parent
+    deals = []
+    for entry in (raw or {}).get("deals") or []:
+        entry = dict(entry)
+        for key in ("input", "out", "config"):
+            if entry.get(key):
+                entry[key] = str(base / entry[key])
+        entry.setdefault("name", Path(entry.get("input") or "").name)
+        deals.append(entry)
+    manifest = BatchManifest.model_validate({"deals": deals})
+
+    for field in ("name", "out"):
+        values = [getattr(d, field) for d in manifest.deals]
+        duplicates = sorted({v for v in values if values.count(v) > 1})
+        if duplicates:
+            raise ValueError(f"duplicate deal {field} in {path}: {duplicates}")
+    return manifest
+
+
+class DealJob:
+    """One deal's work, split into tasks the batch scheduler interleaves
+    with every other deal's on a shared pool:
+
+      load(path) -> document                      one task per document
+      extract(document, timings) -> dict          queued as soon as that document is loaded
+      finish(documents, extracted, timings) -> dict
+                                                  rules, memo and outputs, queued once the
+                                                  deal's last document is extracted; returns
+                                                  the deal's entry in the batch summary
+
+    `timings` is the deal's own dict, shared by its tasks."""
+
+    def __init__(self, name: str, paths: List[str], load: Callable[[str], Any],
+                 extract: Callable[[Any, dict], dict], finish: Callable[[list, list, dict], Dict[str, Any]]):
+        self.name = name
+        self.paths = paths
+        self.load = load
+        self.extract = extract
+        self.finish = finish
+
+        self.timings: Dict[str, Any] = {"load_s": 0.0}
+        self.summary: Dict[str, Any] = {}
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.done = threading.Event()
+
+        self._docs: List[Any] = [None] * len(paths)
+        self._extracted: List[Optional[dict]] = [None] * len(paths)
+        self._remaining = len(paths)
+        self._pending = 0  # tasks submitted but not yet finished
+        self._lock = threading.Lock()
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def result(self, batch_start: float) -> Dict[str, Any]:
+        timings = dict(self.timings)
+        if "per_document_s" in timings:
+            timings["extraction_total_s"] = round(sum(timings["per_document_s"].values()), 3)
+        return {
+            "name": self.name,
+            "status": "failed" if self.failed else "succeeded",
+            "error": self.error,
+            "documents": len(self.paths),
+            "queue_wait_s": round(self.started_at - batch_start, 3) if self.started_at else None,
+            "wall_s": round(self.finished_at - self.started_at, 3) if self.finished_at and self.started_at else None,
+            **self.summary,
+            "timings_s": timings,
+        }
+
+    # --- scheduling; every task runs through _run so a failure (or the
+    # deal's last task) is accounted for exactly once.
+
+    def _hold(self) -> None:
+        with self._lock:
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._pending -= 1
+            idle = self._pending == 0
+        if idle:
+            self.done.set()
+
+    def _submit(self, fn, *args) -> None:
+        self._hold()
+        self._pool.submit(self._run, fn, *args)
+
+    def _run(self, fn, *args) -> None:
+        try:
+            if not self.failed:
+                with self._lock:
+                    if self.started_at is None:
+                        self.started_at = time.perf_counter()
+                fn(*args)
+        except Exception as e:
+            logger.exception(f"batch deal {self.name} failed")
+            with self._lock:
+                if self.error is None:
+                    self.error = repr(e)
+                    self.finished_at = time.perf_counter()
+        finally:
+            self._release()
+
+    def _load(self, i: int) -> None:
+        t0 = time.perf_counter()
+        doc = self.load(self.paths[i])
+        with self._lock:
+            self.timings["load_s"] = round(self.timings["load_s"] + time.perf_counter() - t0, 3)
+        self._docs[i] = doc
+        self._submit(self._extract, i)
+
+    def _extract(self, i: int) -> None:
+        self._extracted[i] = self.extract(self._docs[i], self.timings)
+        with self._lock:
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last:
+            self._submit(self._finish)
+
+    def _finish(self) -> None:
+        self.summary = self.finish(self._docs, self._extracted, self.timings)
+        self.finished_at = time.perf_counter()
+        logger.info(f"stage=batch_deal deal={self.name} documents={len(self.paths)} "
+                    f"wall_s={self.finished_at - self.started_at:.3f}")
+
+
+def run_batch(deals: List[DealJob], workers: int = 4) -> Dict[str, Any]:
+    """Run every deal's tasks on one pool of `workers` threads and return
+    the batch summary.
+
+    Documents are loaded round-robin across deals (each deal's first
+    document, then each deal's second, ...) so every deal gets going
+    early; after that tasks run in the order they became ready. While one
+    deal's documents wait on a slow LLM call, the other threads keep
+    loading, extracting and reporting other deals. Provider calls from all
+    deals share the process-wide limiters (model.max_in_flight etc.),
+    whatever the pool size. A deal that fails stops scheduling its own
+    remaining tasks and is reported as failed; the other deals carry on."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ddgpt-batch") as pool:
+        for deal in deals:
+            deal._pool = pool
+            deal._hold()  # not done before all of its loads are submitted
+        for deal in deals:
+            if not deal.paths:
+                deal._submit(deal._finish)
+        for row in zip_longest(*[range(len(deal.paths)) for deal in deals]):
+            for deal, i in zip(deals, row):
+                if i is not None:
+                    deal._submit(deal._load, i)
+        for deal in deals:
+            deal._release()
+            deal.done.wait()
+    wall_s = time.perf_counter() - start
+
+    results = [deal.result(start) for deal in deals]
+    return {
+        "workers": workers,
+        "deal_count": len(deals),
+        "succeeded": sum(r["status"] == "succeeded" for r in results),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "wall_s": round(wall_s, 3),
+        # Greater than wall_s when deals overlapped on the pool.
+        "deal_wall_sum_s": round(sum(r["wall_s"] or 0.0 for r in results), 3),
+        "deals": results,
+    }
@@ -4,11 +4,8 @@ from ddgpt.extract.regex_extractor import RegexExtractor
 from ddgpt.extract.cohere_extractor import CohereExtractor
 from ddgpt.extract.ollama_extractor import OllamaExtractor, ollama_is_available
 from ddgpt.extract.vision_extractor import OllamaVisionExtractor, ollama_vision_is_available
-from ddgpt.rules.numeric_mismatch import NumericMismatchRule
-from ddgpt.rules.definition_drift import DefinitionDriftRule
-from ddgpt.rules.internal_inconsistency import InternalInconsistencyRule
-from ddgpt.rules.extractor_disagreement import ExtractorDisagreementRule
-from ddgpt.rules.irr_mention_conflict import IRRMentionConflictRule
+from ddgpt.rules.registry import build_rules  # re-exported; defined alongside the rules
+from ddgpt.copilot.ic_copilot import ICCopilot
 from ddgpt.pipeline.orchestrator import DiligencePipeline
 
 def build_extractors(cfg):
@@ -17,12 +14,27 @@ def build_extractors(cfg):
     extractors = []
     if cfg.run.use_cohere and os.getenv("CO_API_KEY"):
         extractors.append(
-            CohereExtractor(cfg.model.model, cfg.model.temperature, prompt_text)
+            CohereExtractor(
+                cfg.model.model,
+                cfg.model.temperature,
+                prompt_text,
+                max_concurrency=cfg.model.max_concurrent_chunks,
+                max_in_flight=cfg.model.max_in_flight,
+                latency_target_s=cfg.model.latency_target_s,
+            )
         )
 
     if cfg.ollama.enabled and ollama_is_available(cfg.ollama.host):
         extractors.append(
-            OllamaExtractor(cfg.ollama.model, cfg.ollama.temperature, prompt_text, host=cfg.ollama.host)
+            OllamaExtractor(
+                cfg.ollama.model,
+                cfg.ollama.temperature,
+                prompt_text,
+                host=cfg.ollama.host,
+                max_concurrency=cfg.ollama.max_concurrent_chunks,
+                max_in_flight=cfg.ollama.max_in_flight,
+                latency_target_s=cfg.ollama.latency_target_s,
+            )
         )
 
     extractors.append(RegexExtractor())
@@ -55,21 +67,18 @@ def build_chart_extractor(cfg):
         temperature=cfg.vision.temperature,
         dpi=cfg.vision.dpi,
         max_pages=cfg.vision.max_pages,
+        max_in_flight=cfg.vision.max_in_flight,
+        max_concurrent_pages=cfg.vision.max_concurrent_pages,
+        latency_target_s=cfg.vision.latency_target_s,
     )
 
 
-def build_rules(cfg):
-    return [
-        NumericMismatchRule(
-            cfg.rules.aum_tolerance_pct,
-            cfg.rules.mgmt_fee_abs_pct,
-            cfg.rules.target_irr_abs_pct
-        ),
-        DefinitionDriftRule(),
-        InternalInconsistencyRule(),
-        ExtractorDisagreementRule(),
-        IRRMentionConflictRule(cfg.rules.internal_irr_mention_tolerance_pct),
-    ]
+def build_copilot(cfg):
+    return ICCopilot(
+        model=cfg.model.model,
+        max_in_flight=cfg.model.max_in_flight,
+        latency_target_s=cfg.model.latency_target_s,
+    )
 
 
 def extractor_availability(cfg) -> dict:
@@ -117,4 +126,8 @@ def build_pipeline(cfg, extractors, rules, chart_extractor=None) -> DiligencePip
         chart_extractor=chart_extractor,
         cache_dir=cfg.run.cache_dir,
         enable_disk_cache=cfg.run.enable_disk_cache,
+        concurrent_extractors=cfg.run.concurrent_extractors,
+        document_workers=cfg.run.document_workers,
+        copilot=build_copilot(cfg),
+        llm_page_token_budget=cfg.run.llm_page_token_budget,
     )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ddgpt.provenance.audit import build_ingestion_record
+from ddgpt.utils.cache import content_hash
+from ddgpt.utils.hashing import file_fingerprint
+
+logger = logging.getLogger("ddgpt")
+
+CHECKPOINT_DIR = "checkpoint"
+CHECKPOINT_STATE_FILE = "checkpoint.json"
+
+# Bump when the checkpoint layout changes; older checkpoints are then
+# discarded rather than resumed from.
+CHECKPOINT_VERSION = "2"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+class RunCheckpoint:
+    """Progress of one run into <out>/checkpoint/, saved as it happens so a
+    run killed partway (OOM, Ollama crash, Ctrl-C) can pick up where it
+    stopped:
+
+      checkpoint.json   version and documents_key, written once
+      doc_<hash>.json   one per finished document, written as soon as it
+                        finishes: its input path, file fingerprint, audit
+                        ingestion record and verified extraction
+      stage_<name>.json output of a completed whole-run stage (e.g. the
+                        memo) and the stage key it was computed under
+
+    Each file is written once, atomically, so saving a document costs the
+    same however many came before it, and a file is either complete or
+    absent.
+
+    Documents are keyed on the input path the caller loaded them from (not
+    LoadedDocument.path, which for a cached load is wherever the file was
+    when it was first loaded). documents_key covers everything extraction
+    depends on except the input files themselves (config, prompts, code); a
+    checkpointed document is reused only under the same documents_key and
+    while its file's content is unchanged. stage_keys are the stage
+    manifest's keys (see ddgpt.pipeline.stage_manifest), which cover every
+    input, so a stage is only reused for exactly the same document set.
+
+    Opened with resume=False, any earlier checkpoint is discarded. Safe to
+    save documents from several threads at once."""
+
+    def __init__(self, out_path: Path, documents_key: str, stage_keys: Dict[str, str], resume: bool = False):
+        self.dir = Path(out_path) / CHECKPOINT_DIR
+        self.documents_key = documents_key
+        self.stage_keys = stage_keys
+        self._lock = threading.Lock()
+        self._started = False
+
+        if resume and self._resumable():
+            self._started = True
+        elif self.dir.exists():
+            shutil.rmtree(self.dir)
+
+    def _resumable(self) -> bool:
+        path = self.dir / CHECKPOINT_STATE_FILE
+        if not path.exists():
+            return False
+        state = _read_json(path)
+        if not isinstance(state, dict):
+            logger.warning(f"ignoring unreadable checkpoint {path}")
+            return False
+        if state.get("version") != CHECKPOINT_VERSION:
+            return False
+        if state.get("documents_key") != self.documents_key:
+            logger.warning(f"not resuming from {self.dir}: config, prompts or code changed since it was written")
+            return False
+        return True
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self.dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.dir / CHECKPOINT_STATE_FILE, json.dumps(
+                {"version": CHECKPOINT_VERSION, "documents_key": self.documents_key}
+            ))
+            self._started = True
+
+    # --- documents
+
+    @staticmethod
+    def _document_file(path: str) -> str:
+        return f"doc_{content_hash(path)[:16]}.json"
+
+    def _entry(self, path: str) -> Optional[dict]:
+        if not self._started or not Path(path).exists():
+            return None
+        entry = _read_json(self.dir / self._document_file(path))
+        if not isinstance(entry, dict) or entry.get("path") != path:
+            return None
+        if entry.get("fingerprint") != file_fingerprint(path):
+            return None
+        return entry
+
+    def document(self, path: str) -> Optional[dict]:
+        """The checkpointed extraction for input `path`, or None if it has
+        none or the file has changed since."""
+        entry = self._entry(path)
+        return entry["document"] if entry else None
+
+    def completed(self, paths: List[str]) -> List[str]:
+        """The paths, in order, whose extraction can be resumed."""
+        return [p for p in paths if self._entry(p) is not None]
+
+    def ingestion(self, paths: List[str]) -> Dict[str, Any]:
+        """Audit ingestion records, by doc_name, saved alongside these
+        documents (see build_ingestion_record)."""
+        entries = [self._entry(p) for p in paths]
+        return {e["doc_name"]: e["ingestion"] for e in entries if e}
+
+    def save_document(self, path: str, doc, extracted_doc: dict) -> None:
+        """Record the verified extraction of `doc`, loaded from input
+        `path`."""
+        if not Path(path).exists():
+            # Nothing left to key a resume on (e.g. removed mid-run).
+            return
+        self._start()
+        _write_atomic(self.dir / self._document_file(path), json.dumps({
+            "path": path,
+            "fingerprint": file_fingerprint(path),
+            "doc_name": doc.doc_name,
+            "ingestion": build_ingestion_record([doc])[doc.doc_name],
+            "document": extracted_doc,
+        }))
+
+    # --- stages
+
+    def stage(self, name: str) -> Any:
+        """Saved output of `name` if it completed under the current key."""
+        if not self._started:
+            return None
+        entry = _read_json(self.dir / f"stage_{name}.json")
+        if not isinstance(entry, dict) or entry.get("key") != self.stage_keys.get(name):
+            return None
+        return entry.get("output")
+
+    def save_stage(self, name: str, output: Any) -> None:
+        self._start()
+        _write_atomic(self.dir / f"stage_{name}.json",
+                      json.dumps({"key": self.stage_keys.get(name), "output": output}))
+
+    def remove(self) -> None:
+        """Drop the checkpoint once the run's outputs are written."""
+        shutil.rmtree(self.dir, ignore_errors=True)
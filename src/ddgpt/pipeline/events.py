@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PipelineEvent(BaseModel):
+    """Progress event yielded by DiligencePipeline.run_iter. `event` names
+    the subclass, so a consumer can dispatch on it or on isinstance."""
+    event: str
+    at: float = Field(default_factory=time.time)
+
+
+class DocumentLoaded(PipelineEvent):
+    event: Literal["document_loaded"] = "document_loaded"
+    doc_name: str
+    path: str
+    pages: int
+    # Time spent producing this document from the input iterable: ~0 for
+    # an already-loaded list, the load itself for a lazy one.
+    duration_s: float
+
+
+class ExtractorFinished(PipelineEvent):
+    event: Literal["extractor_finished"] = "extractor_finished"
+    doc_name: str
+    extractor: str
+    duration_s: float
+
+
+class DocumentVerified(PipelineEvent):
+    event: Literal["document_verified"] = "document_verified"
+    doc_name: str
+    document: Dict[str, Any]  # the verified ExtractedDoc, as in result["extracted"]
+    duration_s: Optional[float] = None  # None when resumed
+    extractor_timings: Dict[str, float] = {}
+    resumed: bool = False  # taken from a checkpoint rather than extracted
+
+
+class RulesDone(PipelineEvent):
+    event: Literal["rules_done"] = "rules_done"
+    flags: List[Dict[str, Any]]
+    risk_score: float
+    recommendation: Dict[str, Any]
+    timings: Dict[str, Any]  # the run's timings so far
+
+
+class MemoReady(PipelineEvent):
+    event: Literal["memo_ready"] = "memo_ready"
+    memo: str
+    timings: Dict[str, Any]
+
+
+class RunComplete(PipelineEvent):
+    event: Literal["run_complete"] = "run_complete"
+    result: Dict[str, Any]  # what DiligencePipeline.run returns
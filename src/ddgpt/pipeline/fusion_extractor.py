@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from pathlib import Path
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from ddgpt.extract.tables.financial_table_parser import FinancialTableParser
 from ddgpt.pipeline.scoring import compute_agreement
@@ -8,8 +10,11 @@ from ddgpt.provenance.evidence import Evidence
 from ddgpt.layout.definitions import infer_irr_basis
 from ddgpt.layout.irr_mentions import find_irr_mentions
 from ddgpt.extract.schemas import DefinitionContext
+from ddgpt.io.page_index import PageIndex
+from ddgpt.extract.page_selection import select_pages
 from ddgpt.utils.redaction import redact_pages
 from ddgpt.utils.cache import disk_cached, content_hash
+from ddgpt.utils.hashing import file_fingerprint
 
 DEFAULT_EXTRACTOR_WEIGHTS = {
     "RegexExtractor": 0.95,
@@ -23,6 +28,10 @@ DEFAULT_EXTRACTOR_WEIGHTS = {
 # mismatch flags.
 DISAGREEMENT_THRESHOLD = 0.85
 
+# Key under which chart extraction latency is recorded alongside the
+# per-extractor timings.
+CHART_TIMING_KEY = "VisionChartExtractor"
+
 TABLE_METRIC_FIELDS = {
     "aum": "aum",
     "tvpi": "tvpi",
@@ -31,7 +40,8 @@ TABLE_METRIC_FIELDS = {
 
 class FusionExtractor:
     def __init__(self, extractors, extractor_weights=None, extractor_default_weight=0.50,
-                 cache_dir=None, enable_disk_cache=False, chart_extractor=None):
+                 cache_dir=None, enable_disk_cache=False, chart_extractor=None, concurrent_extractors=False,
+                 llm_page_token_budget=None):
         self.extractors = extractors
 
         self.table_parser = FinancialTableParser()
@@ -43,21 +53,116 @@ class FusionExtractor:
         self.cache_dir = cache_dir
         self.enable_disk_cache = enable_disk_cache and cache_dir is not None
 
-    def extract(self, doc_name, pages, tables, layout=None, redact_for_llm=False, path=None):
-        results = []
-
-        redacted_pages = redact_pages(pages) if redact_for_llm else pages
-
+        # Every extractor (and chart extraction) is independent of the
+        # others -- a Cohere round-trip, a local Ollama generation and a regex
+        # pass -- so in concurrent mode each runs on its own worker and the
+        # document costs roughly its slowest extractor, not their sum.
+        self.concurrent_extractors = concurrent_extractors
+
+        # When set, LLM-backed extractors only see the highest-scoring pages
+        # that fit in this many (estimated) tokens -- see page_selection.
+        # Regex and table extraction always see every page.
+        self.llm_page_token_budget = llm_page_token_budget
+
+    def extract(self, doc_name, pages, tables, layout=None, redact_for_llm=False, path=None, chart_pages=None,
+                timings=None, page_index=None, on_extractor_finished=None):
+        """timings, if given, is filled with {extractor_name: latency_s} for
+        every extractor that ran (plus CHART_TIMING_KEY for chart extraction).
+        page_index, if given, is the caller's PageIndex over `pages`, reused
+        for the post-extraction page scans instead of building another.
+        on_extractor_finished(name, latency_s), if given, is called as each
+        of those finishes, from the thread that ran it."""
+        timings = timings if timings is not None else {}
+        page_index = PageIndex.of(page_index if page_index is not None else pages)
+
+        llm_pages = redact_pages(pages) if redact_for_llm else pages
+
+        page_selection = None
+        if self.llm_page_token_budget is not None and any(
+            getattr(e, "IS_LLM_BACKED", False) for e in self.extractors
+        ):
+            # Scored on the original text; redaction doesn't change which
+            # pages carry financial signal.
+            selected, page_selection = select_pages(page_index, layout, self.llm_page_token_budget)
+            selected = set(selected)
+            llm_pages = [p for p in llm_pages if p.page_num in selected]
+
+        jobs = []
         for extractor in self.extractors:
             is_llm_backed = getattr(extractor, "IS_LLM_BACKED", False)
-            extractor_pages = redacted_pages if is_llm_backed else pages
-
-            doc = self._extract_with_cache(extractor, doc_name, extractor_pages)
+            extractor_pages = llm_pages if is_llm_backed else pages
+            jobs.append((extractor, extractor_pages))
+
+        # Page images can't be redacted (see below), so charts never run then.
+        run_charts = self.chart_extractor is not None and path is not None and not redact_for_llm
+
+        if self.concurrent_extractors and len(jobs) + run_charts > 1:
+            with ThreadPoolExecutor(max_workers=len(jobs) + 1) as pool:
+                # Charts are submitted first: usually the slowest job, and only
+                # needed after reconciliation.
+                chart_future = (
+                    pool.submit(self._timed, timings, CHART_TIMING_KEY,
+                                self._extract_charts_with_cache, doc_name, path, chart_pages,
+                                on_finished=on_extractor_finished)
+                    if run_charts else None
+                )
+                futures = [
+                    (extractor.__class__.__name__,
+                     pool.submit(self._timed, timings, extractor.__class__.__name__,
+                                 self._extract_with_cache, extractor, doc_name, extractor_pages,
+                                 on_finished=on_extractor_finished))
+                    for extractor, extractor_pages in jobs
+                ]
+                results = [(name, future.result()) for name, future in futures]
+
+                base = self._finish(results, doc_name, page_index, tables, layout)
+                chart_extractions = chart_future.result() if chart_future is not None else None
+        else:
+            results = [
+                (extractor.__class__.__name__,
+                 self._timed(timings, extractor.__class__.__name__,
+                             self._extract_with_cache, extractor, doc_name, extractor_pages,
+                             on_finished=on_extractor_finished))
+                for extractor, extractor_pages in jobs
+            ]
+
+            base = self._finish(results, doc_name, page_index, tables, layout)
+            chart_extractions = (
+                self._timed(timings, CHART_TIMING_KEY, self._extract_charts_with_cache, doc_name, path, chart_pages,
+                            on_finished=on_extractor_finished)
+                if run_charts else None
+            )
 
-            results.append(
-                (extractor.__class__.__name__, doc)
+        if self.chart_extractor is not None and path is not None and redact_for_llm:
+            # Unlike text (redact_pages), a page image can't be selectively
+            # redacted before sending it to a vision model -- skip the
+            # extractor entirely rather than leak whatever sensitive text
+            # is rendered into the chart/page image.
+            base.notes.append(
+                "Chart/graph extraction skipped: redact_before_llm is enabled and page "
+                "images cannot be redacted the way text can."
             )
+        elif chart_extractions is not None:
+            base.chart_extractions = chart_extractions
 
+        base.llm_page_selection = page_selection
+
+        return base
+
+    @staticmethod
+    def _timed(timings, name, fn, *args, on_finished=None):
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        finally:
+            timings[name] = round(time.perf_counter() - start, 3)
+        if on_finished is not None:
+            on_finished(name, timings[name])
+        return result
+
+    def _finish(self, results, doc_name, page_index, tables, layout):
+        """Reconciliation plus every post-extraction step that only needs the
+        text extractors' results (not chart extraction)."""
         base = self._reconcile(results)
 
         table_metrics = self.table_parser.parse_metrics(tables)
@@ -87,45 +192,34 @@ class FusionExtractor:
                     f"with linked footnote(s): {'; '.join(entry['footnotes'])}"
                 )
 
-        base.net_irr_basis = self._build_definition_context(pages, layout)
-        base.irr_mentions = find_irr_mentions(pages)
+        base.net_irr_basis = self._build_definition_context(page_index, layout)
+        base.irr_mentions = find_irr_mentions(page_index)
 
         if layout is not None:
             base.sections_detected = layout.canonical_types_found()
 
-        if self.chart_extractor is not None and path is not None:
-            if redact_for_llm:
-                # Unlike text (redact_pages), a page image can't be selectively
-                # redacted before sending it to a vision model -- skip the
-                # extractor entirely rather than leak whatever sensitive text
-                # is rendered into the chart/page image.
-                base.notes.append(
-                    "Chart/graph extraction skipped: redact_before_llm is enabled and page "
-                    "images cannot be redacted the way text can."
-                )
-            else:
-                base.chart_extractions = self._extract_charts_with_cache(doc_name, path)
-
         return base
 
-    def _extract_charts_with_cache(self, doc_name, path):
+    def _extract_charts_with_cache(self, doc_name, path, page_numbers=None):
         if not self.enable_disk_cache:
-            return self.chart_extractor.extract_charts(doc_name, path)
+            return self.chart_extractor.extract_charts(doc_name, path, page_numbers=page_numbers)
 
-        file_bytes = Path(path).read_bytes()
         key = content_hash(
             "VisionChartExtractor",
             str(getattr(self.chart_extractor, "model", "")),
             str(getattr(self.chart_extractor, "prompt_text", "")),
-            file_bytes,
+            str(page_numbers),
+            file_fingerprint(path),
         )
 
-        return disk_cached(
+        # Cached values can be shared with later lookups (in-memory tier);
+        # hand back a private copy since the caller attaches it to its doc.
+        return copy.deepcopy(disk_cached(
             self.cache_dir,
             "chart_extractions",
             key,
-            lambda: self.chart_extractor.extract_charts(doc_name, path),
-        )
+            lambda: self.chart_extractor.extract_charts(doc_name, path, page_numbers=page_numbers),
+        ))
 
     def _extract_with_cache(self, extractor, doc_name, pages):
         """Caches per-extractor results on disk, keyed on extractor class +
@@ -145,12 +239,14 @@ class FusionExtractor:
             page_blob,
         )
 
+        # _reconcile mutates the winning doc in place; never let that reach
+        # the shared (in-memory tier) cached instance.
         return disk_cached(
             self.cache_dir,
             "extractions",
             key,
             lambda: extractor.extract(doc_name, pages),
-        )
+        ).model_copy(deep=True)
 
     def _build_definition_context(self, pages, layout):
         context = infer_irr_basis(pages, layout)
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
+import copy
 import logging
+import queue
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator
 
 from ddgpt.pipeline.fusion_extractor import FusionExtractor
 from ddgpt.extract.postprocess import verify_and_score
+from ddgpt.io.page_index import PageIndex
 from ddgpt.risk.engine import RiskEngine
 from ddgpt.copilot.ic_copilot import ICCopilot
 from ddgpt.copilot.recommendation_engine import determine_recommendation
 from ddgpt.config import TrustConfig
+from ddgpt.pipeline.events import (
+    DocumentLoaded, DocumentVerified, ExtractorFinished, MemoReady, PipelineEvent, RulesDone, RunComplete,
+)
 
 logger = logging.getLogger("ddgpt")
 
+def _drain(events: "queue.Queue", block: bool):
+    """Yield queued events until the queue is empty (block=False) or until
+    one document's extraction has ended (block=True). An ended extraction
+    shows up in the queue as its Future, after all of its events; returns
+    how many ended meanwhile, and raises the first that failed."""
+    finished = 0
+    while True:
+        try:
+            event = events.get(block=block)
+        except queue.Empty:
+            return finished
+        if isinstance(event, Future):
+            finished += 1
+            event.result()  # re-raises the extraction's exception
+            if block:
+                return finished
+            continue
+        yield event
+
+
 class DiligencePipeline:
     def __init__(self, extractors, rules, trust_config: TrustConfig | None = None, redact_before_llm: bool = False,
-                 cache_dir: str | None = None, enable_disk_cache: bool = False, chart_extractor=None):
+                 cache_dir: str | None = None, enable_disk_cache: bool = False, chart_extractor=None,
+                 concurrent_extractors: bool = False, document_workers: int = 1, copilot=None,
+                 llm_page_token_budget: int | None = None):
         trust_config = trust_config or TrustConfig()
 
         self.extractor = FusionExtractor(
@@ -24,76 +54,225 @@ class DiligencePipeline:
             cache_dir=cache_dir,
             enable_disk_cache=enable_disk_cache,
             chart_extractor=chart_extractor,
+            concurrent_extractors=concurrent_extractors,
+            llm_page_token_budget=llm_page_token_budget,
         )
 
         self.authority_weights = trust_config.authority_weights
         self.authority_default_weight = trust_config.authority_default_weight
         self.redact_before_llm = redact_before_llm
+        self.document_workers = document_workers
 
         self.risk_engine = RiskEngine(rules)
 
-        self.copilot = ICCopilot()
+        self.copilot = copilot or ICCopilot()
+
+    def run(self, docs, risk_state_path=None, checkpoint=None, paths=None):
+        """Extraction, rules and memo for the loaded documents. With a
+        RunCheckpoint (ddgpt.pipeline.checkpoint), each document's verified
+        extraction and the rules/memo outputs are saved as they complete,
+        and whatever the checkpoint already holds is reused (documents are
+        keyed on their input path in `paths`, in the same order as `docs`,
+        or doc.path without it; see extract_document)."""
+        for event in self.run_iter(docs, risk_state_path=risk_state_path, checkpoint=checkpoint, paths=paths):
+            pass
+        return event.result
 
-    def run(self, docs):
-        timings = {"per_document_s": {}}
+    def run_iter(self, docs, risk_state_path=None, checkpoint=None, paths=None) -> Iterator[PipelineEvent]:
+        """run(), as a stream of events (see ddgpt.pipeline.events): a
+        DocumentLoaded per document as it is taken from `docs`, then
+        ExtractorFinished/DocumentVerified as each document's extraction
+        progresses, RulesDone, MemoReady and finally RunComplete with run()'s
+        result.
+
+        `docs` may be any iterable, including a generator that loads each
+        document on demand: documents are extracted (on up to
+        document_workers threads) while the next ones are still loading.
+        At most one document more than document_workers is taken from `docs`
+        ahead of its extraction finishing, so a lazy loader doesn't run
+        ahead and hold the whole data room in memory. Extraction always runs on a
+        pool thread, even with document_workers=1. Events are yielded on the
+        caller's thread; an extraction failure is raised from the generator
+        as soon as it is seen, without loading further documents. `paths`,
+        like `docs` any iterable, is consumed alongside it."""
+        timings = {"per_document_s": {}, "per_extractor_s": {}}
         run_start = time.perf_counter()
+        events: "queue.Queue" = queue.Queue()
+        workers = max(1, self.document_workers)
 
-        extracted = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = []
+            finished = 0
+            docs = iter(docs)
+            paths = iter(paths) if paths is not None else None
+            while True:
+                t0 = time.perf_counter()
+                doc = next(docs, None)
+                if doc is None:
+                    break
+                path = next(paths) if paths is not None else None
+                yield DocumentLoaded(doc_name=doc.doc_name, path=doc.path, pages=len(doc.pages),
+                                     duration_s=round(time.perf_counter() - t0, 3))
+                # Backpressure: this document waits for a free worker, and
+                # the next isn't loaded until it has one.
+                while len(futures) - finished >= workers:
+                    finished += yield from _drain(events, block=True)
+                future = pool.submit(self.extract_document, doc, timings, checkpoint, emit=events.put, path=path)
+                future.add_done_callback(events.put)
+                futures.append(future)
+                finished += yield from _drain(events, block=False)
 
-        for doc in docs:
-            doc_start = time.perf_counter()
+            while finished < len(futures):
+                finished += yield from _drain(events, block=True)
+            # In input order, whichever document finished first.
+            extracted = [future.result() for future in futures]
 
-            extracted_doc = self.extractor.extract(
-                doc.doc_name,
-                doc.pages,
-                doc.tables,
-                doc.layout,
-                redact_for_llm=self.redact_before_llm,
-                path=doc.path,
-            )
+        timings["extraction_total_s"] = round(sum(timings["per_document_s"].values()), 3)
+        timings["extraction_wall_s"] = round(time.perf_counter() - run_start, 3)
 
-            extracted_doc = verify_and_score(
-                extracted_doc,
-                doc.pages,
-                authority_weights=self.authority_weights,
-                authority_default_weight=self.authority_default_weight
-            )
+        rules_output = checkpoint.stage("rules") if checkpoint else None
+        if rules_output is None:
+            flags, risk_score = self.evaluate_risk(extracted, timings, risk_state_path=risk_state_path)
+            if checkpoint:
+                checkpoint.save_stage("rules", {"flags": flags, "risk_score": risk_score})
+        else:
+            flags, risk_score = rules_output["flags"], rules_output["risk_score"]
 
-            extracted.append(
-                extracted_doc.dict()
-            )
+        recommendation = determine_recommendation(flags)
+        yield RulesDone(flags=flags, risk_score=risk_score, recommendation=recommendation, timings=copy.deepcopy(timings))
 
-            doc_duration = time.perf_counter() - doc_start
-            timings["per_document_s"][doc.doc_name] = round(doc_duration, 3)
-            logger.info(f"stage=extraction doc={doc.doc_name} duration_s={doc_duration:.3f}")
+        memo = checkpoint.stage("memo") if checkpoint else None
+        if memo is None:
+            memo = self.generate_memo(extracted, flags, recommendation, timings)
+            if checkpoint:
+                checkpoint.save_stage("memo", memo)
+        yield MemoReady(memo=memo, timings=copy.deepcopy(timings))
+
+        timings["total_s"] = round(time.perf_counter() - run_start, 3)
+
+        yield RunComplete(result={
+            "extracted": extracted,
+            "flags": flags,
+            "risk_score": risk_score,
+            "recommendation": recommendation,
+            "ic_memo": memo,
+            "timings": timings
+        })
+
+    # The stages run() chains together, exposed separately so a caller
+    # with an unchanged stage's output on hand (see
+    # ddgpt.pipeline.stage_manifest) can start further down the chain.
+
+    def extract_documents(self, docs, timings, checkpoint=None, emit=None, paths=None):
+        """Extraction + verification of every document, as dicts in input
+        order; records per-document/per-extractor timings into `timings`.
+        See extract_document for `checkpoint`, `emit` and `paths` (the
+        input path of each document, in the same order)."""
+        paths = paths or [None] * len(docs)
+        timings.setdefault("per_document_s", {})
+        timings.setdefault("per_extractor_s", {})
+        start = time.perf_counter()
+
+        if self.document_workers > 1 and len(docs) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.document_workers, len(docs))) as pool:
+                # map() yields in input order, so `extracted` is stable
+                # regardless of which document finishes first.
+                extracted = list(pool.map(
+                    lambda doc, path: self.extract_document(doc, timings, checkpoint, emit, path=path), docs, paths
+                ))
+        else:
+            extracted = [self.extract_document(doc, timings, checkpoint, emit, path=path)
+                         for doc, path in zip(docs, paths)]
 
         timings["extraction_total_s"] = round(sum(timings["per_document_s"].values()), 3)
+        timings["extraction_wall_s"] = round(time.perf_counter() - start, 3)
+        return extracted
+
+    def extract_document(self, doc, timings, checkpoint=None, emit=None, path=None):
+        """Extraction + verification for one document, as a dict; records its
+        per-document/per-extractor timings into `timings`. Safe to call for
+        several documents at once, including with a shared `timings`. A
+        document already in `checkpoint` is returned from it as-is;
+        otherwise the result is saved there before returning, keyed on
+        `path`, the input path the caller loaded doc from (doc.path if not
+        given, which for a cached load may be stale). emit, if given, is
+        called (from this thread) with an ExtractorFinished per extractor and
+        a DocumentVerified at the end."""
+        path = path or doc.path
+        if checkpoint is not None:
+            resumed = checkpoint.document(path)
+            if resumed is not None:
+                if emit:
+                    emit(DocumentVerified(doc_name=doc.doc_name, document=resumed, resumed=True))
+                return resumed
 
+        on_extractor_finished = None
+        if emit:
+            def on_extractor_finished(name, duration_s):
+                emit(ExtractorFinished(doc_name=doc.doc_name, extractor=name, duration_s=duration_s))
+
+        extracted_doc, doc_duration, extractor_timings = self._extract_document(doc, on_extractor_finished)
+        timings.setdefault("per_document_s", {})[doc.doc_name] = round(doc_duration, 3)
+        timings.setdefault("per_extractor_s", {})[doc.doc_name] = extractor_timings
+        if checkpoint is not None:
+            checkpoint.save_document(path, doc, extracted_doc)
+        if emit:
+            emit(DocumentVerified(doc_name=doc.doc_name, document=extracted_doc,
+                                  duration_s=round(doc_duration, 3), extractor_timings=extractor_timings))
+        return extracted_doc
+
+    def evaluate_risk(self, extracted, timings, risk_state_path=None):
+        """Flags (as dicts) and risk score for the extracted documents."""
         t0 = time.perf_counter()
-        flags, risk_score = self.risk_engine.evaluate(extracted)
+        flags, risk_score = self.risk_engine.evaluate(extracted, state_path=risk_state_path)
         timings["risk_rules_s"] = round(time.perf_counter() - t0, 3)
         logger.info(f"stage=risk_rules duration_s={timings['risk_rules_s']:.3f} flags={len(flags)} risk_score={risk_score:.3f}")
+        return [f.dict() for f in flags], risk_score
 
-        recommendation = determine_recommendation(
-            [f.dict() for f in flags]
-        )
-
+    def generate_memo(self, extracted, flags, recommendation, timings):
         t1 = time.perf_counter()
         memo = self.copilot.generate(
             extracted,
-            [f.dict() for f in flags],
+            flags,
             recommendation=recommendation
         )
         timings["memo_generation_s"] = round(time.perf_counter() - t1, 3)
         logger.info(f"stage=memo_generation duration_s={timings['memo_generation_s']:.3f}")
+        return memo
 
-        timings["total_s"] = round(time.perf_counter() - run_start, 3)
+    def _extract_document(self, doc, on_extractor_finished=None):
+        """(extracted doc dict, duration, per-extractor timings) for one
+        document; safe to run on several documents at once (see
+        document_workers)."""
+        doc_start = time.perf_counter()
+        extractor_timings = {}
+        # Shared by the extractor's page scans and evidence verification.
+        page_index = PageIndex(doc.pages)
 
-        return {
-            "extracted": extracted,
-            "flags": [f.dict() for f in flags],
-            "risk_score": risk_score,
-            "recommendation": recommendation,
-            "ic_memo": memo,
-            "timings": timings
-        }
+        extracted_doc = self.extractor.extract(
+            doc.doc_name,
+            doc.pages,
+            doc.tables,
+            doc.layout,
+            redact_for_llm=self.redact_before_llm,
+            path=doc.path,
+            chart_pages=doc.chart_candidate_pages(),
+            timings=extractor_timings,
+            page_index=page_index,
+            on_extractor_finished=on_extractor_finished,
+        )
+
+        extracted_doc = verify_and_score(
+            extracted_doc,
+            page_index,
+            authority_weights=self.authority_weights,
+            authority_default_weight=self.authority_default_weight
+        )
+
+        doc_duration = time.perf_counter() - doc_start
+        logger.info(
+            f"stage=extraction doc={doc.doc_name} duration_s={doc_duration:.3f} "
+            f"extractor_latency_s={extractor_timings}"
+        )
+
+        return extracted_doc.dict(), doc_duration, extractor_timings
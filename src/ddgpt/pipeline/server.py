@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger("ddgpt")
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+TERMINAL_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+# Seconds an event stream waits for news before sending an SSE comment,
+# so idle proxies and clients don't drop a long-running job's stream.
+STREAM_KEEPALIVE_S = 15.0
+
+# run_job(pipeline, job, emit) does the work for one job, writing its
+# artifacts into job.out_dir, and returns a short summary for the status
+# endpoint; emit(name, **data) adds a progress event to the job's stream.
+RunJob = Callable[[Any, "Job", Callable[..., None]], Dict[str, Any]]
+
+
+class QueueFull(Exception):
+    pass
+
+
+class Job:
+    """One submitted document set. Status changes are appended to `events`
+    under the manager's condition so event streams can wait on them."""
+
+    def __init__(self, paths: List[str], jobs_dir: Path):
+        self.id = uuid.uuid4().hex[:12]
+        self.paths = paths
+        self.out_dir = jobs_dir / self.id
+        self.status = JOB_QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.summary: Dict[str, Any] = {}
+        self.events: List[Dict[str, Any]] = []
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def artifacts(self) -> List[str]:
+        if not self.out_dir.exists():
+            return []
+        return sorted(p.name for p in self.out_dir.iterdir() if p.is_file())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "documents": len(self.paths),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "queue_wait_s": round(self.started_at - self.submitted_at, 3) if self.started_at else None,
+            "error": self.error,
+            "summary": self.summary,
+            "artifacts": self.artifacts() if self.done else [],
+        }
+
+
+class JobManager:
+    """Bounded job queue in front of a pool of warm pipelines.
+
+    Every worker thread builds its DiligencePipeline (extractor clients,
+    Ollama reachability probe, rules) once via pipeline_factory at startup
+    and keeps it for every job it runs, so a request only pays for the
+    work itself. Provider calls from all workers still share the process-
+    wide limiters (model.max_in_flight etc.). Submitting past
+    max_queued_jobs raises QueueFull rather than queueing unboundedly.
+    Only the last max_finished_jobs finished jobs are kept in memory; older
+    ones are forgotten (their artifacts stay in jobs_dir)."""
+
+    def __init__(self, pipeline_factory: Callable[[], Any], run_job: RunJob, jobs_dir: Path,
+                 workers: int = 2, max_queued_jobs: int = 16, max_finished_jobs: int = 256):
+        self.run_job = run_job
+        self.jobs_dir = Path(jobs_dir)
+        self.jobs: Dict[str, Job] = {}
+        self.max_finished_jobs = max_finished_jobs
+        self._finished: Deque[str] = deque()  # ids, oldest first
+        self.changed = threading.Condition()
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queued_jobs)
+
+        pipelines = [pipeline_factory() for _ in range(workers)]
+        self._threads = [
+            threading.Thread(target=self._work, args=(pipeline,), name=f"ddgpt-worker-{i}", daemon=True)
+            for i, pipeline in enumerate(pipelines)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, paths: List[str]) -> Job:
+        job = Job(paths, self.jobs_dir)
+        with self.changed:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFull(f"{self._queue.maxsize} jobs already queued") from None
+            self.jobs[job.id] = job
+            self._record(job, JOB_QUEUED, documents=len(paths))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self.jobs.get(job_id)
+
+    def event(self, job: Job, name: str, **data) -> None:
+        with self.changed:
+            self._record(job, name, **data)
+
+    def wait_for_events(self, job: Job, seen: int, timeout: float) -> List[Dict[str, Any]]:
+        """Events after the first `seen`, waiting up to timeout for one."""
+        with self.changed:
+            self.changed.wait_for(lambda: len(job.events) > seen, timeout=timeout)
+            return job.events[seen:]
+
+    def shutdown(self) -> None:
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _record(self, job: Job, name: str, **data) -> None:
+        job.events.append({"event": name, "at": time.time(), **data})
+        self.changed.notify_all()
+
+    def _retire(self, job: Job) -> None:
+        # Called with self.changed held, once job has finished. Streams
+        # already following an evicted job keep their reference to it.
+        self._finished.append(job.id)
+        while len(self._finished) > self.max_finished_jobs:
+            self.jobs.pop(self._finished.popleft(), None)
+
+    def _work(self, pipeline) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self.changed:
+                job.status = JOB_RUNNING
+                job.started_at = time.time()
+                self._record(job, JOB_RUNNING)
+            try:
+                job.out_dir.mkdir(parents=True, exist_ok=True)
+                summary = self.run_job(pipeline, job, lambda name, **data: self.event(job, name, **data))
+            except Exception as e:
+                logger.exception(f"job {job.id} failed")
+                with self.changed:
+                    job.status = JOB_FAILED
+                    job.error = repr(e)
+                    job.finished_at = time.time()
+                    self._record(job, JOB_FAILED, error=job.error)
+                    self._retire(job)
+            else:
+                with self.changed:
+                    job.status = JOB_SUCCEEDED
+                    job.summary = summary
+                    job.finished_at = time.time()
+                    self._record(job, JOB_SUCCEEDED, duration_s=round(job.finished_at - job.started_at, 3))
+                    self._retire(job)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes:
+      GET  /health
+      POST /jobs                      {"paths": [...]} or {"input_dir": "..."}
+      GET  /jobs/<id>                 status
+      GET  /jobs/<id>/events          status changes as Server-Sent Events, until the job ends
+      GET  /jobs/<id>/artifacts/<name>
+    """
+
+    manager: JobManager
+    resolve_paths: Callable[[dict], List[str]]
+
+    def log_message(self, fmt, *args):
+        logger.debug("http " + fmt % args)
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _job(self, job_id: str) -> Optional[Job]:
+        job = self.manager.get(job_id)
+        if job is None:
+            self._send_json(404, {"error": f"unknown job {job_id}"})
+        return job
+
+    def do_GET(self):
+        parts = [p for p in self.path.split("?", 1)[0].split("/") if p]
+        if parts == ["health"]:
+            self._send_json(200, {"status": "ok"})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = self._job(parts[1])
+            if job is not None:
+                self._send_json(200, job.to_dict())
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] == "events":
+            job = self._job(parts[1])
+            if job is not None:
+                self._stream_events(job)
+        elif len(parts) == 4 and parts[0] == "jobs" and parts[2] == "artifacts":
+            job = self._job(parts[1])
+            if job is not None:
+                self._send_artifact(job, parts[3])
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            request = json.loads(self.rfile.read(length) or b"{}")
+            paths = self.resolve_paths(request)
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        try:
+            job = self.manager.submit(paths)
+        except QueueFull as e:
+            self._send_json(503, {"error": str(e)}, headers={"Retry-After": "5"})
+            return
+        self._send_json(202, job.to_dict(), headers={"Location": f"/jobs/{job.id}"})
+
+    def _stream_events(self, job: Job) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        seen = 0
+        while True:
+            events = self.manager.wait_for_events(job, seen, STREAM_KEEPALIVE_S)
+            chunk = "".join(f"event: {e['event']}\ndata: {json.dumps(e)}\n\n" for e in events) or ": keepalive\n\n"
+            seen += len(events)
+            try:
+                self.wfile.write(chunk.encode("utf-8"))
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            if job.done and seen == len(job.events):
+                return
+
+    def _send_artifact(self, job: Job, name: str) -> None:
+        if not job.done or name not in job.artifacts():
+            self._send_json(404, {"error": f"no artifact {name} for job {job.id}"})
+            return
+        body = (job.out_dir / name).read_bytes()
+        self.send_response(200)
+        self.send_header("Content-Type", _content_type(name))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _content_type(name: str) -> str:
+    suffix = Path(name).suffix
+    return {
+        ".json": "application/json",
+        ".md": "text/markdown; charset=utf-8",
+        ".csv": "text/csv; charset=utf-8",
+        ".pdf": "application/pdf",
+        ".log": "text/plain; charset=utf-8",
+    }.get(suffix, "application/octet-stream")
+
+
+def make_server(manager: JobManager, resolve_paths: Callable[[dict], List[str]],
+                host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """HTTP front end for the manager. resolve_paths turns a POST /jobs
+    body into the document paths to process, raising ValueError for a bad
+    request. Call serve_forever() on the result (port 0 picks a free port,
+    see server_address)."""
+    handler = type("DDGPTHandler", (_Handler,), {
+        "manager": manager,
+        "resolve_paths": staticmethod(resolve_paths),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ddgpt import __version__ as ddgpt_version
+from ddgpt.utils.cache import content_hash
+from ddgpt.utils.hashing import file_fingerprint, sha256_file
+
+logger = logging.getLogger("ddgpt")
+
+STAGE_MANIFEST_FILE = "stage_manifest.json"
+
+# Bump when the manifest layout or what a stage key covers changes.
+STAGE_MANIFEST_VERSION = "1"
+
+# Stages of `ddgpt run` in dependency order, and the files in the output
+# directory each one produces. A stage is reusable when its key (which
+# chains in the key of the stage before it) is unchanged and its outputs
+# are still on disk exactly as that run wrote them.
+STAGES = ("extract", "rules", "memo", "report")
+STAGE_OUTPUTS = {
+    "extract": ["extracted.json"],
+    "rules": ["flags.json"],
+    "memo": ["ic_memo.md"],
+    "report": ["facts_table.csv", "ic_memo.pdf"],
+}
+
+# ddgpt subpackages whose source each stage's output depends on -- editing
+# a rule invalidates flags onward, not extraction.
+STAGE_CODE = {
+    "extract": ("extract", "ingestion", "io", "layout", "pipeline"),
+    "rules": ("rules", "risk"),
+    "memo": ("copilot", "report"),
+    "report": ("render", "report"),
+}
+
+# Concurrency and latency knobs: they change how fast a stage runs, never
+# what it produces, so they're left out of the keys.
+_SCHEDULING_FIELDS = {
+    "max_concurrent_chunks", "max_in_flight", "latency_target_s", "max_concurrent_pages", "workers",
+}
+
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _code_hash(packages) -> str:
+    parts = []
+    for package in packages:
+        for path in sorted((_PACKAGE_ROOT / package).rglob("*.py")):
+            parts.append(path.relative_to(_PACKAGE_ROOT).as_posix())
+            parts.append(path.read_bytes())
+    return content_hash(*parts)
+
+
+def _section(model) -> str:
+    return json.dumps(model.model_dump(exclude=_SCHEDULING_FIELDS), sort_keys=True, default=str)
+
+
+def _prompt(cfg, name: str) -> str:
+    path = Path(cfg.run.prompts_dir) / name
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+def stage_keys(cfg, input_paths: List[str], extractor_availability: Dict[str, str]) -> Dict[str, str]:
+    """Dependency key per stage: input file hashes, the config sections and
+    prompt text that stage reads, and its code. Each key includes the one
+    before it, so anything that changes extraction also reruns rules, memo
+    and report, while a RuleConfig tweak leaves extraction's key alone."""
+    from ddgpt.io.loaders import LOADER_CACHE_VERSION  # deferred: imports PyMuPDF
+
+    run = cfg.run
+    extract = content_hash(
+        json.dumps({p: file_fingerprint(p) for p in input_paths}, sort_keys=True),
+        _section(cfg.model),
+        _section(cfg.ollama),
+        _section(cfg.vision),
+        _section(cfg.ocr),
+        _section(cfg.tables),
+        _section(cfg.trust),
+        json.dumps([run.use_cohere, run.enable_ocr, run.redact_before_llm, run.llm_page_token_budget]),
+        _prompt(cfg, run.extract_prompt),
+        _prompt(cfg, cfg.vision.prompt),
+        json.dumps(extractor_availability, sort_keys=True),
+        ddgpt_version,
+        LOADER_CACHE_VERSION,
+        _code_hash(STAGE_CODE["extract"]),
+    )
+    rules = content_hash(extract, _section(cfg.rules), _code_hash(STAGE_CODE["rules"]))
+    memo = content_hash(rules, _prompt(cfg, run.memo_prompt), _code_hash(STAGE_CODE["memo"]))
+    report = content_hash(memo, str(run.enable_pdf_output), _code_hash(STAGE_CODE["report"]))
+    return {"extract": extract, "rules": rules, "memo": memo, "report": report}
+
+
+def load_stage_manifest(out_path: Path) -> dict:
+    path = out_path / STAGE_MANIFEST_FILE
+    if not path.exists():
+        return {}
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"ignoring unreadable stage manifest {path}: {e}")
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != STAGE_MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def reusable_stages(out_path: Path, keys: Dict[str, str], manifest: Optional[dict] = None) -> List[str]:
+    """The leading stages whose recorded key matches `keys` and whose
+    outputs are unchanged on disk; every stage after the first stale one is
+    recomputed, since its inputs come from that stage."""
+    recorded = (manifest if manifest is not None else load_stage_manifest(out_path)).get("stages") or {}
+    reusable = []
+    for stage in STAGES:
+        entry = recorded.get(stage) or {}
+        if entry.get("key") != keys[stage] or not _outputs_intact(out_path, entry.get("outputs") or {}):
+            break
+        reusable.append(stage)
+    return reusable
+
+
+def _outputs_intact(out_path: Path, outputs: Dict[str, str]) -> bool:
+    if not outputs:
+        return False
+    for name, digest in outputs.items():
+        path = out_path / name
+        if not path.exists() or sha256_file(str(path)) != digest:
+            return False
+    return True
+
+
+def write_stage_manifest(out_path: Path, keys: Dict[str, str]) -> None:
+    """Record every stage's key with the hashes of the outputs now on disk;
+    call once all outputs of the run have been written."""
+    stages = {}
+    for stage in STAGES:
+        outputs = {
+            name: sha256_file(str(out_path / name))
+            for name in STAGE_OUTPUTS[stage]
+            if (out_path / name).exists()
+        }
+        stages[stage] = {"key": keys[stage], "outputs": outputs}
+    (out_path / STAGE_MANIFEST_FILE).write_text(
+        json.dumps({"version": STAGE_MANIFEST_VERSION, "stages": stages}, indent=2)
+    )
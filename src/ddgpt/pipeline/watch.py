@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from ddgpt.copilot.recommendation_engine import determine_recommendation
+
+
+class WatchBatch(BaseModel):
+    """One debounced burst of changes to the watched directory."""
+    paths: List[str]  # every file currently in the directory, in listing order
+    changed: List[str]  # new or modified since the last batch
+    removed: List[str]
+    first_seen: float  # wall-clock time the earliest change in the burst was observed
+
+
+class DirectoryWatcher:
+    """Polls a directory listing and groups changes into debounced batches.
+
+    A file counts as changed when it appears or its (size, mtime) differs
+    from the previous poll. A batch is only handed out once nothing has
+    changed for debounce_s, so a data-room upload of many files -- or one
+    large file still being written -- becomes a single refresh instead of
+    one per file (or a refresh on a half-written PDF). The first poll sees
+    every existing file as new."""
+
+    def __init__(self, list_files: Callable[[], List[str]], debounce_s: float = 2.0,
+                 clock: Callable[[], float] = time.time):
+        self.list_files = list_files
+        self.debounce_s = debounce_s
+        self.clock = clock
+        self._seen: Dict[str, Tuple[int, int]] = {}
+        self._pending: Dict[str, float] = {}
+        self._last_change: Optional[float] = None
+
+    def poll(self) -> Optional[WatchBatch]:
+        paths = []
+        current: Dict[str, Tuple[int, int]] = {}
+        for path in self.list_files():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue  # removed between listing and stat
+            paths.append(path)
+            current[path] = (st.st_size, st.st_mtime_ns)
+
+        now = self.clock()
+        changed = [p for p, sig in current.items() if self._seen.get(p) != sig]
+        changed += [p for p in self._seen if p not in current]
+        for path in changed:
+            self._pending.setdefault(path, now)
+        if changed:
+            self._last_change = now
+        self._seen = current
+
+        if not self._pending or now - self._last_change < self.debounce_s:
+            return None
+
+        batch = WatchBatch(
+            paths=paths,
+            changed=[p for p in paths if p in self._pending],
+            removed=sorted(p for p in self._pending if p not in current),
+            first_seen=min(self._pending.values()),
+        )
+        self._pending.clear()
+        return batch
+
+    def retry(self, paths: List[str], first_seen: float) -> None:
+        """Put paths from a batch that failed back into the pending set, so
+        they come round again in a later batch (after another debounce
+        period) even if the files themselves don't change. first_seen is
+        the failed batch's, so arrival_to_flags_s still counts from when the
+        file first showed up."""
+        for path in paths:
+            self._pending[path] = min(self._pending.get(path, first_seen), first_seen)
+        if paths:
+            self._last_change = self.clock()
+
+
+class WatchSession:
+    """Keeps one data room's extraction results in memory across refreshes,
+    so a batch only loads and extracts the documents it touched (through
+    the usual loader/extraction caches) before the rules run over all of
+    them again. A file that fails to load or extract is left out of that
+    refresh without holding up the rest of its batch."""
+
+    def __init__(self, pipeline, load_docs: Callable[[List[str]], list],
+                 risk_state_path=None, clock: Callable[[], float] = time.time):
+        self.pipeline = pipeline
+        self.load_docs = load_docs
+        self.risk_state_path = risk_state_path
+        self.clock = clock
+        self.extracted: Dict[str, dict] = {}
+
+    def refresh(self, batch: WatchBatch) -> dict:
+        """Pipeline result (extracted, flags, risk score, recommendation,
+        timings) for batch.paths; no memo, which stays a `ddgpt run`/`report`
+        step. timings["arrival_to_flags_s"] is measured from batch.first_seen.
+        result["failed"] maps each changed path that couldn't be loaded or
+        extracted to its error; those documents are left out until a later
+        refresh succeeds (see DirectoryWatcher.retry)."""
+        timings: dict = {}
+        start = time.perf_counter()
+        failed: Dict[str, str] = {}
+
+        for path in batch.removed:
+            self.extracted.pop(path, None)
+
+        if batch.changed:
+            docs = self._load(batch.changed, failed)
+            for path, extracted_doc in self._extract(docs, timings, failed).items():
+                self.extracted[path] = extracted_doc
+        for path in failed:
+            self.extracted.pop(path, None)
+
+        extracted = [self.extracted[p] for p in batch.paths if p in self.extracted]
+        flags, risk_score = self.pipeline.evaluate_risk(extracted, timings, risk_state_path=self.risk_state_path)
+
+        timings["total_s"] = round(time.perf_counter() - start, 3)
+        timings["arrival_to_flags_s"] = round(self.clock() - batch.first_seen, 3)
+        return {
+            "extracted": extracted,
+            "flags": flags,
+            "risk_score": risk_score,
+            "recommendation": determine_recommendation(flags),
+            "timings": timings,
+            "failed": failed,
+        }
+
+    # Each step is tried on the whole batch first (one load_docs call keeps
+    # run.load_workers parallelism) and only on an error retried file by
+    # file, to find which ones fail.
+
+    def _load(self, paths: List[str], failed: Dict[str, str]) -> Dict[str, object]:
+        try:
+            return dict(zip(paths, self.load_docs(paths)))
+        except Exception:
+            docs = {}
+            for path in paths:
+                try:
+                    docs[path] = self.load_docs([path])[0]
+                except Exception as e:
+                    failed[path] = repr(e)
+            return docs
+
+    def _extract(self, docs: Dict[str, object], timings: dict, failed: Dict[str, str]) -> Dict[str, dict]:
+        try:
+            return dict(zip(docs, self.pipeline.extract_documents(list(docs.values()), timings)))
+        except Exception:
+            extracted = {}
+            for path, doc in docs.items():
+                try:
+                    extracted[path] = self.pipeline.extract_document(doc, timings)
+                except Exception as e:
+                    failed[path] = repr(e)
+            return extracted
@@ -11,14 +11,14 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 
 from ddgpt import __version__ as ddgpt_version
-from ddgpt.utils.hashing import sha256_file
+from ddgpt.utils.hashing import file_fingerprint, sha256_file
 
 class InputFile(BaseModel):
     path: str
     sha256: str
 
 def build_inputs_manifest(paths: List[str]) -> List[InputFile]:
-    return [InputFile(path=p, sha256=sha256_file(p)) for p in paths]
+    return [InputFile(path=p, sha256=file_fingerprint(p)) for p in paths]
 
 
 def get_git_commit() -> Optional[str]:
@@ -52,6 +52,7 @@ def build_audit_manifest(
     cfg: Any,
     extractor_availability: Dict[str, str],
     result: Dict[str, Any],
+    documents: Optional[List[Any]] = None,
 ) -> Dict[str, Any]:
     """One consolidated, reproducibility-oriented record per run: what code
     and config produced it, what inputs went in, what extractors/models were
@@ -83,5 +84,25 @@ def build_audit_manifest(
         "risk_score": result.get("risk_score"),
         "recommendation": result.get("recommendation"),
         "stage_timings_s": result.get("timings"),
+        "ingestion": build_ingestion_record(documents or []),
+        "llm_page_selection": {
+            d["doc_name"]: d["llm_page_selection"]
+            for d in result.get("extracted", [])
+            if d.get("llm_page_selection") is not None
+        },
         "output_hashes": hash_output_files(output_paths),
     }
+
+
+def build_ingestion_record(documents: List[Any]) -> Dict[str, Any]:
+    """Per-document record of which pages the table backends actually ran
+    on, so a table missing from extraction can be traced to the pre-screen
+    having skipped its page rather than to a backend failure."""
+    record: Dict[str, Any] = {}
+    for doc in documents:
+        screen = getattr(doc, "table_screen", None)
+        record[doc.doc_name] = {
+            "table_pages": screen.candidate_pages if screen else "all",
+            "table_pages_skipped": screen.skipped_pages if screen else [],
+        }
+    return record
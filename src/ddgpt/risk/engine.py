@@ -1,6 +1,9 @@
 import math
-from typing import List
+from pathlib import Path
+from typing import List, Optional
 from ddgpt.rules.base import Rule
+from ddgpt.rules.fact_frame import FactFrame
+from ddgpt.risk.incremental import evaluate_incremental
 
 SEVERITY_WEIGHTS = {
     "RED": 1.0,
@@ -15,10 +18,22 @@ class RiskEngine:
     def __init__(self, rules: List[Rule]):
         self.rules = rules
 
-    def evaluate(self, extracted: List[dict]):
-        flags = []
-        for r in self.rules:
-            flags.extend(r.apply(extracted))
+    def evaluate(self, extracted: List[dict], state_path: Optional[str | Path] = None):
+        """Flags and risk score for the extracted documents.
+
+        With a state_path, per-pair and per-document rule results are kept
+        there between runs and only pairs/documents involving an added or
+        changed document are re-evaluated (see ddgpt.risk.incremental); the
+        flags and score are the same as a full evaluation."""
+        # One columnar view of the documents, shared by every rule; rules
+        # without a columnar implementation just see frame.docs.
+        frame = FactFrame(extracted)
+        if state_path is not None:
+            flags = evaluate_incremental(self.rules, frame, Path(state_path))
+        else:
+            flags = []
+            for r in self.rules:
+                flags.extend(r.apply_frame(frame))
 
         score = self.score_from_severities([f.severity for f in flags])
         return flags, score
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ddgpt.rules.base import Flag, Rule
+from ddgpt.rules.fact_frame import FactFrame
+from ddgpt.utils.cache import content_hash
+
+logger = logging.getLogger("ddgpt")
+
+# Bump when the state layout, or what a fingerprint covers, changes; older
+# state files are then ignored and the next run evaluates in full.
+RISK_STATE_VERSION = "1"
+
+# Name of the state file the CLI keeps in each output directory.
+RISK_STATE_FILE = "risk_state.json"
+
+
+def doc_fingerprint(doc: dict) -> str:
+    """Identity of one extracted document for the risk state: any change to
+    its facts, evidence or name gives a new fingerprint."""
+    return content_hash(json.dumps(doc, sort_keys=True, default=str))
+
+
+def rule_fingerprint(rule: Rule) -> str:
+    """The rule's class, parameters and module source -- a changed tolerance
+    or a code change invalidates that rule's stored results."""
+    module = sys.modules.get(type(rule).__module__)
+    try:
+        source = inspect.getsource(module) if module is not None else ""
+    except (OSError, TypeError):
+        source = ""
+    return content_hash(
+        type(rule).__qualname__,
+        json.dumps(vars(rule), sort_keys=True, default=str),
+        source,
+    )
+
+
+def _pair_key(fp_a: str, fp_b: str) -> str:
+    return f"{fp_a}|{fp_b}"
+
+
+def _dump(flags: List[Flag]) -> List[dict]:
+    return [f.model_dump() for f in flags]
+
+
+def _load(flags: List[dict]) -> List[Flag]:
+    return [Flag(**f) for f in flags]
+
+
+def load_state(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"ignoring unreadable risk state {path}: {e}")
+        return None
+    if not isinstance(state, dict) or state.get("version") != RISK_STATE_VERSION:
+        return None
+    return state
+
+
+def save_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _order_preserved(previous: List[str], current: List[str]) -> bool:
+    """Documents present in both runs are in the same relative order, so a
+    stored "A|B" pair is still visited as (A, B) rather than (B, A)."""
+    known = set(previous)
+    still_here = set(current)
+    return [fp for fp in previous if fp in still_here] == [fp for fp in current if fp in known]
+
+
+def evaluate_incremental(rules: List[Rule], frame: FactFrame, path: Path) -> List[Flag]:
+    """Flags for frame.docs, reusing per-pair and per-document results from
+    the state at `path` for documents already evaluated there and
+    re-evaluating only what involves an added or changed document. Writes
+    the updated state (documents no longer present dropped) back to `path`.
+
+    Produces the same flags, in the same order, as running every rule in
+    full; see Rule.incremental for the contract that makes that hold."""
+    fps = [doc_fingerprint(doc) for doc in frame.docs]
+    if len(set(fps)) != len(fps):
+        # Identical documents twice over can't be keyed by content alone.
+        logger.info("risk state: duplicate documents, evaluating in full")
+        return [f for rule in rules for f in rule.apply_frame(frame)]
+
+    previous = load_state(path) or {}
+    previous_fps = previous.get("documents") or []
+    reusable = _order_preserved(previous_fps, fps)
+    known = set(previous_fps) if reusable else set()
+    involving = [i for i, fp in enumerate(fps) if fp not in known]
+
+    flags: List[Flag] = []
+    rule_states: List[dict] = []
+
+    for index, rule in enumerate(rules):
+        if not rule.incremental:
+            flags.extend(rule.apply_frame(frame))
+            rule_states.append({})
+            continue
+
+        fingerprint = rule_fingerprint(rule)
+        stored_rules = previous.get("rules") or []
+        stored = stored_rules[index] if index < len(stored_rules) else {}
+        if stored.get("fingerprint") == fingerprint and reusable:
+            rule_known, rule_involving = known, involving
+        else:
+            rule_known, rule_involving = set(), None
+            stored = {}
+
+        pair_flags: Dict[Tuple[int, int], List[Flag]] = {}
+        if rule_known:
+            # Only violating pairs are stored; one whose documents are both
+            # still here keeps its flags, anything else was removed.
+            position = {fp: i for i, fp in enumerate(fps)}
+            for key, hit in (stored.get("pairs") or {}).items():
+                fp_a, _, fp_b = key.partition("|")
+                if fp_a in position and fp_b in position:
+                    pair_flags[(position[fp_a], position[fp_b])] = _load(hit)
+        pair_flags.update(rule.pair_flags(frame, rule_involving))
+
+        stored_docs = stored.get("docs") or {}
+        doc_flags = [
+            _load(stored_docs[fp]) if fp in rule_known and fp in stored_docs else rule.doc_flags(doc)
+            for fp, doc in zip(fps, frame.docs)
+        ]
+
+        for pair in sorted(pair_flags):
+            flags.extend(pair_flags[pair])
+        for per_doc in doc_flags:
+            flags.extend(per_doc)
+
+        rule_states.append({
+            "fingerprint": fingerprint,
+            "pairs": {
+                _pair_key(fps[i], fps[j]): _dump(pair)
+                for (i, j), pair in pair_flags.items() if pair
+            },
+            "docs": {fp: _dump(per_doc) for fp, per_doc in zip(fps, doc_flags)},
+        })
+
+    logger.info(
+        f"risk state: {len(fps) - len(involving)} documents reused, {len(involving)} re-evaluated"
+    )
+    save_state(path, {"version": RISK_STATE_VERSION, "documents": fps, "rules": rule_states})
+    return flags
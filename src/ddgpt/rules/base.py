@@ -1,8 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from ddgpt.rules.fact_frame import FactFrame
+
 class Flag(BaseModel):
     severity: str
     type: str
@@ -13,6 +16,29 @@ class Flag(BaseModel):
     question_to_ask: str
 
 class Rule(ABC):
+    # Incremental rules (see RiskEngine.evaluate with a state_path) promise
+    # that apply() over a document list returns exactly
+    #   the pair_flags of every pair (i < j), in pair order, followed by
+    #   the doc_flags of every document, in order
+    # so a changed document only needs its own doc_flags and the pairs it
+    # takes part in recomputed. Other rules are always re-run in full.
+    incremental: bool = False
+
     @abstractmethod
     def apply(self, extracted: List[dict]) -> List[Flag]:
         raise NotImplementedError
+
+    def apply_frame(self, frame: "FactFrame") -> List[Flag]:
+        """What RiskEngine calls: the same flags as apply(frame.docs).
+        Cross-document rules override this to work on the frame's shared
+        columns instead of looping over every pair of dicts."""
+        return self.apply(frame.docs)
+
+    def pair_flags(self, frame: "FactFrame",
+                   involving: Optional[Sequence[int]] = None) -> Dict[Tuple[int, int], List[Flag]]:
+        """Flags per violating pair (i, j), i < j, in pair order; only pairs
+        with a document from `involving` when given."""
+        return {}
+
+    def doc_flags(self, doc: dict) -> List[Flag]:
+        return []
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 from ddgpt.rules.base import Rule, Flag
+from ddgpt.rules.fact_frame import FactFrame, in_pair_order
 from ddgpt.layout.definitions import NET_PATTERNS, GROSS_PATTERNS
 
 
@@ -14,6 +15,10 @@ def _local_basis(snippet: str) -> Optional[str]:
     return None
 
 
+def _doc_basis(doc: dict) -> Optional[str]:
+    return (doc.get("net_irr_basis") or {}).get("basis")
+
+
 class DefinitionDriftRule(Rule):
     """Flags gross-vs-net (and equivalent before/after-fee) convention drift.
 
@@ -26,59 +31,73 @@ class DefinitionDriftRule(Rule):
       disagrees with the convention the same document states elsewhere.
     """
 
+    incremental = True
+
     def apply(self, extracted: List[dict]) -> List[Flag]:
-        flags: List[Flag] = []
-
-        for i in range(len(extracted)):
-            for j in range(i + 1, len(extracted)):
-                A = extracted[i]
-                B = extracted[j]
-                ctx_a = A.get("net_irr_basis")
-                ctx_b = B.get("net_irr_basis")
-                basis_a = (ctx_a or {}).get("basis")
-                basis_b = (ctx_b or {}).get("basis")
-
-                if not basis_a or not basis_b or basis_a == basis_b:
-                    continue
-
-                flags.append(Flag(
-                    severity="YELLOW",
-                    type="IRR_DEFINITION_DRIFT",
-                    docs=f'{A["doc_name"]} vs {B["doc_name"]}',
-                    detail=f'Documents state different IRR return conventions: "{basis_a}" vs "{basis_b}".',
-                    evidence=(
-                        f'{A["doc_name"]} (p.{ctx_a.get("page")}, {ctx_a.get("section") or "n/a"}): "{ctx_a.get("snippet")}" | '
-                        f'{B["doc_name"]} (p.{ctx_b.get("page")}, {ctx_b.get("section") or "n/a"}): "{ctx_b.get("snippet")}"'
-                    ),
-                    why_it_matters="Definition drift can mislead IC comparisons and skew underwriting decisions.",
-                    question_to_ask="Confirm whether IRR reported is net or gross and reconcile to a consistent definition."
-                ))
-
-        for doc in extracted:
-            net_irr = doc.get("net_irr") or {}
-            snippet = ((net_irr.get("evidence") or {}).get("snippet")) or ""
-            local_basis = _local_basis(snippet)
-
-            ctx = doc.get("net_irr_basis")
-            doc_basis = (ctx or {}).get("basis")
-
-            if not local_basis or not doc_basis or local_basis == doc_basis:
-                continue
-
-            flags.append(Flag(
-                severity="YELLOW",
-                type="IRR_DEFINITION_DRIFT_INTERNAL",
-                docs=doc["doc_name"],
-                detail=(
-                    f'The reported IRR figure reads as "{local_basis}" but this document defines its '
-                    f'convention as "{doc_basis}" elsewhere.'
-                ),
-                evidence=(
-                    f'Figure (p.{net_irr.get("evidence", {}).get("page")}): "{snippet}" | '
-                    f'Convention (p.{ctx.get("page")}, {ctx.get("section") or "n/a"}): "{ctx.get("snippet")}"'
-                ),
-                why_it_matters="Inconsistent gross/net language within a single document is a red flag for underwriting rigor and can misstate performance.",
-                question_to_ask="Confirm which convention actually governs the reported Net IRR figure."
-            ))
+        return self.apply_frame(FactFrame(extracted))
+
+    def apply_frame(self, frame: FactFrame) -> List[Flag]:
+        flags = [f for pair in self.pair_flags(frame).values() for f in pair]
+        for doc in frame.docs:
+            flags.extend(self.doc_flags(doc))
+        return flags
+
+    def pair_flags(self, frame: FactFrame,
+                   involving: Optional[Sequence[int]] = None) -> Dict[Tuple[int, int], List[Flag]]:
+        """Cross-document: every pair whose stated conventions differ, found
+        by comparing basis codes across all pairs at once."""
+        basis = frame.categorical("net_irr_basis", _doc_basis)
+        hits = in_pair_order(frame.pairs(
+            lambda r, c: (basis[r, None] != basis[None, c]) & (basis[r, None] >= 0) & (basis[None, c] >= 0),
+            involving,
+        ))
 
+        flags: Dict[Tuple[int, int], List[Flag]] = {}
+        for i, j, _ in hits:
+            flags[(i, j)] = [self._drift_flag(frame.docs[i], frame.docs[j])]
         return flags
+
+    @staticmethod
+    def _drift_flag(A: dict, B: dict) -> Flag:
+        ctx_a = A["net_irr_basis"]; ctx_b = B["net_irr_basis"]
+        return Flag(
+            severity="YELLOW",
+            type="IRR_DEFINITION_DRIFT",
+            docs=f'{A["doc_name"]} vs {B["doc_name"]}',
+            detail=f'Documents state different IRR return conventions: "{ctx_a.get("basis")}" vs "{ctx_b.get("basis")}".',
+            evidence=(
+                f'{A["doc_name"]} (p.{ctx_a.get("page")}, {ctx_a.get("section") or "n/a"}): "{ctx_a.get("snippet")}" | '
+                f'{B["doc_name"]} (p.{ctx_b.get("page")}, {ctx_b.get("section") or "n/a"}): "{ctx_b.get("snippet")}"'
+            ),
+            why_it_matters="Definition drift can mislead IC comparisons and skew underwriting decisions.",
+            question_to_ask="Confirm whether IRR reported is net or gross and reconcile to a consistent definition."
+        )
+
+    def doc_flags(self, doc: dict) -> List[Flag]:
+        """Within-document: the figure's own wording vs the convention the
+        document states elsewhere."""
+        net_irr = doc.get("net_irr") or {}
+        snippet = ((net_irr.get("evidence") or {}).get("snippet")) or ""
+        local_basis = _local_basis(snippet)
+
+        ctx = doc.get("net_irr_basis")
+        doc_basis = (ctx or {}).get("basis")
+
+        if not local_basis or not doc_basis or local_basis == doc_basis:
+            return []
+
+        return [Flag(
+            severity="YELLOW",
+            type="IRR_DEFINITION_DRIFT_INTERNAL",
+            docs=doc["doc_name"],
+            detail=(
+                f'The reported IRR figure reads as "{local_basis}" but this document defines its '
+                f'convention as "{doc_basis}" elsewhere.'
+            ),
+            evidence=(
+                f'Figure (p.{net_irr.get("evidence", {}).get("page")}): "{snippet}" | '
+                f'Convention (p.{ctx.get("page")}, {ctx.get("section") or "n/a"}): "{ctx.get("snippet")}"'
+            ),
+            why_it_matters="Inconsistent gross/net language within a single document is a red flag for underwriting rigor and can misstate performance.",
+            question_to_ask="Confirm which convention actually governs the reported Net IRR figure."
+        )]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rows of the pairwise comparison matrix evaluated at once. Bounds memory to
+# BLOCK_ROWS x n per check (~4 MB of float64 at n=1000) however many
+# documents a data room holds.
+BLOCK_ROWS = 512
+
+
+class FactFrame:
+    """Columnar view of the extracted documents for cross-document rules.
+
+    Built once per RiskEngine.evaluate and shared by every rule. Columns
+    are materialized on first use: a numeric field becomes a float64 array
+    (NaN where the value is None), a categorical one an int code array (-1
+    where absent). Rules compare whole columns at once and only go back to
+    the per-document dicts (`docs`) to build flags for pairs that violate.
+    """
+
+    def __init__(self, extracted: List[dict]):
+        self.docs = extracted
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._categorical: Dict[str, Tuple[np.ndarray, List[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def numeric(self, field: str) -> np.ndarray:
+        """doc[field]["value"] for every document."""
+        column = self._numeric.get(field)
+        if column is None:
+            values = [doc[field]["value"] for doc in self.docs]
+            column = self._numeric[field] = np.array(
+                [np.nan if v is None else v for v in values], dtype=np.float64
+            )
+        return column
+
+    def categorical(self, name: str, getter: Callable[[dict], Optional[str]]) -> np.ndarray:
+        """Integer codes for getter(doc) per document; equal codes mean equal
+        values, and a falsy value (None, "") is -1."""
+        entry = self._categorical.get(name)
+        if entry is None:
+            labels: Dict[str, int] = {}
+            codes = np.array(
+                [labels.setdefault(v, len(labels)) if v else -1 for v in map(getter, self.docs)],
+                dtype=np.int64,
+            )
+            entry = self._categorical[name] = (codes, list(labels))
+        return entry[0]
+
+    def pairs(self, violates: Callable[[Any, Any], np.ndarray],
+              involving: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Every (i, j) with i < j where the check is violated, in the order
+        a nested `for i: for j > i:` loop would visit them.
+
+        violates(rows, cols) gets row and column indices (slices or index
+        arrays) and returns a boolean (rows x cols) matrix for "document
+        row, compared with document col" -- typically a broadcast of
+        column[rows, None] against column[None, cols]. Rows are processed in
+        blocks of BLOCK_ROWS.
+
+        involving restricts the result to pairs with at least one of those
+        document indices (incremental re-evaluation after documents were
+        added or changed); None means every pair.
+        """
+        n = len(self.docs)
+        everything = slice(0, n)
+        i_parts, j_parts = [], []
+
+        def collect(rows_idx: np.ndarray, cols, cols_idx: np.ndarray) -> None:
+            for start in range(0, len(rows_idx), BLOCK_ROWS):
+                block = rows_idx[start:start + BLOCK_ROWS]
+                rows = slice(block[0], block[-1] + 1) if _contiguous(block) else block
+                hits = violates(rows, cols)
+                hits &= cols_idx[None, :] > block[:, None]
+                i, j = np.nonzero(hits)
+                i_parts.append(block[i])
+                j_parts.append(cols_idx[j])
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            all_idx = np.arange(n)
+            if involving is None:
+                collect(all_idx, everything, all_idx)
+            else:
+                marked = np.zeros(n, dtype=bool)
+                marked[np.asarray(involving, dtype=np.int64)] = True
+                marked_idx = np.flatnonzero(marked)
+                if len(marked_idx):
+                    # (marked, anything later) + (unmarked, marked later):
+                    # each qualifying pair exactly once.
+                    collect(marked_idx, everything, all_idx)
+                    collect(np.flatnonzero(~marked), marked_idx, marked_idx)
+
+        if not i_parts:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        i, j = np.concatenate(i_parts), np.concatenate(j_parts)
+        if involving is not None:
+            order = np.lexsort((j, i))
+            i, j = i[order], j[order]
+        return i, j
+
+
+def _contiguous(block: np.ndarray) -> bool:
+    return len(block) > 0 and block[-1] - block[0] == len(block) - 1
+
+
+def in_pair_order(*checks: Tuple[np.ndarray, np.ndarray]) -> List[Tuple[int, int, int]]:
+    """Merge several checks' (i, j) hits into (i, j, check_index) triples,
+    sorted the way the per-pair loop emitted flags: by pair, then by the
+    order the checks ran within a pair."""
+    if not checks:
+        return []
+    i = np.concatenate([c[0] for c in checks])
+    j = np.concatenate([c[1] for c in checks])
+    k = np.concatenate([np.full(len(c[0]), idx, dtype=np.int64) for idx, c in enumerate(checks)])
+    order = np.lexsort((k, j, i))
+    return list(zip(i[order].tolist(), j[order].tolist(), k[order].tolist()))
@@ -1,37 +1,44 @@
 from ddgpt.rules.base import Rule, Flag
 
 class InternalInconsistencyRule(Rule):
+    incremental = True
+
     def apply(self, extracted):
         flags = []
 
         for doc in extracted:
-            target = doc["target_irr"]["value"]
-            net = doc["net_irr"]["value"]
+            flags.extend(self.doc_flags(doc))
+
+        return flags
+
+    def doc_flags(self, doc):
+        target = doc["target_irr"]["value"]
+        net = doc["net_irr"]["value"]
 
-            if (
-                target is not None and
-                net is not None and
-                net < target
-            ):
-                flags.append(
-                    Flag(
-                        severity="YELLOW",
-                        type="UNDER_TARGET_PERFORMANCE",
-                        docs=doc["doc_name"],
-                        detail="Net IRR below target IRR",
-                        evidence=(
-                            f'Net IRR={net}% | '
-                            f'Target IRR={target}%'
-                        ),
-                        why_it_matters=(
-                            "Fund may be underperforming "
-                            "stated underwriting targets."
-                        ),
-                        question_to_ask=(
-                            "What is driving the "
-                            "performance shortfall?"
-                        )
+        if (
+            target is not None and
+            net is not None and
+            net < target
+        ):
+            return [
+                Flag(
+                    severity="YELLOW",
+                    type="UNDER_TARGET_PERFORMANCE",
+                    docs=doc["doc_name"],
+                    detail="Net IRR below target IRR",
+                    evidence=(
+                        f'Net IRR={net}% | '
+                        f'Target IRR={target}%'
+                    ),
+                    why_it_matters=(
+                        "Fund may be underperforming "
+                        "stated underwriting targets."
+                    ),
+                    question_to_ask=(
+                        "What is driving the "
+                        "performance shortfall?"
                     )
                 )
+            ]
 
-        return flags
\ No newline at end of file
+        return []
\ No newline at end of file
@@ -0,0 +1,22 @@
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+from ddgpt.rules.definition_drift import DefinitionDriftRule
+from ddgpt.rules.internal_inconsistency import InternalInconsistencyRule
+from ddgpt.rules.extractor_disagreement import ExtractorDisagreementRule
+from ddgpt.rules.irr_mention_conflict import IRRMentionConflictRule
+
+
+def build_rules(cfg):
+    """The rule set, in evaluation order. Kept apart from
+    ddgpt.pipeline.builders so `ddgpt flag` can build the rules without
+    importing any extractor."""
+    return [
+        NumericMismatchRule(
+            cfg.rules.aum_tolerance_pct,
+            cfg.rules.mgmt_fee_abs_pct,
+            cfg.rules.target_irr_abs_pct
+        ),
+        DefinitionDriftRule(),
+        InternalInconsistencyRule(),
+        ExtractorDisagreementRule(),
+        IRRMentionConflictRule(cfg.rules.internal_irr_mention_tolerance_pct),
+    ]
@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import hashlib
 import pickle
-from pathlib import Path
-from typing import Callable, TypeVar
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, TypeVar
+
+from ddgpt.utils.cache_store import get_store
 
 T = TypeVar("T")
 
+# Returned by disk_cache_get on a miss -- a sentinel rather than None so a
+# legitimately cached None/empty result is still distinguishable from "absent".
+MISSING = object()
+
+# Default byte budget for the in-process tier (see configure_memory_cache).
+DEFAULT_MEMORY_CACHE_BYTES = 256 * 1024 * 1024
+
 
 def content_hash(*parts: bytes | str) -> str:
     h = hashlib.sha256()
@@ -15,29 +25,129 @@ def content_hash(*parts: bytes | str) -> str:
     return h.hexdigest()[:24]
 
 
+class _MemoryLRU:
+    """In-process tier in front of the disk cache, bounded by the pickled
+    size of its values. A hit hands back the very object that was cached --
+    no SQLite read, no unpickling -- so cached values are shared and must be
+    treated as read-only (copy before mutating)."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key: tuple):
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, cache_key: tuple, value, nbytes: int) -> None:
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(cache_key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[cache_key] = (value, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_memory = _MemoryLRU(DEFAULT_MEMORY_CACHE_BYTES)
+
+
+def configure_memory_cache(max_bytes: int) -> None:
+    """Byte budget for the in-process tier; 0 disables it."""
+    _memory.resize(max_bytes)
+
+
+def memory_cache_stats() -> Dict[str, int]:
+    return _memory.stats()
+
+
+def clear_memory_cache() -> None:
+    _memory.clear()
+
+
 def disk_cached(cache_dir: str, namespace: str, key: str, compute_fn: Callable[[], T], enabled: bool = True) -> T:
-    """Generic pickle-backed disk cache, keyed on a content hash the caller
-    computes (so a changed input or config naturally misses the cache
-    instead of needing explicit invalidation logic). Deliberately simple:
-    no TTL or eviction -- entries are cheap to recompute and the cache
-    directory is disposable.
+    """Generic two-tier cache, keyed on a content hash the caller computes
+    (so a changed input or config naturally misses the cache instead of
+    needing explicit invalidation logic): an in-process LRU in front of a
+    single SQLite file per cache_dir (see cache_store) with optional
+    per-namespace LRU budgets. Returned values may be shared with later
+    callers -- don't mutate them in place.
     """
     if not enabled:
         return compute_fn()
 
-    cache_path = Path(cache_dir) / namespace / f"{key}.pkl"
-
-    if cache_path.exists():
-        try:
-            with cache_path.open("rb") as f:
-                return pickle.load(f)
-        except Exception:
-            pass  # corrupt or incompatible entry -- fall through and recompute
+    cached = disk_cache_get(cache_dir, namespace, key)
+    if cached is not MISSING:
+        return cached
 
     result = compute_fn()
-
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with cache_path.open("wb") as f:
-        pickle.dump(result, f)
+    disk_cache_put(cache_dir, namespace, key, result)
 
     return result
+
+
+def disk_cache_get(cache_dir: str, namespace: str, key: str):
+    """Lookup-only half of disk_cached, for callers that need to know what's
+    already cached *before* deciding how to compute the rest (e.g. batching
+    only the misses out to a worker pool). Returns MISSING if absent."""
+    value = _memory.get((cache_dir, namespace, key))
+    if value is not MISSING:
+        return value
+
+    pickled = get_store(cache_dir).get_pickled(namespace, key)
+    if pickled is None:
+        return MISSING
+
+    try:
+        value = pickle.loads(pickled)
+    except Exception:
+        # Incompatible entry (e.g. a changed model class): drop it so the
+        # recomputed value can take its place, and treat as a miss.
+        get_store(cache_dir).clear_key(namespace, key)
+        return MISSING
+
+    _memory.put((cache_dir, namespace, key), value, len(pickled))
+    return value
+
+
+def disk_cache_put(cache_dir: str, namespace: str, key: str, value) -> None:
+    # Put-if-absent on disk: an entry already written by another worker is kept.
+    pickled = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if get_store(cache_dir).put_pickled(namespace, key, pickled):
+        _memory.put((cache_dir, namespace, key), value, len(pickled))
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from collections import Counter
+from multiprocessing import util as mp_util
+from typing import Dict, List, Optional, Tuple
+
+# One database file per cache_dir, replacing the old one-pickle-per-key
+# layout (cache_dir/<namespace>/<key>.pkl). Legacy .pkl files are simply no
+# longer read; delete them by hand if disk space matters.
+DB_FILENAME = "cache.sqlite3"
+
+# zlib level 1: most of the size win on OCR text/table rows for a fraction
+# of the CPU of the default level.
+COMPRESS_LEVEL = 1
+
+BUSY_TIMEOUT_S = 30.0
+
+# Reads don't write: an entry's last_access and the hit/miss/bytes_read
+# counters are buffered in the process and written back at most this often
+# (and before any eviction, stats() or close()), so concurrent readers never
+# queue on SQLite's single write lock. LRU order across processes is at
+# most this stale.
+ACCESS_FLUSH_INTERVAL_S = 5.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    namespace     TEXT PRIMARY KEY,
+    hits          INTEGER NOT NULL DEFAULT 0,
+    misses        INTEGER NOT NULL DEFAULT 0,
+    bytes_read    INTEGER NOT NULL DEFAULT 0,
+    bytes_written INTEGER NOT NULL DEFAULT 0,
+    evictions     INTEGER NOT NULL DEFAULT 0,
+    bytes_stored  INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS budgets (
+    namespace TEXT PRIMARY KEY,
+    max_bytes INTEGER NOT NULL
+);
+"""
+
+_COUNTER_UPSERT = """
+INSERT INTO counters (namespace, {col}) VALUES (?, ?)
+ON CONFLICT(namespace) DO UPDATE SET {col} = {col} + excluded.{col}
+"""
+
+
+class CacheStore:
+    """Content-addressed cache in a single SQLite database (WAL mode), so
+    concurrent threads and worker processes never see a half-written entry
+    and lookups don't degrade with tens of thousands of keys.
+
+    Values are pickled + zlib-compressed. Puts are INSERT OR IGNORE: keys
+    are content hashes, so whichever writer lands first wins and later
+    identical writes are no-ops. A namespace with a byte budget evicts its
+    least-recently-read entries after each put that takes it over budget;
+    its stored size is kept as a running total in `counters`, so a put
+    doesn't re-sum the namespace.
+
+    Reads take no write lock; see ACCESS_FLUSH_INTERVAL_S.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.path = Path(cache_dir) / DB_FILENAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._raw_conn().executescript(_SCHEMA)
+        self._migrate()
+
+        self._access_lock = threading.Lock()
+        self._accessed: Dict[Tuple[str, str], float] = {}
+        self._read_counts: Dict[str, Counter] = {}
+        self._last_flush = time.monotonic()
+
+    def _migrate(self) -> None:
+        # Databases from before counters.bytes_stored: add it and seed it
+        # from the entries table, once, under the write lock.
+        with self._conn() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(counters)")}
+            if "bytes_stored" in columns:
+                return
+            conn.execute("ALTER TABLE counters ADD COLUMN bytes_stored INTEGER NOT NULL DEFAULT 0")
+            conn.executemany(
+                _COUNTER_UPSERT.format(col="bytes_stored"),
+                conn.execute("SELECT namespace, SUM(size) FROM entries GROUP BY namespace").fetchall(),
+            )
+
+    def _raw_conn(self) -> sqlite3.Connection:
+        # sqlite3 connections aren't shareable across threads; one each.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_S, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _conn(self) -> "_Transaction":
+        return _Transaction(self._raw_conn())
+
+    def get_pickled(self, namespace: str, key: str) -> Optional[bytes]:
+        """Raw pickled bytes for an entry (decompressed), or None."""
+        row = self._raw_conn().execute(
+            "SELECT value FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+
+        with self._access_lock:
+            counts = self._read_counts.setdefault(namespace, Counter())
+            if row is None:
+                counts["misses"] += 1
+            else:
+                self._accessed[(namespace, key)] = time.time()
+                counts["hits"] += 1
+                counts["bytes_read"] += len(row[0])
+            due = time.monotonic() - self._last_flush >= ACCESS_FLUSH_INTERVAL_S
+        if due:
+            self.flush()
+        if row is None:
+            return None
+
+        try:
+            return zlib.decompress(row[0])
+        except zlib.error:
+            self.clear_key(namespace, key)
+            return None
+
+    def flush(self) -> None:
+        """Write buffered last_access times and read counters back."""
+        with self._conn() as conn:
+            self._flush_accesses(conn)
+
+    def close(self) -> None:
+        self.flush()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _flush_accesses(self, conn: sqlite3.Connection) -> None:
+        # Called inside a write transaction.
+        with self._access_lock:
+            accessed, self._accessed = self._accessed, {}
+            read_counts, self._read_counts = self._read_counts, {}
+            self._last_flush = time.monotonic()
+        conn.executemany(
+            "UPDATE entries SET last_access = MAX(last_access, ?) WHERE namespace = ? AND key = ?",
+            [(at, ns, key) for (ns, key), at in accessed.items()],
+        )
+        for ns, counts in read_counts.items():
+            for col, n in counts.items():
+                conn.execute(_COUNTER_UPSERT.format(col=col), (ns, n))
+
+    def put_pickled(self, namespace: str, key: str, pickled: bytes) -> bool:
+        """Returns False if the key was already present (nothing written)."""
+        blob = zlib.compress(pickled, COMPRESS_LEVEL)
+        now = time.time()
+        with self._conn() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO entries (namespace, key, value, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, blob, len(blob), now, now),
+            ).rowcount
+            if inserted:
+                conn.execute(_COUNTER_UPSERT.format(col="bytes_written"), (namespace, len(blob)))
+                conn.execute(_COUNTER_UPSERT.format(col="bytes_stored"), (namespace, len(blob)))
+                self._enforce_budget(conn, namespace)
+        return bool(inserted)
+
+    def set_budgets(self, budgets: Dict[str, int]) -> None:
+        """Byte budget per namespace, stored in the database so every
+        process writing to it (e.g. loader/OCR workers) enforces the same
+        limits."""
+        with self._conn() as conn:
+            conn.execute("DELETE FROM budgets")
+            conn.executemany(
+                "INSERT INTO budgets (namespace, max_bytes) VALUES (?, ?)",
+                [(ns, int(b)) for ns, b in budgets.items()],
+            )
+
+    def prune(self, namespace: Optional[str] = None) -> Dict[str, int]:
+        """Evict every over-budget namespace (or just `namespace`) back
+        under its budget; returns entries evicted per namespace."""
+        evicted = {}
+        with self._conn() as conn:
+            self._flush_accesses(conn)
+            rows = conn.execute("SELECT namespace FROM budgets").fetchall()
+            for (ns,) in rows:
+                if namespace is None or ns == namespace:
+                    evicted[ns] = self._enforce_budget(conn, ns)
+        return evicted
+
+    def clear_key(self, namespace: str, key: str) -> None:
+        with self._conn() as conn:
+            row = conn.execute(
+                "SELECT size FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+                conn.execute(_COUNTER_UPSERT.format(col="bytes_stored"), (namespace, -row[0]))
+
+    def clear(self, namespace: str) -> int:
+        with self._conn() as conn:
+            conn.execute("UPDATE counters SET bytes_stored = 0 WHERE namespace = ?", (namespace,))
+            return conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,)).rowcount
+
+    def vacuum(self) -> None:
+        conn = self._raw_conn()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def stats(self) -> List[dict]:
+        with self._conn() as conn:
+            self._flush_accesses(conn)
+            sizes = {
+                ns: (n, b) for ns, n, b in conn.execute(
+                    "SELECT namespace, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY namespace"
+                )
+            }
+            counters = {
+                row[0]: row[1:] for row in conn.execute(
+                    "SELECT namespace, hits, misses, bytes_read, bytes_written, evictions FROM counters"
+                )
+            }
+            budgets = dict(conn.execute("SELECT namespace, max_bytes FROM budgets").fetchall())
+
+        out = []
+        for ns in sorted(set(sizes) | set(counters) | set(budgets)):
+            entries, stored = sizes.get(ns, (0, 0))
+            hits, misses, bytes_read, bytes_written, evictions = counters.get(ns, (0, 0, 0, 0, 0))
+            out.append({
+                "namespace": ns,
+                "entries": entries,
+                "bytes_stored": stored,
+                "budget_bytes": budgets.get(ns),
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+                "bytes_read": bytes_read,
+                "bytes_written": bytes_written,
+                "evictions": evictions,
+            })
+        return out
+
+    def _enforce_budget(self, conn: sqlite3.Connection, namespace: str) -> int:
+        row = conn.execute(
+            "SELECT b.max_bytes, COALESCE(c.bytes_stored, 0) FROM budgets b "
+            "LEFT JOIN counters c ON c.namespace = b.namespace WHERE b.namespace = ?",
+            (namespace,),
+        ).fetchone()
+        if row is None:
+            return 0
+        max_bytes, stored = row
+        if stored <= max_bytes:
+            return 0
+
+        # Evict by up-to-date recency, including this process's unflushed reads.
+        self._flush_accesses(conn)
+        evicted_bytes = 0
+
+        evict = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries WHERE namespace = ? ORDER BY last_access", (namespace,)
+        ):
+            if stored <= max_bytes:
+                break
+            evict.append((namespace, key))
+            stored -= size
+            evicted_bytes += size
+
+        conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", evict)
+        conn.execute(_COUNTER_UPSERT.format(col="evictions"), (namespace, len(evict)))
+        conn.execute(_COUNTER_UPSERT.format(col="bytes_stored"), (namespace, -evicted_bytes))
+        return len(evict)
+
+
+class _Transaction:
+    """`with store._conn() as conn:` -- one IMMEDIATE transaction, so a
+    read-modify-write (put + size total + eviction) is atomic across
+    processes."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, *exc):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+_stores: Dict[tuple, CacheStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(cache_dir: str) -> CacheStore:
+    # Keyed on pid too: a forked worker must open its own connections.
+    key = (str(Path(cache_dir).resolve()), os.getpid())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = CacheStore(cache_dir)
+        return store
+
+
+def flush_stores() -> None:
+    """Write back every open store's buffered reads (see
+    ACCESS_FLUSH_INTERVAL_S). Runs at exit -- including in
+    multiprocessing workers, which skip atexit."""
+    pid = os.getpid()
+    with _stores_lock:
+        stores = [s for (_, owner), s in _stores.items() if owner == pid]
+    for store in stores:
+        try:
+            store.flush()
+        except sqlite3.Error:
+            pass  # counters and recency only; never fail shutdown over them
+
+
+atexit.register(flush_stores)
+mp_util.Finalize(None, flush_stores, exitpriority=10)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Optional
+
+logger = logging.getLogger("ddgpt")
+
+# Multiplicative decrease applied to the concurrency window on an error or a
+# call slower than the latency target.
+DECREASE_FACTOR = 0.5
+
+
+class ConcurrencyLimiter:
+    """Process-wide AIMD cap on requests in flight to one provider + model.
+    Every caller sharing a key shares the cap, so documents extracted in
+    parallel, each fanning out its own chunks, can't flood one Cohere
+    account or one Ollama server.
+
+    The window starts at max_limit. Each call that succeeds within
+    latency_target_s grows it by ~1 per window's worth of calls (additive
+    increase); an error or a slow call halves it (multiplicative decrease),
+    at most once per round of requests -- calls already in flight when it
+    shrank don't shrink it again. So concurrency backs off as soon as 429s
+    or queueing show up and climbs back once they clear.
+
+    Threads (acquire) and coroutines (acquire_async) share one count, so a
+    coroutine waiting for a slot never blocks the event loop it runs on."""
+
+    def __init__(self, limit: int, min_limit: int = 1, latency_target_s: Optional[float] = None, key: str = ""):
+        self.key = key
+        self.max_limit = max(1, int(limit))
+        self.min_limit = max(1, min(int(min_limit), self.max_limit))
+        self.latency_target_s = latency_target_s
+        self._cond = threading.Condition()
+        self._window = float(self.max_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._async_waiters = []
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._window))
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        # Lowers/raises the ceiling; the window follows it down immediately.
+        with self._cond:
+            self.max_limit = max(1, int(value))
+            self.min_limit = min(self.min_limit, self.max_limit)
+            self._window = min(self._window, float(self.max_limit))
+            self._cond.notify_all()
+            self._wake_async_waiters(len(self._async_waiters))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> float:
+        """Blocks for a slot; returns the call's start time for release()."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+        return time.monotonic()
+
+    async def acquire_async(self) -> float:
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = loop.create_future()
+            with self._cond:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return time.monotonic()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                    elif self._in_flight < self.limit:
+                        # Woken but cancelled before using the slot -- pass
+                        # the wakeup on rather than lose it.
+                        self._wake_async_waiters(1)
+                raise
+
+    def release(self, started_at: Optional[float] = None, ok: bool = True) -> None:
+        now = time.monotonic()
+        with self._cond:
+            self._in_flight -= 1
+            before = self.limit
+
+            if started_at is not None:
+                latency = now - started_at
+                slow = self.latency_target_s is not None and latency > self.latency_target_s
+                if not ok or slow:
+                    if started_at >= self._last_decrease:
+                        self._window = max(float(self.min_limit), self._window * DECREASE_FACTOR)
+                        self._last_decrease = now
+                else:
+                    self._window = min(float(self.max_limit), self._window + 1.0 / self._window)
+
+            after = self.limit
+            if after != before:
+                logger.info(
+                    f"limiter key={self.key} limit={before}->{after} in_flight={self._in_flight} "
+                    f"reason={'recovered' if after > before else ('error' if not ok else 'latency')}"
+                )
+
+            # Wake one waiter of each kind per free slot; whichever loses the
+            # race waits again.
+            free = max(1, after - self._in_flight)
+            self._cond.notify(free)
+            self._wake_async_waiters(free)
+
+    def _wake_async_waiters(self, n: int) -> None:
+        # Called with self._cond held.
+        for _ in range(min(n, len(self._async_waiters))):
+            loop, waiter = self._async_waiters.pop(0)
+            loop.call_soon_threadsafe(_resolve, waiter)
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(key: str, limit: int, latency_target_s: Optional[float] = None,
+                min_limit: int = 1) -> ConcurrencyLimiter:
+    """Shared limiter for `key` (e.g. "cohere:command-a-03-2025"). When
+    several callers configure the same key with different ceilings (the
+    Cohere extractor and the memo generator on one model), the tightest
+    wins."""
+    with _registry_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = ConcurrencyLimiter(limit, min_limit, latency_target_s, key=key)
+        elif limit < limiter.max_limit:
+            limiter.limit = limit
+        return limiter
+
+
+def provider_limiter(key: str, max_in_flight: Optional[int],
+                     latency_target_s: Optional[float] = None) -> Optional[ConcurrencyLimiter]:
+    """Limiter an extractor holds for its provider calls; None (no shared
+    limiter at all) when max_in_flight is None."""
+    if max_in_flight is None:
+        return None
+    return get_limiter(key, max_in_flight, latency_target_s)
+
+
+@contextmanager
+def limited(limiter: Optional[ConcurrencyLimiter]):
+    """Hold one slot around a single provider call. The call's latency, and
+    whether it raised, feed the limiter's AIMD window."""
+    if limiter is None:
+        yield
+        return
+
+    started_at = limiter.acquire()
+    try:
+        yield
+    except Exception:
+        limiter.release(started_at, ok=False)
+        raise
+    except BaseException:
+        # Cancelled/interrupted: not a signal about the provider either way.
+        limiter.release()
+        raise
+    limiter.release(started_at, ok=True)
+
+
+@asynccontextmanager
+async def limited_async(limiter: Optional[ConcurrencyLimiter]):
+    """Async counterpart of limited, sharing the same limiter."""
+    if limiter is None:
+        yield
+        return
+
+    started_at = await limiter.acquire_async()
+    try:
+        yield
+    except Exception:
+        limiter.release(started_at, ok=False)
+        raise
+    except BaseException:
+        # Cancelled/interrupted: not a signal about the provider either way.
+        limiter.release()
+        raise
+    limiter.release(started_at, ok=True)
+
+
+def backoff_delay(base_s: float, attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, base * 2**attempt].
+    Fixed delays make every caller that failed together retry together --
+    jitter spreads them out so a burst of 429s doesn't turn into a retry
+    storm, while the limiter's shrunken window gates how many go at once."""
+    return random.uniform(0.0, base_s * (2 ** attempt))
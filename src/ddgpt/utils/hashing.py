@@ -1,11 +1,43 @@
 from __future__ import annotations
+import functools
 import hashlib
+import os
 from pathlib import Path
 
+# Read size for streaming hashes -- large enough that a multi-hundred-MB
+# scan hashes at disk speed, small enough to never hold the file in memory.
+HASH_CHUNK_BYTES = 1024 * 1024
+
 def sha256_file(path: str) -> str:
     p = Path(path)
     h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+    buf = bytearray(HASH_CHUNK_BYTES)
+    view = memoryview(buf)
+    with p.open("rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            h.update(view[:n])
     return h.hexdigest()
+
+
+# Fingerprints remembered per process. Each entry is a few hundred bytes;
+# this covers several data rooms' worth of inputs while keeping a
+# long-running `serve`/`watch` process from growing without bound.
+FINGERPRINT_MEMO_ENTRIES = 4096
+
+
+def file_fingerprint(path: str) -> str:
+    """sha256 of a file's contents, computed once per process for a given
+    (path, size, mtime_ns, inode) -- every cache key and manifest that needs
+    a file's identity asks here instead of re-reading the file. A rewritten
+    or replaced file changes at least one of those and is hashed afresh."""
+    resolved = os.path.realpath(path)
+    st = os.stat(resolved)
+    return _fingerprint(resolved, st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+@functools.lru_cache(maxsize=FINGERPRINT_MEMO_ENTRIES)
+def _fingerprint(resolved: str, size: int, mtime_ns: int, inode: int) -> str:
+    return sha256_file(resolved)
@@ -0,0 +1,160 @@
+import json
+import time
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from ddgpt import cli
+from ddgpt.io import loaders
+from ddgpt.pipeline.batch import DealJob, load_batch_manifest, run_batch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _deal(name, paths, extract_delay=0.0, fail_on=None, log=None):
+    def load(path):
+        if path == fail_on:
+            raise ValueError(f"unreadable {path}")
+        return path
+
+    def extract(doc, timings):
+        time.sleep(extract_delay)
+        timings.setdefault("per_document_s", {})[doc] = extract_delay
+        return {"doc_name": doc}
+
+    def finish(docs, extracted, timings):
+        log.append(name)
+        return {"extracted": [d["doc_name"] for d in extracted]}
+
+    return DealJob(name, paths, load=load, extract=extract, finish=finish)
+
+
+def test_slow_deal_does_not_hold_up_the_others():
+    finished = []
+    slow = _deal("slow", ["s1", "s2"], extract_delay=0.3, log=finished)
+    fast = _deal("fast", ["f1", "f2", "f3"], log=finished)
+    empty = _deal("empty", [], log=finished)
+
+    summary = run_batch([slow, fast, empty], workers=3)
+
+    # Two threads sit in the slow extractions; the third finishes "fast".
+    assert finished.index("fast") < finished.index("slow")
+    assert [d["status"] for d in summary["deals"]] == ["succeeded"] * 3
+    assert summary["deals"][0]["extracted"] == ["s1", "s2"]  # input order, not completion order
+    assert summary["deals"][1]["extracted"] == ["f1", "f2", "f3"]
+    assert summary["deals"][0]["timings_s"]["extraction_total_s"] == 0.6
+    # The slow deal's two documents were extracted side by side.
+    assert summary["deals"][0]["wall_s"] < 0.55
+
+
+def test_failed_deal_is_reported_without_stopping_the_batch():
+    finished = []
+    broken = _deal("broken", ["b1", "b2"], fail_on="b1", log=finished)
+    ok = _deal("ok", ["o1"], log=finished)
+
+    summary = run_batch([broken, ok], workers=1)
+
+    assert finished == ["ok"]
+    assert summary["failed"] == 1 and summary["succeeded"] == 1
+    assert "unreadable b1" in summary["deals"][0]["error"]
+
+
+def test_manifest_paths_are_relative_to_the_manifest(tmp_path):
+    (tmp_path / "deals.yaml").write_text(
+        "deals:\n"
+        "  - {input: rooms/atlas, out: out/atlas}\n"
+        "  - {name: birch, input: rooms/birch, out: out/birch, config: birch.json}\n"
+    )
+    deals = load_batch_manifest(str(tmp_path / "deals.yaml")).deals
+
+    assert [d.name for d in deals] == ["atlas", "birch"]
+    assert deals[0].input == str(tmp_path / "rooms" / "atlas")
+    assert deals[0].config is None
+    assert deals[1].config == str(tmp_path / "birch.json")
+
+    (tmp_path / "dup.json").write_text(json.dumps({"deals": [
+        {"input": "a", "out": "out"}, {"input": "b", "out": "out"},
+    ]}))
+    try:
+        load_batch_manifest(str(tmp_path / "dup.json"))
+    except ValueError as e:
+        assert "duplicate deal out" in str(e)
+    else:
+        raise AssertionError("duplicate out dirs accepted")
+
+
+def test_batch_command_writes_each_deal_and_a_summary(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # prompts_dir is relative
+    monkeypatch.setenv("CO_API_KEY", "")
+    base = {"run": {"use_cohere": False, "enable_pdf_output": False, "enable_disk_cache": False},
+            "ollama": {"enabled": False}}
+    (tmp_path / "base.json").write_text(json.dumps(base))
+    # Birch tolerates a 1pt management fee gap, so its mismatch isn't flagged.
+    (tmp_path / "birch.json").write_text(json.dumps({**base, "rules": {"mgmt_fee_abs_pct": 1.0}}))
+
+    for deal in ("atlas", "birch"):
+        room = tmp_path / "rooms" / deal
+        room.mkdir(parents=True)
+        (room / "deck.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\n")
+        (room / "lpa.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 1.5%\n")
+    (tmp_path / "deals.json").write_text(json.dumps({"deals": [
+        {"input": "rooms/atlas", "out": "out/atlas"},
+        {"input": "rooms/birch", "out": "out/birch", "config": "birch.json"},
+    ]}))
+
+    result = CliRunner().invoke(cli.app, [
+        "batch", "--manifest", str(tmp_path / "deals.json"), "--out", str(tmp_path / "out"),
+        "--config", str(tmp_path / "base.json"), "--workers", "3",
+    ])
+    assert result.exit_code == 0, result.output
+
+    summary = json.loads((tmp_path / "out" / "batch_summary.json").read_text())
+    assert summary["workers"] == 3
+    atlas, birch = summary["deals"]
+    assert (atlas["name"], atlas["documents"], atlas["flags"]) == ("atlas", 2, 1)
+    assert (birch["name"], birch["flags"]) == ("birch", 0)
+    assert set(atlas["timings_s"]["per_document_s"]) == {"deck.txt", "lpa.txt"}
+    assert {"load_s", "extraction_total_s", "risk_rules_s", "memo_generation_s", "report_s"} <= set(atlas["timings_s"])
+
+    atlas_out = tmp_path / "out" / "atlas"
+    for name in ("extracted.json", "flags.json", "ic_memo.md", "facts_table.csv", "audit_manifest.json",
+                 "run_summary.json", "stage_manifest.json"):
+        assert (atlas_out / name).exists(), name
+    assert [f["type"] for f in json.loads((atlas_out / "flags.json").read_text())] == ["MGMT_FEE_MISMATCH"]
+
+
+def test_batch_configures_cache_once_and_loads_on_one_shared_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # prompts_dir is relative
+    monkeypatch.setenv("CO_API_KEY", "")
+    base = {"run": {"use_cohere": False, "enable_pdf_output": False, "enable_disk_cache": False, "load_workers": 2},
+            "ollama": {"enabled": False}}
+    (tmp_path / "base.json").write_text(json.dumps(base))
+    # A deal's own memory tier size doesn't override the batch's.
+    (tmp_path / "birch.json").write_text(json.dumps({**base, "run": {**base["run"], "memory_cache_mb": 1}}))
+    deals = []
+    for deal in ("atlas", "birch"):
+        room = tmp_path / "rooms" / deal
+        room.mkdir(parents=True)
+        for name in ("deck.txt", "lpa.txt"):
+            (room / name).write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\n")
+        deals.append({"input": f"rooms/{deal}", "out": f"out/{deal}"})
+    deals[1]["config"] = "birch.json"
+    (tmp_path / "deals.json").write_text(json.dumps({"deals": deals}))
+
+    configured, pools = [], []
+    monkeypatch.setattr(cli, "_configure_cache", lambda cfg: configured.append(cfg.run.memory_cache_mb))
+    real_load_documents = loaders.load_documents
+
+    def recording_load_documents(paths, **kwargs):
+        pools.append(kwargs["pool"])
+        return real_load_documents(paths, **kwargs)
+    monkeypatch.setattr(loaders, "load_documents", recording_load_documents)
+
+    result = CliRunner().invoke(cli.app, [
+        "batch", "--manifest", str(tmp_path / "deals.json"), "--out", str(tmp_path / "out"),
+        "--config", str(tmp_path / "base.json"),
+    ])
+    assert result.exit_code == 0, result.output
+
+    assert configured == [256]
+    assert len(pools) == 4 and pools[0] is not None and all(p is pools[0] for p in pools)
@@ -0,0 +1,167 @@
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from typer.testing import CliRunner
+
+from ddgpt import cli
+from ddgpt.utils.cache import (
+    MISSING, clear_memory_cache, configure_memory_cache, disk_cache_get, disk_cache_put, disk_cached,
+)
+from ddgpt.utils.cache_store import DB_FILENAME, get_store
+
+
+def test_disk_cached_round_trip_and_counters(tmp_path):
+    cache_dir = str(tmp_path)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"pages": ["x" * 1000]}
+
+    assert disk_cached(cache_dir, "ns", "k1", compute) == {"pages": ["x" * 1000]}
+    clear_memory_cache()  # force the second lookup through to SQLite
+    assert disk_cached(cache_dir, "ns", "k1", compute) == {"pages": ["x" * 1000]}
+    assert len(calls) == 1
+
+    [stats] = get_store(cache_dir).stats()
+    assert stats["entries"] == 1
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["bytes_stored"] < 1000  # compressed
+
+
+def test_put_if_absent_keeps_first_writer(tmp_path):
+    cache_dir = str(tmp_path)
+    disk_cache_put(cache_dir, "ns", "k", "first")
+    disk_cache_put(cache_dir, "ns", "k", "second")
+    assert disk_cache_get(cache_dir, "ns", "k") == "first"
+
+
+def test_concurrent_writers_and_readers_never_see_partial_entries(tmp_path):
+    cache_dir = str(tmp_path)
+    value = list(range(10_000))
+
+    def work(i):
+        disk_cache_put(cache_dir, "ns", f"k{i % 5}", value)
+        got = disk_cache_get(cache_dir, "ns", f"k{i % 5}")
+        return got is MISSING or got == value
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert all(pool.map(work, range(64)))
+
+
+def test_namespace_budget_evicts_least_recently_read(tmp_path):
+    cache_dir = str(tmp_path)
+    store = get_store(cache_dir)
+    blob = bytes(range(256)) * 40  # ~10KB, incompressible enough
+    try:
+        configure_memory_cache(0)  # every read goes to SQLite
+        disk_cache_put(cache_dir, "ns", "a", blob)
+        disk_cache_put(cache_dir, "ns", "b", blob)
+        disk_cache_get(cache_dir, "ns", "a")  # a is now more recent than b
+
+        entry_size = store.stats()[0]["bytes_stored"] // 2
+        store.set_budgets({"ns": entry_size * 2})
+        disk_cache_put(cache_dir, "ns", "c", blob)
+
+        assert disk_cache_get(cache_dir, "ns", "b") is MISSING
+        assert disk_cache_get(cache_dir, "ns", "a") == blob
+        assert disk_cache_get(cache_dir, "ns", "c") == blob
+        assert store.stats()[0]["evictions"] == 1
+    finally:
+        configure_memory_cache(256 * 1024 * 1024)
+
+
+def test_cache_cli_stats_prune_vacuum(tmp_path):
+    config = tmp_path / "cfg.json"
+    config.write_text('{"run": {"cache_dir": "%s", "cache_budgets_mb": {"ns": 0}}}' % (tmp_path / "c"))
+    disk_cache_put(str(tmp_path / "c"), "ns", "k", "v")
+
+    runner = CliRunner()
+    result = runner.invoke(cli.app, ["cache", "stats", "--config", str(config)])
+    assert result.exit_code == 0 and "ns" in result.output
+
+    result = runner.invoke(cli.app, ["cache", "prune", "--config", str(config)])
+    assert result.exit_code == 0 and "ns: evicted 1 entries" in result.output
+
+    result = runner.invoke(cli.app, ["cache", "vacuum", "--config", str(config)])
+    assert result.exit_code == 0
+
+
+def test_memory_tier_serves_repeat_lookups_without_touching_disk(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path)
+    disk_cache_put(cache_dir, "ns", "k", {"rows": [1, 2, 3]})
+
+    store = get_store(cache_dir)
+
+    def fail(*args):
+        raise AssertionError("memory tier hit should not read SQLite")
+
+    monkeypatch.setattr(store, "get_pickled", fail)
+    assert disk_cache_get(cache_dir, "ns", "k") == {"rows": [1, 2, 3]}
+
+
+def test_memory_tier_is_bounded_by_bytes(tmp_path):
+    from ddgpt.utils.cache import memory_cache_stats
+
+    cache_dir = str(tmp_path)
+    try:
+        configure_memory_cache(3000)
+        for i in range(5):
+            disk_cache_put(cache_dir, "ns", f"k{i}", "x" * 1000)
+        stats = memory_cache_stats()
+        assert stats["bytes"] <= 3000
+        assert stats["entries"] == 2
+        # Evicted from memory, still on disk.
+        assert disk_cache_get(cache_dir, "ns", "k0") == "x" * 1000
+    finally:
+        configure_memory_cache(256 * 1024 * 1024)
+
+
+def test_reads_do_not_wait_on_the_write_lock_and_counters_are_flushed(tmp_path):
+    cache_dir = str(tmp_path)
+    store = get_store(cache_dir)
+    disk_cache_put(cache_dir, "ns", "k", "v")
+    clear_memory_cache()
+
+    writer = sqlite3.connect(store.path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")  # another process mid-write
+    try:
+        t0 = time.perf_counter()
+        assert disk_cache_get(cache_dir, "ns", "k") == "v"
+        assert disk_cache_get(cache_dir, "ns", "absent") is MISSING
+        assert time.perf_counter() - t0 < 1.0
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+    [stats] = store.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_stored_size_is_a_running_total_and_old_databases_are_migrated(tmp_path):
+    cache_dir = str(tmp_path)
+    store = get_store(cache_dir)
+    for key in "abc":
+        disk_cache_put(cache_dir, "ns", key, bytes(range(256)) * 40)
+    store.clear_key("ns", "a")
+    store.set_budgets({"ns": store.stats()[0]["bytes_stored"] // 2 + 1})
+    disk_cache_put(cache_dir, "ns", "d", bytes(range(256)) * 40)
+
+    def running_total(path):
+        with sqlite3.connect(path) as conn:
+            return conn.execute("SELECT bytes_stored FROM counters WHERE namespace = 'ns'").fetchone()[0]
+    assert running_total(store.path) == store.stats()[0]["bytes_stored"]
+
+    old = tmp_path / "old"
+    old.mkdir()
+    with sqlite3.connect(old / DB_FILENAME) as conn:
+        conn.executescript(
+            "CREATE TABLE entries (namespace TEXT, key TEXT, value BLOB, size INTEGER, created_at REAL, "
+            "last_access REAL, PRIMARY KEY (namespace, key)) WITHOUT ROWID;"
+            "CREATE TABLE counters (namespace TEXT PRIMARY KEY, hits INTEGER NOT NULL DEFAULT 0, "
+            "misses INTEGER NOT NULL DEFAULT 0, bytes_read INTEGER NOT NULL DEFAULT 0, "
+            "bytes_written INTEGER NOT NULL DEFAULT 0, evictions INTEGER NOT NULL DEFAULT 0);"
+            "INSERT INTO entries VALUES ('ns', 'k', x'00', 700, 0, 0);"
+        )
+    assert running_total(get_store(str(old)).path) == 700
@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ddgpt import cli
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.io.loaders import load_document
+from ddgpt.pipeline.checkpoint import RunCheckpoint
+from ddgpt.pipeline.orchestrator import DiligencePipeline
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+KEYS = {"extract": "e", "rules": "r", "memo": "m", "report": "p"}
+
+
+class _CrashingExtractor(RegexExtractor):
+    """Counts extractions and dies on a chosen document, like a run killed partway."""
+
+    def __init__(self, crash_on=None):
+        super().__init__()
+        self.crash_on = crash_on
+        self.extracted = []
+
+    def extract(self, doc_name, pages):
+        if doc_name == self.crash_on:
+            raise RuntimeError("Ollama went away")
+        self.extracted.append(doc_name)
+        return super().extract(doc_name, pages)
+
+
+def _docs(tmp_path):
+    paths = []
+    for i, fee in enumerate(["2.0", "2.0", "1.5"]):
+        p = tmp_path / f"doc_{i}.txt"
+        p.write_text(f"Fund AUM: $1.2B\nManagement Fee: {fee}%\n")
+        paths.append(str(p))
+    return paths
+
+
+def _pipeline(extractor):
+    return DiligencePipeline([extractor], [NumericMismatchRule(0.03, 0.25, 2.0)])
+
+
+def test_resumed_run_only_extracts_unfinished_documents(tmp_path):
+    docs = [load_document(p) for p in _docs(tmp_path)]
+    out = tmp_path / "out"
+
+    with pytest.raises(RuntimeError):
+        _pipeline(_CrashingExtractor(crash_on="doc_2.txt")).run(docs, checkpoint=RunCheckpoint(out, "k", KEYS))
+
+    extractor = _CrashingExtractor()
+    resumed = _pipeline(extractor).run(docs, checkpoint=RunCheckpoint(out, "k", KEYS, resume=True))
+
+    assert extractor.extracted == ["doc_2.txt"]
+    assert resumed["extracted"] == _pipeline(_CrashingExtractor()).run(docs)["extracted"]
+    assert [f["type"] for f in resumed["flags"]] == ["MGMT_FEE_MISMATCH"] * 2
+
+
+def test_changed_file_config_or_fresh_run_is_not_resumed(tmp_path):
+    paths = _docs(tmp_path)
+    out = tmp_path / "out"
+    checkpoint = RunCheckpoint(out, "k", KEYS)
+    _pipeline(_CrashingExtractor()).run([load_document(p) for p in paths], checkpoint=checkpoint)
+    assert checkpoint.stage("memo") is not None
+
+    Path(paths[0]).write_text("Fund AUM: $1.3B\nManagement Fee: 2.0%\n")
+    assert RunCheckpoint(out, "k", KEYS, resume=True).completed(paths) == paths[1:]
+    # Different document set: per-document results still apply, stage outputs don't.
+    assert RunCheckpoint(out, "k", {**KEYS, "memo": "m2"}, resume=True).stage("memo") is None
+
+    assert RunCheckpoint(out, "other-config", KEYS, resume=True).completed(paths) == []
+    RunCheckpoint(out, "k", KEYS)  # without resume, starts over
+    assert not (out / "checkpoint").exists()
+
+
+def test_documents_are_keyed_on_the_callers_input_path(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    old.mkdir()
+    paths = _docs(old)
+    docs = [load_document(p) for p in paths]  # as cached under their original paths
+    old.rename(new)
+    moved = [str(new / Path(p).name) for p in paths]
+    out = tmp_path / "out"
+
+    checkpoint = RunCheckpoint(out, "k", KEYS)
+    _pipeline(_CrashingExtractor()).extract_documents(docs, {}, checkpoint=checkpoint, paths=moved)
+
+    resumed = RunCheckpoint(out, "k", KEYS, resume=True)
+    assert resumed.completed(moved) == moved
+    assert set(resumed.ingestion(moved)) == {"doc_0.txt", "doc_1.txt", "doc_2.txt"}
+    assert sorted(f.name for f in (out / "checkpoint").iterdir() if not f.name.startswith("doc_")) == [
+        "checkpoint.json"
+    ]
+
+
+def test_streamed_run_keys_documents_on_the_callers_input_path(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    old.mkdir()
+    paths = _docs(old)
+    docs = [load_document(p) for p in paths]
+    old.rename(new)
+    moved = [str(new / Path(p).name) for p in paths]
+    out = tmp_path / "out"
+
+    _pipeline(_CrashingExtractor()).run(iter(docs), checkpoint=RunCheckpoint(out, "k", KEYS), paths=iter(moved))
+
+    assert RunCheckpoint(out, "k", KEYS, resume=True).completed(moved) == moved
+
+
+def test_cli_resume_skips_loading_finished_documents(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # prompts_dir is relative
+    monkeypatch.setenv("CO_API_KEY", "")
+    config = tmp_path / "cfg.json"
+    config.write_text(json.dumps({
+        "run": {"use_cohere": False, "enable_pdf_output": False, "enable_disk_cache": False},
+        "ollama": {"enabled": False},
+    }))
+    (tmp_path / "in").mkdir()
+    _docs(tmp_path / "in")
+    out = tmp_path / "out"
+    args = ["run", "--input", str(tmp_path / "in"), "--out", str(out), "--config", str(config)]
+
+    def memo_crash(*args, **kwargs):
+        raise RuntimeError("killed while writing the memo")
+    with monkeypatch.context() as m:
+        m.setattr(DiligencePipeline, "generate_memo", memo_crash)
+        assert CliRunner().invoke(cli.app, args).exit_code != 0
+    assert len(list((out / "checkpoint").glob("doc_*.json"))) == 3
+
+    loaded = []
+    load_docs = cli._load_docs
+    monkeypatch.setattr(cli, "_load_docs", lambda cfg, paths: loaded.extend(paths) or load_docs(cfg, paths))
+    result = CliRunner().invoke(cli.app, args + ["--resume"])
+    assert result.exit_code == 0, result.output
+
+    assert loaded == []
+    manifest = json.loads((out / "audit_manifest.json").read_text())
+    assert manifest["resumed_documents"] == ["doc_0.txt", "doc_1.txt", "doc_2.txt"]
+    assert set(manifest["ingestion"]) == {"doc_0.txt", "doc_1.txt", "doc_2.txt"}
+    assert len(json.loads((out / "extracted.json").read_text())) == 3
+    assert len(json.loads((out / "flags.json").read_text())) == 2
+    assert json.loads((out / "run_summary.json").read_text())["documents_resumed"] == manifest["resumed_documents"]
+    assert not (out / "checkpoint").exists()
@@ -1,4 +1,5 @@
 from pathlib import Path
+import json
 import os
 import subprocess
 import sys
@@ -7,7 +8,9 @@ def test_run_smoke(tmp_path):
     env = dict(os.environ)
     env["CO_API_KEY"] = ""  # force regex-only fallback; load_dotenv(override=False) won't clobber a set-but-empty var
     out = tmp_path / "out"
-    cmd = [sys.executable, "-m", "ddgpt", "run", "--input", "sample_docs", "--out", str(out)]
+    config = tmp_path / "cfg.json"
+    config.write_text(json.dumps({"run": {"cache_dir": str(tmp_path / "cache")}}))  # not the repo's .cache/
+    cmd = [sys.executable, "-m", "ddgpt", "run", "--input", "sample_docs", "--out", str(out), "--config", str(config)]
     env["PYTHONPATH"] = "src"
     subprocess.check_call(cmd, cwd=Path(__file__).resolve().parents[1], env=env)
     assert (out / "extracted.json").exists()
@@ -0,0 +1,58 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from ddgpt.extract.schemas import ExtractedDoc
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Third-party packages that only extraction/loading/reporting need.
+HEAVY = ["fitz", "pymupdf", "camelot", "pdfplumber", "pytesseract", "pandas", "matplotlib", "reportlab", "cohere", "httpx", "cv2"]
+
+# Cumulative `import ddgpt.cli` time, generous against CI noise: it was
+# ~1.1 s with every dependency imported eagerly, ~0.2 s without.
+MAX_CLI_IMPORT_S = 0.75
+
+
+def _python(code, tmp_path):
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT / "src"), CO_API_KEY="")
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def _loaded_after(code, tmp_path):
+    probe = f"import json, sys\n{code}\nprint(json.dumps(sorted(m for m in {HEAVY!r} if m in sys.modules)))"
+    return json.loads(_python(probe, tmp_path).stdout.strip().splitlines()[-1])
+
+
+def test_help_imports_no_heavy_dependencies(tmp_path):
+    code = "from ddgpt.cli import app\ntry:\n    app(['--help'])\nexcept SystemExit:\n    pass"
+    assert _loaded_after(code, tmp_path) == []
+
+
+def test_flag_imports_no_heavy_dependencies(tmp_path):
+    out = tmp_path / "out"
+    out.mkdir()
+    docs = []
+    for name, fee in (("deck.pdf", 2.0), ("lpa.pdf", 1.5)):
+        doc = ExtractedDoc(doc_name=name)
+        doc.mgmt_fee.value = fee
+        docs.append(doc.model_dump())
+    (out / "extracted.json").write_text(json.dumps(docs, default=str))
+
+    code = f"from ddgpt.cli import app\napp(['flag', '--out', {str(out)!r}], standalone_mode=False)"
+
+    assert _loaded_after(code, tmp_path) == []
+    assert [f["type"] for f in json.loads((out / "flags.json").read_text())] == ["MGMT_FEE_MISMATCH"]
+
+
+def test_cli_import_time_is_bounded(tmp_path):
+    stderr = _python("import ddgpt.cli", tmp_path).stderr
+    line = next(l for l in stderr.splitlines() if l.rstrip().endswith("| ddgpt.cli"))
+    cumulative_us = int(line.split("|")[1])
+
+    assert cumulative_us / 1e6 < MAX_CLI_IMPORT_S
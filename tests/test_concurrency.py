@@ -0,0 +1,125 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from ddgpt.utils.concurrency import ConcurrencyLimiter, backoff_delay, get_limiter, limited, limited_async
+
+
+def test_limiter_caps_in_flight_calls_across_threads():
+    limiter = get_limiter("test:cap", 2)
+    peak = 0
+    active = 0
+    lock = threading.Lock()
+
+    def call(_):
+        nonlocal peak, active
+        with limited(limiter):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(call, range(16)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_tightest_configured_limit_wins_for_shared_key():
+    assert get_limiter("test:shared", 4).limit == 4
+    assert get_limiter("test:shared", 1).limit == 1
+    assert get_limiter("test:shared", 3).limit == 1
+
+
+def test_errors_halve_the_window_once_per_round_and_successes_grow_it_back():
+    limiter = ConcurrencyLimiter(8)
+
+    # Four calls in flight together all fail: one decrease, not four.
+    starts = [limiter.acquire() for _ in range(4)]
+    for started_at in starts:
+        limiter.release(started_at, ok=False)
+    assert limiter.limit == 4
+
+    for _ in range(40):
+        limiter.release(limiter.acquire(), ok=True)
+    assert limiter.limit == 8  # capped at the configured ceiling
+
+
+def test_calls_slower_than_latency_target_shrink_the_window():
+    limiter = ConcurrencyLimiter(4, latency_target_s=0.01)
+
+    with limited(limiter):
+        time.sleep(0.02)
+
+    assert limiter.limit == 2
+
+
+def test_raising_call_counts_as_error_but_cancellation_does_not():
+    limiter = ConcurrencyLimiter(4)
+
+    with pytest.raises(RuntimeError):
+        with limited(limiter):
+            raise RuntimeError("429 Too Many Requests")
+    assert limiter.limit == 2
+
+    async def cancelled():
+        async with limited_async(limiter):
+            raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancelled())
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
+
+
+def test_async_waiters_share_the_count_with_threads():
+    limiter = ConcurrencyLimiter(1)
+    order = []
+
+    async def call(i):
+        async with limited_async(limiter):
+            order.append(i)
+            await asyncio.sleep(0.01)
+
+    async def main():
+        await asyncio.gather(*(call(i) for i in range(3)))
+
+    limiter_holder = limiter.acquire()  # a thread holds the only slot
+    runner = threading.Thread(target=asyncio.run, args=(main(),))
+    runner.start()
+    time.sleep(0.05)
+    assert order == []  # every coroutine is waiting, loop not blocked by acquire
+    limiter.release(limiter_holder)
+    runner.join(timeout=5)
+
+    assert sorted(order) == [0, 1, 2]
+
+
+def test_backoff_delay_is_jittered_within_exponential_bound():
+    delays = [backoff_delay(2.0, 2) for _ in range(200)]
+    assert all(0.0 <= d <= 8.0 for d in delays)
+    assert len(set(delays)) > 1
+
+
+def test_memo_and_extraction_share_the_configured_models_limiter(monkeypatch):
+    from ddgpt.config import Config
+    from ddgpt.pipeline.builders import build_copilot, build_extractors
+
+    monkeypatch.setenv("CO_API_KEY", "test-key")  # clients are built, never called
+    cfg = Config()
+    cfg.model.model = "command-r-test"
+    cfg.run.prompts_dir = str(Path(__file__).resolve().parents[1] / "prompts")
+    cfg.ollama.enabled = False
+
+    [extractor] = [e for e in build_extractors(cfg) if type(e).__name__ == "CohereExtractor"]
+    copilot = build_copilot(cfg)
+
+    assert isinstance(copilot.limiter, ConcurrencyLimiter)
+    assert copilot.limiter is extractor.limiter
@@ -0,0 +1,36 @@
+import time
+
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.io.loaders import load_document
+from ddgpt.pipeline.orchestrator import DiligencePipeline
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+
+
+def _write_docs(tmp_path, n):
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"doc_{i}.txt"
+        p.write_text(f"Performance Summary\nAUM: ${1 + i * 0.5:.2f}B\nNet IRR: {10 + i}.0%\n", encoding="utf-8")
+        paths.append(str(p))
+    return paths
+
+
+class _SlowRegexExtractor(RegexExtractor):
+    def extract(self, doc_name, pages):
+        # Later documents finish first, so any ordering bug shows up.
+        time.sleep(0.02 * (5 - int(doc_name.split("_")[1].split(".")[0])))
+        return super().extract(doc_name, pages)
+
+
+def test_parallel_run_matches_serial_run_in_stable_order(tmp_path):
+    docs = [load_document(p) for p in _write_docs(tmp_path, 4)]
+    rules = [NumericMismatchRule(0.03, 0.25, 2.0)]
+
+    serial = DiligencePipeline([_SlowRegexExtractor()], rules).run(docs)
+    parallel = DiligencePipeline([_SlowRegexExtractor()], rules, document_workers=4).run(docs)
+
+    assert [d["doc_name"] for d in parallel["extracted"]] == [f"doc_{i}.txt" for i in range(4)]
+    assert parallel["extracted"] == serial["extracted"]
+    assert parallel["flags"] == serial["flags"]
+    assert parallel["risk_score"] == serial["risk_score"]
+    assert parallel["timings"]["extraction_wall_s"] < parallel["timings"]["extraction_total_s"]
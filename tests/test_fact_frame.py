@@ -0,0 +1,93 @@
+import random
+
+from ddgpt.risk.engine import RiskEngine
+from ddgpt.rules import fact_frame
+from ddgpt.rules.definition_drift import DefinitionDriftRule
+from ddgpt.rules.fact_frame import FactFrame
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule, pct_delta
+
+
+def _metric(value, page=1):
+    return {"value": value, "evidence": {"page": page, "snippet": f"value {value}"}}
+
+
+def _docs(n, seed=0):
+    rng = random.Random(seed)
+    docs = []
+    for k in range(n):
+        basis = rng.choice(("net", "gross", None, ""))
+        docs.append({
+            "doc_name": f"doc_{k}.pdf",
+            # ints, zeros (pct_delta's zero denominator) and missing values
+            "aum": _metric(rng.choice((None, 0, 1_200_000_000, 1.25e9, 1.2e9))),
+            "mgmt_fee": _metric(rng.choice((None, 2, 2.0, 1.75, 2.05))),
+            "target_irr": _metric(rng.choice((None, 18.0, 20.0, 20.5, 25))),
+            "net_irr": _metric(16.0) | {"evidence": {"page": 2, "snippet": rng.choice(("Net IRR: 16%", "Gross IRR: 18%"))}},
+            "net_irr_basis": None if basis is None else {"basis": basis, "snippet": basis, "page": 2, "section": None},
+        })
+    return docs
+
+
+def _pairwise_reference(rule, docs):
+    # The nested pair loop the columnar checks replace.
+    flags = []
+    for i in range(len(docs)):
+        for j in range(i + 1, len(docs)):
+            A, B = docs[i], docs[j]
+            a, b = A["aum"]["value"], B["aum"]["value"]
+            if a is not None and b is not None and pct_delta(a, b) > rule.aum_tol_pct:
+                flags.append(rule._aum_flag(A, B))
+            a, b = A["mgmt_fee"]["value"], B["mgmt_fee"]["value"]
+            if a is not None and b is not None and abs(a - b) > rule.fee_abs_pct:
+                flags.append(rule._fee_flag(A, B))
+            a, b = A["target_irr"]["value"], B["target_irr"]["value"]
+            if a is not None and b is not None and abs(a - b) > rule.target_irr_abs:
+                flags.append(rule._target_irr_flag(A, B))
+    return flags
+
+
+def test_numeric_mismatch_matches_pairwise_loop_including_order():
+    docs = _docs(60)
+    rule = NumericMismatchRule(aum_tol_pct=0.03, fee_abs_pct=0.10, target_irr_abs=2.0)
+
+    flags = rule.apply(docs)
+
+    assert flags
+    assert [f.model_dump() for f in flags] == [f.model_dump() for f in _pairwise_reference(rule, docs)]
+
+
+def test_results_independent_of_block_size(monkeypatch):
+    docs = _docs(40, seed=3)
+    rule = NumericMismatchRule(aum_tol_pct=0.03, fee_abs_pct=0.10, target_irr_abs=2.0)
+    expected = rule.apply(docs)
+
+    monkeypatch.setattr(fact_frame, "BLOCK_ROWS", 7)
+
+    assert rule.apply(docs) == expected
+
+
+def test_definition_drift_pairs_skip_missing_and_empty_basis():
+    docs = _docs(30, seed=5)
+
+    cross = [f for f in DefinitionDriftRule().apply(docs) if f.type == "IRR_DEFINITION_DRIFT"]
+
+    bases = [(d["net_irr_basis"] or {}).get("basis") for d in docs]
+    expected = [
+        f"{docs[i]['doc_name']} vs {docs[j]['doc_name']}"
+        for i in range(len(docs)) for j in range(i + 1, len(docs))
+        if bases[i] and bases[j] and bases[i] != bases[j]
+    ]
+    assert [f.docs for f in cross] == expected
+
+
+def test_risk_engine_shares_one_frame_and_keeps_rule_outputs():
+    docs = _docs(25, seed=9)
+    rules = [NumericMismatchRule(0.03, 0.10, 2.0), DefinitionDriftRule()]
+
+    flags, _ = RiskEngine(rules).evaluate(docs)
+
+    assert flags == [f for rule in rules for f in rule.apply(docs)]
+
+
+def test_empty_frame():
+    assert NumericMismatchRule(0.03, 0.10, 2.0).apply_frame(FactFrame([])) == []
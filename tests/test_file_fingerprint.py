@@ -0,0 +1,56 @@
+import hashlib
+import os
+
+from ddgpt.provenance.audit import build_inputs_manifest
+from ddgpt.utils import hashing
+from ddgpt.utils.hashing import file_fingerprint
+
+
+def _count_hashes(monkeypatch):
+    calls = []
+    real = hashing.sha256_file
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(hashing, "sha256_file", counting)
+    return calls
+
+
+def test_fingerprint_matches_sha256_and_is_hashed_once(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    p = tmp_path / "deal.pdf"
+    p.write_bytes(b"%PDF-1.4 " * 100_000)
+
+    digests = [file_fingerprint(str(p)) for _ in range(3)]
+    manifest = build_inputs_manifest([str(p)])
+
+    assert digests[0] == hashlib.sha256(p.read_bytes()).hexdigest()
+    assert set(digests) == {manifest[0].sha256}
+    assert len(calls) == 1
+
+
+def test_fingerprint_recomputed_when_file_changes(tmp_path, monkeypatch):
+    calls = _count_hashes(monkeypatch)
+    p = tmp_path / "deal.txt"
+    p.write_text("Net IRR: 16.9%")
+    first = file_fingerprint(str(p))
+
+    p.write_text("Net IRR: 14.2%")
+    st = os.stat(p)
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert file_fingerprint(str(p)) != first
+    assert len(calls) == 2
+
+
+def test_fingerprint_memo_is_bounded(tmp_path):
+    for i in range(3):
+        p = tmp_path / f"doc_{i}.txt"
+        p.write_text(f"doc {i}")
+        file_fingerprint(str(p))
+
+    info = hashing._fingerprint.cache_info()
+    assert info.maxsize == hashing.FINGERPRINT_MEMO_ENTRIES
+    assert info.currsize <= info.maxsize
@@ -1,3 +1,6 @@
+import threading
+import time
+
 from ddgpt.extract.schemas import ExtractedDoc, Metric
 from ddgpt.provenance.evidence import Evidence
 from ddgpt.pipeline.fusion_extractor import FusionExtractor
@@ -120,3 +123,68 @@ def test_table_fallback_recorded_as_distinct_candidate_and_sole_winner():
     assert len(winners) == 1
     assert winners[0]["extractor"] == "TableParser"
     assert winners[0]["value"] == 1.30e9
+
+
+class _SlowExtractor:
+    def __init__(self, value, delay, barrier=None):
+        self.value = value
+        self.delay = delay
+        self.barrier = barrier
+
+    def extract(self, doc_name, pages):
+        if self.barrier is not None:
+            # Only passes once every extractor is running at the same time.
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        return _doc_with_aum(self.value, 0.6)
+
+
+class RegexExtractor(_SlowExtractor):
+    pass
+
+
+class CohereExtractor(_SlowExtractor):
+    pass
+
+
+def test_concurrent_extractors_overlap_and_keep_extractor_order():
+    barrier = threading.Barrier(2)
+    fe = FusionExtractor(
+        [RegexExtractor(1.20e9, 0.05, barrier), CohereExtractor(1.21e9, 0.0, barrier)],
+        extractor_weights={"RegexExtractor": 0.95, "CohereExtractor": 0.70},
+        concurrent_extractors=True,
+    )
+    timings = {}
+
+    result = fe.extract("test.pdf", [], [], timings=timings)
+
+    names = [c["extractor"] for c in result.extraction_candidates["aum"]]
+    assert names == ["RegexExtractor", "CohereExtractor"]
+    assert result.aum.value == 1.20e9
+    assert set(timings) == {"RegexExtractor", "CohereExtractor"}
+    assert timings["RegexExtractor"] >= 0.05
+
+
+def test_serial_and_concurrent_modes_reconcile_identically():
+    def run(concurrent):
+        fe = FusionExtractor(
+            [RegexExtractor(1.20e9, 0.0), CohereExtractor(1.80e9, 0.0)],
+            extractor_weights={"RegexExtractor": 0.95, "CohereExtractor": 0.70},
+            concurrent_extractors=concurrent,
+        )
+        return fe.extract("test.pdf", [], [])
+
+    assert run(True).dict() == run(False).dict()
+
+
+def test_reconcile_never_mutates_cached_extraction(tmp_path):
+    extractor = RegexExtractor(1.20e9, 0.0)
+    fe = FusionExtractor([extractor], cache_dir=str(tmp_path), enable_disk_cache=True)
+
+    fe.extract("test.pdf", [], [])
+    cached = fe._extract_with_cache(extractor, "test.pdf", [])
+
+    # _reconcile wrote candidates onto the doc it returned -- not onto the
+    # instance the in-memory cache tier hands out.
+    assert cached.extraction_candidates == {}
+    assert cached is not fe._extract_with_cache(extractor, "test.pdf", [])
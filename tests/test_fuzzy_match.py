@@ -0,0 +1,99 @@
+import difflib
+import random
+
+from ddgpt.extract.fuzzy_match import RATIO_TOLERANCE, PageMatcher
+from ddgpt.extract.postprocess import FUZZY_MATCH_THRESHOLD, fuzzy_match_ratio, verify_and_score
+from ddgpt.extract.schemas import ExtractedDoc
+from ddgpt.io.loaders import Page
+from ddgpt.provenance.evidence import Evidence
+
+PAGE = (
+    "performance summary as of december 31, 2024. the fund has called 82% of commitments and "
+    "returned 1.4x paid-in capital. net irr of 16.8% and tvpi of 1.85x reflect three realized "
+    "exits in enterprise software. fund terms: management fee of 2.00% on committed capital "
+    "during the investment period, stepping down to 1.50% on invested capital thereafter. "
+    "carried interest of 20% over an 8% preferred return, with a full gp catch-up. the "
+    "limited partnership agreement governs in case of any inconsistency with this summary. "
+) * 4
+
+
+def _whole_page_difflib(snippet, page_text):
+    # The previous implementation, for comparison.
+    matcher = difflib.SequenceMatcher(None, page_text, snippet, autojunk=False)
+    return sum(b.size for b in matcher.get_matching_blocks()) / len(snippet)
+
+
+def _ocr_noise(text, rate, rng):
+    out = []
+    for ch in text:
+        r = rng.random()
+        if r < rate / 3:
+            out.append(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789"))
+        elif r < 2 * rate / 3:
+            continue
+        elif r < rate:
+            out.append(ch + rng.choice(" -"))
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def test_exact_substring_and_empty_snippet():
+    matcher = PageMatcher(PAGE)
+
+    assert matcher.ratio("net irr of 16.8% and tvpi of 1.85x") == 1.0
+    assert matcher.ratio("") == 0.0
+    assert fuzzy_match_ratio("management fee of 2.00%", PAGE) == 1.0
+
+
+def test_noisy_snippets_score_exactly_as_whole_page_difflib():
+    rng = random.Random(7)
+    matcher = PageMatcher(PAGE)
+
+    for _ in range(40):
+        length = rng.randint(40, 140)
+        start = rng.randint(0, len(PAGE) - length)
+        for rate in (0.03, 0.08, 0.25):
+            snippet = _ocr_noise(PAGE[start:start + length], rate, rng)
+            assert abs(matcher.ratio(snippet) - _whole_page_difflib(snippet, PAGE)) <= RATIO_TOLERANCE
+
+
+def test_no_verdict_changes_against_difflib_on_adversarial_pages():
+    # Tiny alphabets make repeated blocks and difflib's tie-breaks matter.
+    rng = random.Random(11)
+    for _ in range(2000):
+        alphabet = rng.choice(["ab", "abcd ", "fee irr 0123456789.%"])
+        page = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 300)))
+        start = rng.randint(0, len(page) - 1)
+        snippet = "".join(c if rng.random() > 0.2 else rng.choice(alphabet) for c in page[start:start + 50])
+        old = _whole_page_difflib(snippet, page) if snippet not in page else 1.0
+        new = PageMatcher(page).ratio(snippet)
+        assert new == old
+        assert (new >= FUZZY_MATCH_THRESHOLD) == (old >= FUZZY_MATCH_THRESHOLD)
+
+
+def test_snippet_not_on_page_stays_below_threshold():
+    matcher = PageMatcher(PAGE)
+
+    assert matcher.ratio("gross moic of 3.2x across the co-investment sleeve in healthcare") < FUZZY_MATCH_THRESHOLD
+
+
+def test_verify_and_score_flags_verbatim_fuzzy_and_missing_evidence():
+    page = Page(page_num=3, text=PAGE.upper())
+    doc = ExtractedDoc(doc_name="fund_quarter_update.pdf")
+    doc.net_irr.value = 16.8
+    doc.net_irr.confidence = 0.9
+    doc.net_irr.evidence = Evidence(doc_name=doc.doc_name, page=3, snippet="Net IRR of 16.8% and TVPI of 1.85x")
+    doc.tvpi.value = 1.85
+    doc.tvpi.confidence = 0.9
+    doc.tvpi.evidence = Evidence(doc_name=doc.doc_name, page=3, snippet="net lrr of 16.8% and tvp1 of 1.85x reflect")
+    doc.mgmt_fee.value = 2.0
+    doc.mgmt_fee.confidence = 0.9
+    doc.mgmt_fee.evidence = Evidence(doc_name=doc.doc_name, page=3, snippet="the fee is charged quarterly in arrears on nav")
+
+    verify_and_score(doc, [page])
+
+    notes = " ".join(doc.notes)
+    assert "net_irr:" not in notes
+    assert "tvpi: evidence snippet matched page fuzzily" in notes
+    assert "mgmt_fee: evidence snippet not found verbatim on cited page" in notes
@@ -0,0 +1,141 @@
+import copy
+import json
+import random
+
+from ddgpt.risk.engine import RiskEngine
+from ddgpt.rules.definition_drift import DefinitionDriftRule
+from ddgpt.rules.extractor_disagreement import ExtractorDisagreementRule
+from ddgpt.rules.fact_frame import FactFrame
+from ddgpt.rules.internal_inconsistency import InternalInconsistencyRule
+from ddgpt.rules.irr_mention_conflict import IRRMentionConflictRule
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+
+
+def _metric(value, page=1):
+    return {"value": value, "evidence": {"page": page, "snippet": f"value {value}"}}
+
+
+def _doc(k, rng):
+    basis = rng.choice(("net", "gross", None))
+    return {
+        "doc_name": f"doc_{k}.pdf",
+        "aum": _metric(rng.choice((None, 1_200_000_000, 1.25e9, 1.2e9))),
+        "mgmt_fee": _metric(rng.choice((None, 2.0, 1.75))),
+        "target_irr": _metric(rng.choice((None, 18.0, 20.0, 25.0))),
+        "net_irr": _metric(rng.choice((None, 16.0, 19.0))) | {"evidence": {"page": 2, "snippet": rng.choice(("Net IRR: 16%", "Gross IRR: 18%"))}},
+        "net_irr_basis": None if basis is None else {"basis": basis, "snippet": basis, "page": 2, "section": None},
+        "irr_mentions": [{"value": rng.choice((16.0, 22.0)), "basis": "gross", "page": 4, "snippet": "targeting 22% gross"}],
+        "extractor_disagreements": rng.choice(([], [{"field": "aum", "values": {"regex": 1.2, "llm": 1.3}, "agreement": 0.4}])),
+    }
+
+
+def _docs(n, seed=0):
+    rng = random.Random(seed)
+    return [_doc(k, rng) for k in range(n)]
+
+
+def _rules(aum_tol_pct=0.03):
+    return [
+        NumericMismatchRule(aum_tol_pct, 0.10, 2.0),
+        DefinitionDriftRule(),
+        InternalInconsistencyRule(),
+        ExtractorDisagreementRule(),
+        IRRMentionConflictRule(1.0),
+    ]
+
+
+def _full(docs, rules=None):
+    return RiskEngine(rules or _rules()).evaluate(docs)
+
+
+def test_first_run_with_state_matches_full_run(tmp_path):
+    docs = _docs(20)
+
+    assert RiskEngine(_rules()).evaluate(docs, state_path=tmp_path / "risk_state.json") == _full(docs)
+    assert (tmp_path / "risk_state.json").exists()
+
+
+def test_added_removed_and_changed_documents_match_full_run(tmp_path):
+    state = tmp_path / "risk_state.json"
+    rng = random.Random(1)
+    docs = _docs(20, seed=1)
+    RiskEngine(_rules()).evaluate(docs, state_path=state)
+
+    for step in range(12):
+        docs = copy.deepcopy(docs)
+        action = step % 3
+        if action == 0:
+            docs.insert(rng.randrange(len(docs) + 1), _doc(100 + step, rng))
+        elif action == 1:
+            docs.pop(rng.randrange(len(docs)))
+        else:
+            docs[rng.randrange(len(docs))]["mgmt_fee"]["value"] = rng.choice((None, 2.0, 1.5, 2.5))
+
+        flags, score = RiskEngine(_rules()).evaluate(docs, state_path=state)
+
+        assert (flags, score) == _full(docs)
+
+
+def test_only_pairs_and_documents_involving_changes_are_reevaluated(tmp_path, monkeypatch):
+    state = tmp_path / "risk_state.json"
+    docs = _docs(15, seed=2)
+    RiskEngine(_rules()).evaluate(docs, state_path=state)
+
+    docs = docs + [_doc(99, random.Random(3))]
+    calls = {"involving": [], "doc_flags": 0}
+    real_pairs = FactFrame.pairs
+    real_doc_flags = InternalInconsistencyRule.doc_flags
+
+    def spy_pairs(self, violates, involving=None):
+        calls["involving"].append(involving)
+        return real_pairs(self, violates, involving)
+
+    def spy_doc_flags(self, doc):
+        calls["doc_flags"] += 1
+        return real_doc_flags(self, doc)
+
+    monkeypatch.setattr(FactFrame, "pairs", spy_pairs)
+    monkeypatch.setattr(InternalInconsistencyRule, "doc_flags", spy_doc_flags)
+
+    RiskEngine(_rules()).evaluate(docs, state_path=state)
+
+    assert calls["involving"] and all(list(i) == [15] for i in calls["involving"])
+    assert calls["doc_flags"] == 1
+
+
+def test_changed_rule_parameters_invalidate_stored_results(tmp_path):
+    state = tmp_path / "risk_state.json"
+    docs = _docs(20, seed=4)
+    RiskEngine(_rules(aum_tol_pct=0.03)).evaluate(docs, state_path=state)
+
+    loose = _rules(aum_tol_pct=0.5)
+
+    assert RiskEngine(loose).evaluate(docs, state_path=state) == _full(docs, _rules(aum_tol_pct=0.5))
+
+
+def test_reordered_documents_fall_back_to_full_evaluation(tmp_path):
+    state = tmp_path / "risk_state.json"
+    docs = _docs(12, seed=5)
+    RiskEngine(_rules()).evaluate(docs, state_path=state)
+
+    docs = list(reversed(docs))
+
+    assert RiskEngine(_rules()).evaluate(docs, state_path=state) == _full(docs)
+
+
+def test_unreadable_or_stale_state_is_ignored(tmp_path):
+    state = tmp_path / "risk_state.json"
+    docs = _docs(10, seed=6)
+
+    state.write_text("{not json")
+    assert RiskEngine(_rules()).evaluate(docs, state_path=state) == _full(docs)
+
+    state.write_text(json.dumps({"version": "0", "documents": [], "rules": []}))
+    assert RiskEngine(_rules()).evaluate(docs, state_path=state) == _full(docs)
+
+
+def test_duplicate_documents_evaluate_in_full(tmp_path):
+    docs = _docs(6, seed=7)
+    docs = docs + [copy.deepcopy(docs[0])]
+
+    assert RiskEngine(_rules()).evaluate(docs, state_path=tmp_path / "risk_state.json") == _full(docs)
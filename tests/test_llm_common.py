@@ -1,6 +1,11 @@
+import asyncio
+import threading
+import time
+
 from ddgpt.io.loaders import Page
 from ddgpt.extract.schemas import ExtractedDoc, Metric
-from ddgpt.extract.llm_common import chunk_pages, sanitize_extraction, merge_chunk_docs
+from ddgpt.extract.llm_common import chunk_pages, extract_chunks, sanitize_extraction, merge_chunk_docs
+from ddgpt.extract.ollama_extractor import OllamaExtractor
 
 
 def test_chunk_pages_splits_when_over_budget():
@@ -86,3 +91,63 @@ def test_sanitize_extraction_leaves_null_and_zero_values_untouched():
     assert sanitized["mgmt_fee"]["value"] is None
     assert sanitized["carry"]["value"] == 0
     assert sanitized["notes"] == []
+
+
+def _slow_chunk_recorder(delays):
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def extract_chunk(doc_name, pages):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(delays[pages[0].page_num])
+        with lock:
+            state["in_flight"] -= 1
+        doc = ExtractedDoc(doc_name=doc_name)
+        doc.notes.append(f"chunk starting p.{pages[0].page_num}")
+        return doc
+
+    return extract_chunk, state
+
+
+def test_extract_chunks_returns_chunk_order_not_completion_order():
+    chunks = [[Page(page_num=i, text="x")] for i in range(1, 5)]
+    # Earlier chunks finish last.
+    extract_chunk, state = _slow_chunk_recorder({1: 0.15, 2: 0.10, 3: 0.05, 4: 0.0})
+
+    docs = extract_chunks(extract_chunk, "x", chunks, max_concurrency=4)
+
+    assert [d.notes[0] for d in docs] == [f"chunk starting p.{i}" for i in range(1, 5)]
+    assert state["peak"] > 1
+
+
+def test_extract_chunks_respects_in_flight_limit():
+    chunks = [[Page(page_num=i, text="x")] for i in range(1, 7)]
+    extract_chunk, state = _slow_chunk_recorder({i: 0.02 for i in range(1, 7)})
+
+    extract_chunks(extract_chunk, "x", chunks, max_concurrency=2)
+
+    assert state["peak"] == 2
+
+
+def test_llm_extractor_merges_concurrent_chunks_in_order(monkeypatch):
+    monkeypatch.setattr("ddgpt.extract.ollama_extractor.MAX_CHARS_PER_CALL", 10)
+    extractor = OllamaExtractor("m", 0.0, "prompt", host="http://localhost:1", max_concurrency=3)
+
+    async def fake_chunk(doc_name, pages):
+        # Later chunks finish first.
+        await asyncio.sleep(0.01 * (4 - pages[0].page_num))
+        doc = ExtractedDoc(doc_name=doc_name)
+        doc.aum = Metric(value=pages[0].page_num * 1e9, confidence=0.5)  # tie on confidence
+        return doc
+
+    extractor._extract_chunk = fake_chunk
+    pages = [Page(page_num=i, text="x" * 10) for i in range(1, 4)]
+
+    merged = extractor.extract("x", pages)
+
+    # merge_chunk_docs keeps the first chunk on a confidence tie -- only
+    # deterministic if chunk results arrive in chunk order.
+    assert merged.aum.value == 1e9
+    assert "3 chunks" in merged.notes[-1]
@@ -0,0 +1,71 @@
+import fitz
+
+from ddgpt.ingestion import ocr
+from ddgpt.io.loaders import load_document
+
+
+def _scanned_pdf(path, label):
+    # One page with a real text layer, one "scanned" page (a drawn shape,
+    # no text) that the loader has to OCR.
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), f"{label}: a page with a perfectly normal text layer on it.")
+    scanned = doc.new_page()
+    scanned.draw_rect(fitz.Rect(100, 100, 300, 200), fill=(0, 0, 0))
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def _count_ocr_calls(monkeypatch):
+    calls = []
+
+    def fake_ocr(png_bytes):
+        calls.append(len(png_bytes))
+        return "Net IRR: 16.9% (recovered by OCR)"
+
+    monkeypatch.setattr(ocr, "ocr_png_bytes", fake_ocr)
+    return calls
+
+
+def test_scanned_page_ocr_text_replaces_empty_text_layer(tmp_path, monkeypatch):
+    calls = _count_ocr_calls(monkeypatch)
+    path = _scanned_pdf(tmp_path / "a.pdf", "Fund A")
+
+    doc = load_document(path, ocr_dpi=50)
+
+    assert len(calls) == 1  # only the page without a text layer
+    assert "recovered by OCR" in doc.pages[1].text
+    assert "Fund A" in doc.pages[0].text
+
+
+def test_ocr_page_cache_reused_across_runs_and_documents(tmp_path, monkeypatch):
+    calls = _count_ocr_calls(monkeypatch)
+    cache_dir = str(tmp_path / "cache")
+
+    first = _scanned_pdf(tmp_path / "a.pdf", "Fund A")
+    load_document(first, ocr_dpi=50, ocr_cache_dir=cache_dir)
+    assert len(calls) == 1
+
+    load_document(first, ocr_dpi=50, ocr_cache_dir=cache_dir)
+    assert len(calls) == 1  # same file re-run: no new OCR
+
+    # A different file whose scanned page renders identically.
+    second = _scanned_pdf(tmp_path / "b.pdf", "Fund B")
+    doc = load_document(second, ocr_dpi=50, ocr_cache_dir=cache_dir)
+    assert len(calls) == 1
+    assert "recovered by OCR" in doc.pages[1].text
+
+
+def test_ocr_page_cache_key_depends_on_dpi(tmp_path):
+    path = _scanned_pdf(tmp_path / "a.pdf", "Fund A")
+    doc = fitz.open(path)
+    try:
+        low = ocr.ocr_page_cache_key(doc[1].get_pixmap(dpi=50), 50)
+        high = ocr.ocr_page_cache_key(doc[1].get_pixmap(dpi=72), 72)
+        again = ocr.ocr_page_cache_key(doc[1].get_pixmap(dpi=50), 50)
+    finally:
+        doc.close()
+
+    assert low != high
+    assert low == again
@@ -0,0 +1,69 @@
+from ddgpt.extract.postprocess import verify_and_score
+from ddgpt.extract.schemas import ExtractedDoc
+from ddgpt.io import page_index as page_index_module
+from ddgpt.io.loaders import Page
+from ddgpt.io.page_index import PageIndex
+from ddgpt.layout import irr_mentions
+from ddgpt.layout.irr_mentions import find_irr_mentions
+from ddgpt.provenance.evidence import Evidence
+
+
+def _pages(n=300):
+    pages = [Page(page_num=i, text=f"Page {i}\n  narrative   text about the portfolio.") for i in range(1, n + 1)]
+    pages[249] = Page(page_num=250, text="Performance\nNet IRR:   16.8%\nTVPI: 1.85x\nManagement Fee: 2.00%")
+    return pages
+
+
+def test_lookup_by_page_number_and_unknown_pages():
+    index = PageIndex(_pages())
+
+    assert index.text(250).startswith("Performance")
+    assert index.text(999) == ""
+    assert index.text(None) == ""
+    assert index.normalized_text(250) == "performance net irr: 16.8% tvpi: 1.85x management fee: 2.00%"
+    assert len(index) == 300
+    assert [p.page_num for p in index][:3] == [1, 2, 3]
+
+
+def test_first_page_wins_on_duplicate_page_numbers():
+    index = PageIndex([Page(page_num=1, text="first"), Page(page_num=1, text="second")])
+
+    assert index.text(1) == "first"
+
+
+def test_verify_and_score_normalizes_each_cited_page_once(monkeypatch):
+    calls = []
+    real_normalize = page_index_module.normalize
+    monkeypatch.setattr(page_index_module, "normalize", lambda text: calls.append(text) or real_normalize(text))
+
+    doc = ExtractedDoc(doc_name="fund_quarter_update.pdf")
+    for field, value, snippet in (
+        ("net_irr", 16.8, "Net IRR: 16.8%"),
+        ("tvpi", 1.85, "TVPI: 1.85x"),
+        ("mgmt_fee", 2.0, "Management Fee: 2.00%"),
+    ):
+        metric = getattr(doc, field)
+        metric.value = value
+        metric.confidence = 0.9
+        metric.evidence = Evidence(doc_name=doc.doc_name, page=250, snippet=snippet)
+
+    verify_and_score(doc, _pages())
+
+    assert len(calls) == 1
+    assert not [n for n in doc.notes if "evidence snippet" in n]
+
+
+def test_irr_mentions_scanned_once_per_index(monkeypatch):
+    calls = []
+    real_scan = irr_mentions._scan_irr_mentions
+    monkeypatch.setattr(irr_mentions, "_scan_irr_mentions", lambda pages: calls.append(1) or real_scan(pages))
+    pages = _pages()
+    index = PageIndex(pages)
+
+    first = find_irr_mentions(index)
+    first[0]["value"] = -1.0  # callers get their own copies
+    second = find_irr_mentions(index)
+
+    assert len(calls) == 1
+    assert second == find_irr_mentions(pages)
+    assert second[0]["value"] == 16.8
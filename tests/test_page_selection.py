@@ -0,0 +1,71 @@
+from ddgpt.extract.page_selection import score_pages, select_pages
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.io.loaders import Page
+from ddgpt.layout.models import DocumentLayout, Section
+from ddgpt.pipeline.fusion_extractor import FusionExtractor
+
+BOILERPLATE = "The Partnership may be subject to risks including market, liquidity and regulatory risk. " * 40
+
+
+def _pages():
+    return [
+        Page(page_num=1, text="Risk Factors\n" + BOILERPLATE),
+        Page(page_num=2, text="Performance Summary\nNet IRR: 16.9%\nTVPI: 1.55x\nAssets Under Management (AUM): $1.20B"),
+        Page(page_num=3, text="Legal Notices\n" + BOILERPLATE),
+        Page(page_num=4, text="Key Terms\nManagement Fee: 2.0%\nCarry: 20% over an 8% preferred return"),
+    ]
+
+
+def test_financial_pages_outscore_boilerplate():
+    layout = DocumentLayout(sections=[
+        Section(title="Risk Factors", canonical_type="risk_factors", page_start=1, page_end=1),
+        Section(title="Performance Summary", canonical_type="performance_summary", page_start=2, page_end=2),
+    ])
+    scores = score_pages(_pages(), layout)
+
+    assert scores[2] > scores[4] > scores[1] == scores[3] == 0
+
+
+def test_selection_respects_budget_and_keeps_document_order():
+    pages, record = select_pages(_pages(), None, token_budget=200)
+
+    assert pages == [2, 4]
+    assert record["pages_sent"] == [2, 4]
+    assert record["pages_skipped"] == [1, 3]
+    assert record["estimated_tokens_sent"] <= 200
+
+
+def test_best_page_always_sent_even_over_budget():
+    pages, _ = select_pages(_pages(), None, token_budget=1)
+    assert pages == [2]
+
+
+class _RecordingLLMExtractor:
+    IS_LLM_BACKED = True
+
+    def __init__(self):
+        self.seen = []
+
+    def extract(self, doc_name, pages):
+        self.seen = [p.page_num for p in pages]
+        return RegexExtractor().extract(doc_name, pages)
+
+
+def test_only_llm_backed_extractors_get_selected_pages():
+    llm = _RecordingLLMExtractor()
+    fe = FusionExtractor([llm, RegexExtractor()], llm_page_token_budget=200)
+
+    result = fe.extract("deal.pdf", _pages(), [])
+
+    assert llm.seen == [2, 4]
+    assert result.llm_page_selection["pages_skipped"] == [1, 3]
+    # Regex still read every page.
+    assert result.mgmt_fee.value == 2.0
+
+
+def test_selection_off_by_default():
+    llm = _RecordingLLMExtractor()
+    result = FusionExtractor([llm]).extract("deal.pdf", _pages(), [])
+
+    assert llm.seen == [1, 2, 3, 4]
+    assert result.llm_page_selection is None
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from ddgpt import cli
+from ddgpt.config import Config
+from ddgpt.io import loaders
+from ddgpt.io.loaders import load_documents
+
+
+def _write_docs(tmp_path, n):
+    paths = []
+    for i in range(n):
+        p = tmp_path / f"doc_{i}.txt"
+        p.write_text(f"Performance Summary\nNet IRR: {10 + i}.0%\n", encoding="utf-8")
+        paths.append(str(p))
+    return paths
+
+
+def test_load_documents_preserves_input_order_across_worker_pool(tmp_path):
+    paths = _write_docs(tmp_path, 4)
+
+    docs = load_documents(paths, workers=2)
+
+    assert [d.doc_name for d in docs] == [f"doc_{i}.txt" for i in range(4)]
+    assert "13.0%" in docs[3].pages[0].text
+
+
+def test_load_docs_only_sends_cache_misses_to_loader(tmp_path, monkeypatch):
+    paths = _write_docs(tmp_path, 3)
+
+    cfg = Config()
+    cfg.run.cache_dir = str(tmp_path / "cache")
+    cfg.run.load_workers = 2
+
+    cli._load_docs(cfg, paths[:2])  # warm the cache for the first two files
+
+    sent = []
+    real_load_documents = loaders.load_documents
+
+    def recording_load_documents(batch, **kwargs):
+        sent.extend(batch)
+        return real_load_documents(batch, **kwargs)
+
+    monkeypatch.setattr(loaders, "load_documents", recording_load_documents)
+
+    docs = cli._load_docs(cfg, paths)
+
+    assert sent == [paths[2]]
+    assert [d.doc_name for d in docs] == ["doc_0.txt", "doc_1.txt", "doc_2.txt"]
+
+
+def test_loader_pool_workers_ocr_serially(tmp_path, monkeypatch):
+    paths = _write_docs(tmp_path, 2)
+    seen = []
+
+    def fake_load_document(path, ocr_enabled=True, ocr_dpi=300, ocr_workers=1, *args, **kwargs):
+        seen.append(ocr_workers)
+        return path
+
+    monkeypatch.setattr(loaders, "load_document", fake_load_document)
+
+    load_documents(paths, workers=1, ocr_workers=4)
+    assert seen == [4, 4]
+
+    seen.clear()
+    with ThreadPoolExecutor(max_workers=2) as pool:  # stands in for the process pool
+        load_documents(paths, workers=2, ocr_workers=4, pool=pool)
+    assert seen == [1, 1]
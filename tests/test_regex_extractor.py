@@ -45,3 +45,41 @@ def test_net_irr_extracted_without_colon_on_separate_line():
     doc = RegexExtractor().extract("doc.pdf", pages)
 
     assert doc.net_irr.value == 16.80
+
+
+def test_primary_pattern_wins_even_when_fallback_appears_first():
+    # "Effective Date" is only a fallback for "As-of Date", even when it
+    # appears on an earlier page.
+    pages = [
+        Page(page_num=1, text="Effective Date: 2023-01-01"),
+        Page(page_num=2, text="As-of Date: 2024-03-31"),
+    ]
+
+    doc = RegexExtractor().extract("doc.pdf", pages)
+
+    assert doc.doc_date == "2024-03-31"
+
+
+def test_leftmost_match_on_first_matching_page_is_used():
+    pages = [
+        Page(page_num=1, text="no figures here"),
+        Page(page_num=2, text="Net IRR (gross of nothing) 12.00% ... Net IRR: 16.80%"),
+        Page(page_num=3, text="Net IRR: 99.90%"),
+    ]
+
+    doc = RegexExtractor().extract("doc.pdf", pages)
+
+    # The primary (colon) pattern matches on page 2, so page 3 is never
+    # consulted.
+    assert doc.net_irr.value == 16.80
+    assert doc.net_irr.evidence.page == 2
+
+
+def test_labels_match_case_insensitively_including_unicode_folds():
+    # re.IGNORECASE treats dotless "ı" as "i"; the prefilter must too.
+    pages = [Page(page_num=1, text="MANAGEMENT FEE: 1.75%\nnet ıRR: 14.20%")]
+
+    doc = RegexExtractor().extract("doc.pdf", pages)
+
+    assert doc.mgmt_fee.value == 1.75
+    assert doc.net_irr.value == 14.20
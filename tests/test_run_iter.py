@@ -0,0 +1,147 @@
+import json
+import time
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ddgpt import cli
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.io.loaders import load_document
+from ddgpt.pipeline.events import (
+    DocumentLoaded, DocumentVerified, ExtractorFinished, MemoReady, RulesDone, RunComplete,
+)
+from ddgpt.pipeline.orchestrator import DiligencePipeline
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _paths(tmp_path):
+    paths = []
+    for i, fee in enumerate(["2.0", "2.0", "1.5"]):
+        p = tmp_path / f"doc_{i}.txt"
+        p.write_text(f"Fund AUM: $1.2B\nManagement Fee: {fee}%\n")
+        paths.append(str(p))
+    return paths
+
+
+def _pipeline(extractor=None, document_workers=1):
+    return DiligencePipeline([extractor or RegexExtractor()], [NumericMismatchRule(0.03, 0.25, 2.0)],
+                             document_workers=document_workers)
+
+
+def test_events_arrive_in_stage_order_and_end_with_run_result(tmp_path):
+    docs = [load_document(p) for p in _paths(tmp_path)]
+
+    events = list(_pipeline(document_workers=2).run_iter(docs))
+
+    kinds = [e.event for e in events]
+    assert kinds.count("document_loaded") == 3
+    assert kinds.count("extractor_finished") == 3
+    assert kinds.count("document_verified") == 3
+    assert kinds[-3:] == ["rules_done", "memo_ready", "run_complete"]
+    for doc in ("doc_0.txt", "doc_1.txt", "doc_2.txt"):
+        per_doc = [type(e) for e in events if getattr(e, "doc_name", None) == doc]
+        assert per_doc == [DocumentLoaded, ExtractorFinished, DocumentVerified]
+
+    rules_done = next(e for e in events if isinstance(e, RulesDone))
+    assert [f["type"] for f in rules_done.flags] == ["MGMT_FEE_MISMATCH"] * 2
+    assert "risk_rules_s" in rules_done.timings and "memo_generation_s" not in rules_done.timings
+    assert "memo_generation_s" in next(e for e in events if isinstance(e, MemoReady)).timings
+
+    result = events[-1].result
+    assert result == {**_pipeline().run(docs), "timings": result["timings"]}
+    assert [d["doc_name"] for d in result["extracted"]] == ["doc_0.txt", "doc_1.txt", "doc_2.txt"]
+
+
+def test_documents_are_extracted_while_later_ones_load(tmp_path):
+    log = []
+
+    def slow_loader():
+        for p in _paths(tmp_path):
+            time.sleep(0.2)
+            log.append(f"loaded {Path(p).name}")
+            yield load_document(p)
+
+    for event in _pipeline().run_iter(slow_loader()):
+        if isinstance(event, DocumentVerified):
+            log.append(f"verified {event.doc_name}")
+
+    assert log.index("verified doc_0.txt") < log.index("loaded doc_2.txt")
+    assert isinstance(event, RunComplete)
+
+
+def test_extraction_failure_is_raised_from_the_iterator(tmp_path):
+    class _Broken(RegexExtractor):
+        def extract(self, doc_name, pages):
+            raise RuntimeError("Ollama went away")
+
+    with pytest.raises(RuntimeError, match="Ollama went away"):
+        list(_pipeline(_Broken()).run_iter([load_document(p) for p in _paths(tmp_path)]))
+
+
+def test_cli_run_streams_extracted_jsonl(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # prompts_dir is relative
+    monkeypatch.setenv("CO_API_KEY", "")
+    config = tmp_path / "cfg.json"
+    config.write_text(json.dumps({
+        "run": {"use_cohere": False, "enable_pdf_output": False, "enable_disk_cache": False},
+        "ollama": {"enabled": False},
+    }))
+    (tmp_path / "in").mkdir()
+    _paths(tmp_path / "in")
+    out = tmp_path / "out"
+
+    result = CliRunner().invoke(cli.app, ["run", "--input", str(tmp_path / "in"), "--out", str(out),
+                                          "--config", str(config)])
+    assert result.exit_code == 0, result.output
+
+    streamed = [json.loads(line) for line in (out / "extracted.jsonl").read_text().splitlines()]
+    extracted = json.loads((out / "extracted.json").read_text())
+    assert sorted(streamed, key=lambda d: d["doc_name"]) == extracted
+
+
+def test_lazy_loader_does_not_run_ahead_of_extraction(tmp_path):
+    in_flight = []
+    loaded = 0
+
+    class _Slow(RegexExtractor):
+        def extract(self, doc_name, pages):
+            time.sleep(0.05)
+            return super().extract(doc_name, pages)
+
+    def loader():
+        nonlocal loaded
+        for i in range(6):
+            p = tmp_path / f"doc_{i}.txt"
+            p.write_text("Fund AUM: $1.2B\n")
+            loaded += 1
+            yield load_document(str(p))
+
+    verified = 0
+    for event in _pipeline(_Slow(), document_workers=2).run_iter(loader()):
+        if isinstance(event, DocumentVerified):
+            verified += 1
+        in_flight.append(loaded - verified)
+    assert max(in_flight) <= 3  # two extracting, one loaded and waiting for a worker
+
+
+def test_extraction_failure_stops_loading_promptly(tmp_path):
+    class _Broken(RegexExtractor):
+        def extract(self, doc_name, pages):
+            raise RuntimeError("Ollama went away")
+
+    loaded = []
+
+    def loader():
+        for i in range(20):
+            p = tmp_path / f"doc_{i}.txt"
+            p.write_text("Fund AUM: $1.2B\n")
+            time.sleep(0.02)
+            loaded.append(i)
+            yield load_document(str(p))
+
+    with pytest.raises(RuntimeError, match="Ollama went away"):
+        list(_pipeline(_Broken()).run_iter(loader()))
+    assert len(loaded) <= 2
@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from ddgpt import cli
+from ddgpt.config import Config, ServeConfig
+from ddgpt.pipeline.server import make_server
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+class _StandInOllama(BaseHTTPRequestHandler):
+    """Local stand-in for an Ollama server: answers the reachability probe
+    and returns a fixed extraction for every generate call."""
+    probes = 0
+    generates = 0
+    delay = 0.0
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        type(self).probes += 1
+        self._send({"version": "0.0-test"})
+
+    def do_POST(self):
+        type(self).generates += 1
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.delay)
+        self._send({"response": json.dumps({"doc_name": "ignored", "notes": ["stand-in"]})})
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def stand_in_ollama():
+    _StandInOllama.probes = _StandInOllama.generates = 0
+    _StandInOllama.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInOllama)
+    yield _serve(server)
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def ddgpt_server(tmp_path, stand_in_ollama, monkeypatch):
+    monkeypatch.setenv("CO_API_KEY", "")
+    cfg = Config.model_validate({
+        "ollama": {"host": stand_in_ollama},
+        "run": {
+            "use_cohere": False,
+            "enable_pdf_output": False,
+            "enable_disk_cache": False,
+            "prompts_dir": str(REPO_ROOT / "prompts"),
+        },
+    })
+    servers = []
+
+    def start(workers=2, max_queued_jobs=16, max_finished_jobs=256):
+        serve_cfg = ServeConfig(workers=workers, max_queued_jobs=max_queued_jobs,
+                                max_finished_jobs=max_finished_jobs, jobs_dir=str(tmp_path / "jobs"))
+        manager = cli._build_job_manager(cfg, serve_cfg, {})
+        server = make_server(manager, cli._resolve_job_paths, port=0)
+        servers.append((server, manager))
+        return _serve(server)
+
+    yield start
+    for server, manager in servers:
+        server.shutdown()
+        server.server_close()
+        manager.shutdown()
+
+
+def _request(url, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _wait(base, job_id, status="succeeded"):
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        job = json.loads(_request(f"{base}/jobs/{job_id}")[1])
+        if job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} never reached {status}")
+
+
+def _sample(tmp_path):
+    doc = tmp_path / "fund_update.txt"
+    doc.write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\nNet IRR: 16.5%\n")
+    return str(doc)
+
+
+def test_job_runs_on_warm_workers_and_serves_artifacts(tmp_path, ddgpt_server):
+    base = ddgpt_server(workers=2)
+    probes_at_startup = _StandInOllama.probes
+
+    status, body = _request(f"{base}/jobs", {"paths": [_sample(tmp_path)]})
+    assert status == 202
+    first = _wait(base, json.loads(body)["job_id"])
+    second = _wait(base, json.loads(_request(f"{base}/jobs", {"paths": [_sample(tmp_path)]})[1])["job_id"])
+
+    assert {
+        "extracted.json", "flags.json", "ic_memo.md", "facts_table.csv", "run_summary.json",
+        "audit_manifest.json", "stage_manifest.json",
+    } <= set(first["artifacts"])
+    status, body = _request(f"{base}/jobs/{first['job_id']}/artifacts/extracted.json")
+    assert status == 200
+    assert json.loads(body)[0]["doc_name"] == "fund_update.txt"
+    assert second["summary"]["flags"] == first["summary"]["flags"]
+
+    # Both workers probed Ollama once when they were built; jobs don't.
+    assert probes_at_startup == 2
+    assert _StandInOllama.probes == probes_at_startup
+    assert _StandInOllama.generates >= 2
+
+
+def test_event_stream_follows_job_to_completion(tmp_path, ddgpt_server):
+    base = ddgpt_server(workers=1)
+    job_id = json.loads(_request(f"{base}/jobs", {"paths": [_sample(tmp_path)]})[1])["job_id"]
+
+    with urllib.request.urlopen(f"{base}/jobs/{job_id}/events", timeout=30) as resp:
+        assert resp.headers["Content-Type"] == "text/event-stream"
+        events = [line.split(": ", 1)[1] for line in resp.read().decode().splitlines() if line.startswith("event: ")]
+
+    assert events == ["queued", "running", "documents_loaded", "succeeded"]
+
+
+def test_queue_is_bounded_and_bad_requests_rejected(tmp_path, ddgpt_server):
+    _StandInOllama.delay = 1.0
+    base = ddgpt_server(workers=1, max_queued_jobs=1)
+    payload = {"paths": [_sample(tmp_path)]}
+
+    running = json.loads(_request(f"{base}/jobs", payload)[1])["job_id"]
+    _wait(base, running, status="running")
+    assert _request(f"{base}/jobs", payload)[0] == 202
+    assert _request(f"{base}/jobs", payload)[0] == 503
+
+    assert _request(f"{base}/jobs", {"paths": [str(tmp_path / "missing.pdf")]})[0] == 400
+    assert _request(f"{base}/jobs", {})[0] == 400
+    assert _request(f"{base}/jobs/nope")[0] == 404
+
+
+def test_old_finished_jobs_are_forgotten_but_keep_their_artifacts(tmp_path, ddgpt_server):
+    base = ddgpt_server(workers=1, max_finished_jobs=2)
+    payload = {"paths": [_sample(tmp_path)]}
+
+    job_ids = []
+    for _ in range(3):
+        job_ids.append(json.loads(_request(f"{base}/jobs", payload)[1])["job_id"])
+        _wait(base, job_ids[-1])
+
+    assert _request(f"{base}/jobs/{job_ids[0]}")[0] == 404
+    assert (tmp_path / "jobs" / job_ids[0] / "extracted.json").exists()
+    assert [_request(f"{base}/jobs/{i}")[0] for i in job_ids[1:]] == [200, 200]
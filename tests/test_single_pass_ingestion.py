@@ -0,0 +1,72 @@
+import fitz
+
+from ddgpt.extract.vision_extractor import OllamaVisionExtractor
+from ddgpt.io.loaders import load_document
+from ddgpt.layout.section_parser import parse_sections
+
+
+def _deck_pdf(path):
+    doc = fitz.open()
+
+    text_page = doc.new_page()
+    text_page.insert_text((72, 72), "Performance Summary", fontsize=16)
+    text_page.insert_text((72, 100), "Net IRR (since inception): 16.9% net of fees.")
+
+    chart_page = doc.new_page()
+    chart_page.insert_text((72, 72), "AUM growth by quarter, drawn as a vector bar chart.")
+    for i in range(15):
+        chart_page.draw_rect(fitz.Rect(80 + i * 20, 400 - i * 10, 95 + i * 20, 400), fill=(0.1, 0.2, 0.5))
+
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_single_pass_text_and_sections_match_separate_walks(tmp_path):
+    path = _deck_pdf(tmp_path / "deck.pdf")
+
+    loaded = load_document(path, ocr_enabled=False)
+
+    doc = fitz.open(path)
+    try:
+        assert [p.text for p in loaded.pages] == [page.get_text("text") for page in doc]
+        sections, footnotes = parse_sections(doc)
+    finally:
+        doc.close()
+
+    assert loaded.layout.sections == sections
+    assert loaded.layout.footnotes == footnotes
+
+
+def test_inventory_flags_only_drawing_heavy_page_as_chart_candidate(tmp_path):
+    loaded = load_document(_deck_pdf(tmp_path / "deck.pdf"), ocr_enabled=False)
+
+    assert [inv.page_num for inv in loaded.inventory] == [1, 2]
+    assert loaded.inventory[1].vector_count >= 15
+    assert loaded.chart_candidate_pages() == [2]
+
+
+def test_text_document_has_no_chart_prescreen(tmp_path):
+    p = tmp_path / "notes.txt"
+    p.write_text("Net IRR: 12.0%", encoding="utf-8")
+
+    assert load_document(str(p)).chart_candidate_pages() is None
+
+
+def test_extract_charts_only_renders_prescreened_pages(tmp_path):
+    path = _deck_pdf(tmp_path / "deck.pdf")
+    extractor = OllamaVisionExtractor("extract any chart")
+    calls = []
+
+    async def fake_extract_page(doc_name, page_num, png_bytes):
+        calls.append(page_num)
+        return []
+
+    extractor._extract_page = fake_extract_page
+
+    extractor.extract_charts("deck.pdf", path, page_numbers=[2])
+    assert calls == [2]
+
+    calls.clear()
+    extractor.extract_charts("deck.pdf", path, page_numbers=[])
+    assert calls == []
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from ddgpt import cli
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _run(tmp_path, rules=None, incremental=True):
+    cfg = {
+        "run": {"use_cohere": False, "enable_pdf_output": False, "cache_dir": str(tmp_path / "cache")},
+        "ollama": {"enabled": False},
+    }
+    if rules:
+        cfg["rules"] = rules
+    config = tmp_path / "cfg.json"
+    config.write_text(json.dumps(cfg))
+
+    input_dir = tmp_path / "in"
+    args = ["run", "--input", str(input_dir), "--out", str(tmp_path / "out"), "--config", str(config)]
+    if incremental:
+        args.append("--incremental")
+    result = CliRunner().invoke(cli.app, args)
+    assert result.exit_code == 0, result.output
+    return json.loads((tmp_path / "out" / "run_summary.json").read_text())
+
+
+def _setup(tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)  # prompts_dir is relative
+    monkeypatch.setenv("CO_API_KEY", "")
+    (tmp_path / "in").mkdir()
+    sample = REPO_ROOT / "sample_docs" / "Manager_Update_Atlas_Growth_Fund_III_v2.txt"
+    (tmp_path / "in" / sample.name).write_text(sample.read_text())
+
+
+def _no_loading(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("extraction should have been reused")
+    monkeypatch.setattr(cli, "_load_docs", fail)
+
+
+def test_unchanged_rerun_reuses_every_stage(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    assert _run(tmp_path)["stages_reused"] == []
+    flags = (tmp_path / "out" / "flags.json").read_text()
+
+    _no_loading(monkeypatch)
+
+    assert _run(tmp_path)["stages_reused"] == ["extract", "rules", "memo", "report"]
+    assert (tmp_path / "out" / "flags.json").read_text() == flags
+
+
+def test_rule_config_change_reruns_only_rules_onward(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    _run(tmp_path)
+    _no_loading(monkeypatch)
+
+    summary = _run(tmp_path, rules={"aum_tolerance_pct": 0.5})
+
+    assert summary["stages_reused"] == ["extract"]
+    assert "risk_rules_s" in summary["timings_s"]
+    assert "extraction_wall_s" not in summary["timings_s"]
+
+
+def test_changed_input_or_edited_output_is_recomputed(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    _run(tmp_path)
+
+    flags_path = tmp_path / "out" / "flags.json"
+    flags_path.write_text(flags_path.read_text() + "\n")  # hand-edited
+    assert _run(tmp_path)["stages_reused"] == ["extract"]
+
+    (tmp_path / "in" / "extra.txt").write_text("Fund AUM: $1.5B\nManagement Fee: 2.5%\n")
+    summary = _run(tmp_path)
+    assert summary["stages_reused"] == []
+    assert summary["document_count"] == 2
+
+
+def test_full_run_records_manifest_for_later_incremental_runs(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+    _run(tmp_path, incremental=False)
+    _no_loading(monkeypatch)
+
+    assert _run(tmp_path)["stages_reused"] == ["extract", "rules", "memo", "report"]
@@ -0,0 +1,61 @@
+from ddgpt.extract.tables.ensemble_tables import EnsembleTableExtractor
+from ddgpt.extract.tables.page_screen import is_table_candidate, screen_table_pages
+from ddgpt.io.loaders import Page, load_document
+
+
+def test_prose_page_is_not_a_table_candidate():
+    text = (
+        "The Partnership may incur indebtedness from time to time. Nothing in this "
+        "Agreement shall be construed to limit the authority of the General Partner."
+    )
+    assert not is_table_candidate(text)
+
+
+def test_performance_table_page_is_a_candidate():
+    text = "Metric\nCurrent\nBenchmark\nAUM\n$1.25B\n$950M\nNet IRR\n16.8%\n14.2%\nTVPI\n1.62x\n1.41x"
+    assert is_table_candidate(text)
+
+
+def test_single_labeled_value_is_a_candidate():
+    assert is_table_candidate("Net IRR 16.8%")
+
+
+def test_screen_records_candidates_and_skipped_pages():
+    pages = [
+        Page(page_num=1, text="Confidential -- December 2025"),
+        Page(page_num=2, text="Net IRR 16.8% | TVPI 1.62x | AUM $1.25B"),
+        Page(page_num=3, text="Risk factors are described below in prose."),
+    ]
+
+    screen = screen_table_pages(pages)
+
+    assert screen.candidate_pages == [2]
+    assert screen.skipped_pages == [1, 3]
+
+
+def test_ensemble_runs_backends_only_on_candidate_pages():
+    seen = []
+
+    class FakeBackend:
+        def extract(self, pdf_path, pages=None):
+            seen.append(pages)
+            return []
+
+    ensemble = EnsembleTableExtractor()
+    ensemble.extractors = [FakeBackend(), FakeBackend()]
+
+    ensemble.extract("doc.pdf", pages=[2, 3])
+    assert seen == [[2, 3], [2, 3]]
+
+    seen.clear()
+    ensemble.extract("other.pdf", pages=[])
+    assert seen == []  # nothing tabular: neither backend is invoked
+
+
+def test_loader_skips_cover_page_but_keeps_table_pages():
+    doc = load_document("sample_docs/test_packet.pdf", ocr_enabled=False)
+
+    assert doc.table_screen.skipped_pages == [1]
+    assert doc.table_screen.candidate_pages == [2, 3]
+    assert doc.tables
+    assert {t.page for t in doc.tables} <= {2, 3}
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ddgpt.extract import transport
+from ddgpt.extract.ollama_extractor import OllamaExtractor, ollama_is_available
+from ddgpt.io.loaders import Page
+
+
+class _FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    client_ports = set()
+    delay = 0.0
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.client_ports.add(self.client_address[1])
+        self._send({"version": "0.0-test"})
+
+    def do_POST(self):
+        self.client_ports.add(self.client_address[1])
+        self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.delay)
+        self._send({"response": json.dumps({"doc_name": "ignored", "notes": []})})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_ollama():
+    _FakeOllama.client_ports = set()
+    _FakeOllama.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_to_one_host_reuse_pooled_connections(fake_ollama):
+    for _ in range(5):
+        assert ollama_is_available(fake_ollama)
+
+    extractor = OllamaExtractor("m", 0.0, "extract", host=fake_ollama)
+    extractor.extract("a.pdf", [Page(page_num=1, text="Net IRR: 16.9%")])
+
+    assert len(_FakeOllama.client_ports) == 1
+
+
+def test_chunks_fan_out_concurrently_on_the_transport_loop(fake_ollama, monkeypatch):
+    monkeypatch.setattr("ddgpt.extract.ollama_extractor.MAX_CHARS_PER_CALL", 10)
+    _FakeOllama.delay = 0.2
+    extractor = OllamaExtractor("m", 0.0, "extract", host=fake_ollama, max_concurrency=8)
+    pages = [Page(page_num=i, text=f"page {i} text") for i in range(1, 9)]
+
+    start = time.perf_counter()
+    doc = extractor.extract("a.pdf", pages)
+
+    assert doc.doc_name == "a.pdf"
+    assert time.perf_counter() - start < 8 * 0.2
+
+
+def test_cancelling_a_call_cancels_the_inflight_request(fake_ollama):
+    _FakeOllama.delay = 1.0
+
+    async def call_then_cancel():
+        task = asyncio.ensure_future(transport.post_json_async(fake_ollama, "/api/generate", {}))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return True
+
+    start = time.perf_counter()
+    assert transport.run_sync(call_then_cancel())
+    assert time.perf_counter() - start < 1.0
+
+
+def test_non_2xx_and_unreachable_surface_as_transport_error():
+    with pytest.raises(transport.TransportError):
+        transport.get_json("http://localhost:1", "/api/version", timeout=0.5)
@@ -1,58 +1,41 @@
+import asyncio
 import json as json_mod
 
 import pytest
 
+from ddgpt.extract import transport
 from ddgpt.extract.vision_extractor import OllamaVisionExtractor, ollama_vision_is_available
 from ddgpt.ingestion.page_render import render_pages_png
 
 PROMPT = "extract any chart on this page"
 
 
-class _FakeResponse:
-    def __init__(self, payload, status_code=200):
-        self._payload = payload
-        self.status_code = status_code
-
-    def raise_for_status(self):
-        if self.status_code != 200:
-            raise RuntimeError(f"HTTP {self.status_code}")
-
-    def json(self):
-        return self._payload
-
-
 def test_ollama_vision_is_available_false_when_unreachable():
     # Port 1 is a reserved/unroutable port -- guaranteed nothing is listening.
     assert ollama_vision_is_available("http://localhost:1", "llama3.2-vision", timeout=0.5) is False
 
 
 def test_ollama_vision_is_available_false_when_model_not_pulled(monkeypatch):
-    import requests
-
-    def fake_get(url, timeout):
-        return _FakeResponse({"models": [{"name": "llama3.2:3b"}]})
+    def fake_get(host, path, call_type, timeout):
+        return {"models": [{"name": "llama3.2:3b"}]}
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(transport, "get_json", fake_get)
     assert ollama_vision_is_available("http://localhost:11434", "llama3.2-vision") is False
 
 
 def test_ollama_vision_is_available_true_when_model_pulled(monkeypatch):
-    import requests
-
-    def fake_get(url, timeout):
-        return _FakeResponse({"models": [{"name": "llama3.2-vision:latest"}]})
+    def fake_get(host, path, call_type, timeout):
+        return {"models": [{"name": "llama3.2-vision:latest"}]}
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(transport, "get_json", fake_get)
     assert ollama_vision_is_available("http://localhost:11434", "llama3.2-vision") is True
 
 
 def test_extract_charts_skips_non_pdf_without_network_call(monkeypatch):
-    import requests
-
-    def fail_post(*args, **kwargs):
+    async def fail_post(*args, **kwargs):
         raise AssertionError("should not make a network call for a non-PDF path")
 
-    monkeypatch.setattr(requests, "post", fail_post)
+    monkeypatch.setattr(transport, "post_json_async", fail_post)
 
     extractor = OllamaVisionExtractor(PROMPT)
     result = extractor.extract_charts("doc.txt", "sample_docs/Manager_Update_Atlas_Growth_Fund_III_v2.txt")
@@ -60,21 +43,17 @@ def test_extract_charts_skips_non_pdf_without_network_call(monkeypatch):
 
 
 def test_extract_page_returns_empty_list_when_no_chart(monkeypatch):
-    import requests
-
-    def fake_post(url, json, timeout):
-        return _FakeResponse({"response": json_mod.dumps({"charts": []})})
+    async def fake_post(host, path, payload, call_type):
+        return {"response": json_mod.dumps({"charts": []})}
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(transport, "post_json_async", fake_post)
 
     extractor = OllamaVisionExtractor(PROMPT)
-    result = extractor._extract_page("doc.pdf", 1, b"fake-png-bytes")
+    result = asyncio.run(extractor._extract_page("doc.pdf", 1, b"fake-png-bytes"))
     assert result == []
 
 
 def test_extract_page_parses_chart_with_series(monkeypatch):
-    import requests
-
     payload = {
         "charts": [
             {
@@ -91,13 +70,13 @@ def test_extract_page_parses_chart_with_series(monkeypatch):
         ]
     }
 
-    def fake_post(url, json, timeout):
-        return _FakeResponse({"response": json_mod.dumps(payload)})
+    async def fake_post(host, path, body, call_type):
+        return {"response": json_mod.dumps(payload)}
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(transport, "post_json_async", fake_post)
 
     extractor = OllamaVisionExtractor(PROMPT)
-    result = extractor._extract_page("doc.pdf", 3, b"fake-png-bytes")
+    result = asyncio.run(extractor._extract_page("doc.pdf", 3, b"fake-png-bytes"))
 
     assert len(result) == 1
     assert result[0]["page"] == 3
@@ -108,8 +87,6 @@ def test_extract_page_parses_chart_with_series(monkeypatch):
 
 
 def test_extract_page_parses_multiple_charts_on_same_page(monkeypatch):
-    import requests
-
     payload = {
         "charts": [
             {"chart_type": "bar", "title": "Revenue Growth", "series": [{"label": "A", "value": 84}], "summary": "s1"},
@@ -117,13 +94,13 @@ def test_extract_page_parses_multiple_charts_on_same_page(monkeypatch):
         ]
     }
 
-    def fake_post(url, json, timeout):
-        return _FakeResponse({"response": json_mod.dumps(payload)})
+    async def fake_post(host, path, body, call_type):
+        return {"response": json_mod.dumps(payload)}
 
-    monkeypatch.setattr(requests, "post", fake_post)
+    monkeypatch.setattr(transport, "post_json_async", fake_post)
 
     extractor = OllamaVisionExtractor(PROMPT)
-    result = extractor._extract_page("doc.pdf", 1, b"fake-png-bytes")
+    result = asyncio.run(extractor._extract_page("doc.pdf", 1, b"fake-png-bytes"))
 
     assert len(result) == 2
     assert {c["chart_type"] for c in result} == {"bar", "pie"}
@@ -131,16 +108,14 @@ def test_extract_page_parses_multiple_charts_on_same_page(monkeypatch):
 
 
 def test_extract_page_returns_empty_list_after_retries_exhausted(monkeypatch):
-    import requests
-
-    def fake_post(*args, **kwargs):
-        raise RuntimeError("connection refused")
+    async def fake_post(*args, **kwargs):
+        raise transport.TransportError("connection refused")
 
-    monkeypatch.setattr(requests, "post", fake_post)
-    monkeypatch.setattr("ddgpt.extract.vision_extractor.time.sleep", lambda *_: None)
+    monkeypatch.setattr(transport, "post_json_async", fake_post)
+    monkeypatch.setattr("ddgpt.extract.vision_extractor.RETRY_BACKOFF_SECONDS", 0)
 
     extractor = OllamaVisionExtractor(PROMPT)
-    result = extractor._extract_page("doc.pdf", 1, b"fake-png-bytes")
+    result = asyncio.run(extractor._extract_page("doc.pdf", 1, b"fake-png-bytes"))
     assert result == []
 
 
@@ -158,13 +133,13 @@ def test_render_pages_png_respects_page_numbers_filter():
 
 def test_extract_charts_respects_max_pages_cap():
     extractor = OllamaVisionExtractor(PROMPT, max_pages=1)
-    # No mocking of requests.post here -- if max_pages weren't respected this
+    # No mocking of the transport here -- if max_pages weren't respected this
     # would attempt 3 real HTTP calls against a (likely unreachable) host and
     # take a long time to fail; if it IS respected, only 1 page is attempted
     # and the assertion below on call count (via monkeypatch) confirms it.
     calls = []
 
-    def fake_extract_page(doc_name, page_num, png_bytes):
+    async def fake_extract_page(doc_name, page_num, png_bytes):
         calls.append(page_num)
         return []
 
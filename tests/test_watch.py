@@ -0,0 +1,141 @@
+import json
+import logging
+import os
+
+from ddgpt import cli
+from ddgpt.extract.regex_extractor import RegexExtractor
+from ddgpt.io.loaders import load_documents
+from ddgpt.pipeline.orchestrator import DiligencePipeline
+from ddgpt.pipeline.watch import DirectoryWatcher, WatchSession
+from ddgpt.rules.numeric_mismatch import NumericMismatchRule
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _watcher(tmp_path, clock):
+    return DirectoryWatcher(lambda: sorted(str(p) for p in tmp_path.glob("*.txt")), debounce_s=2.0, clock=clock)
+
+
+def test_burst_of_files_becomes_one_batch_after_quiet_period(tmp_path):
+    clock = _Clock()
+    watcher = _watcher(tmp_path, clock)
+    (tmp_path / "a.txt").write_text("AUM: $1.2B")
+    assert watcher.poll() is None
+
+    clock.now += 1.5
+    (tmp_path / "b.txt").write_text("AUM: $1.3B")
+    assert watcher.poll() is None
+
+    clock.now += 1.0  # 1.0s after the last change: still settling
+    assert watcher.poll() is None
+
+    clock.now += 1.5
+    batch = watcher.poll()
+    assert [os.path.basename(p) for p in batch.changed] == ["a.txt", "b.txt"]
+    assert batch.first_seen == 1000.0
+    assert watcher.poll() is None
+
+
+def test_modified_and_removed_files(tmp_path):
+    clock = _Clock()
+    watcher = _watcher(tmp_path, clock)
+    (tmp_path / "a.txt").write_text("AUM: $1.2B")
+    (tmp_path / "b.txt").write_text("AUM: $1.3B")
+    watcher.poll()
+    clock.now += 3
+    watcher.poll()
+
+    (tmp_path / "a.txt").write_text("AUM: $1.25B, restated")
+    (tmp_path / "b.txt").unlink()
+    watcher.poll()
+    clock.now += 3
+    batch = watcher.poll()
+
+    assert [os.path.basename(p) for p in batch.changed] == ["a.txt"]
+    assert [os.path.basename(p) for p in batch.removed] == ["b.txt"]
+    assert [os.path.basename(p) for p in batch.paths] == ["a.txt"]
+
+
+def test_session_only_extracts_changed_documents_and_refreshes_outputs(tmp_path):
+    room = tmp_path / "room"
+    room.mkdir()
+    out = tmp_path / "out"
+    out.mkdir()
+    (room / "deck.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\n")
+    (room / "lpa.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\n")
+
+    loaded = []
+
+    def load_docs(paths):
+        loaded.append([os.path.basename(p) for p in paths])
+        return load_documents(paths, ocr_enabled=False)
+
+    rules = [NumericMismatchRule(0.03, 0.25, 2.0)]
+    pipeline = DiligencePipeline([RegexExtractor()], rules)
+    clock = _Clock()
+    watcher = _watcher(room, clock)
+    session = WatchSession(pipeline, load_docs, risk_state_path=out / "risk_state.json", clock=clock)
+    watcher.poll()
+    clock.now += 3
+    cli._refresh_watch_outputs(session, watcher, watcher.poll(), out, {}, logging.getLogger("ddgpt"))
+
+    assert json.loads((out / "flags.json").read_text()) == []
+
+    (room / "lpa.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 1.5%\n")
+    watcher.poll()
+    clock.now += 2.5
+    cli._refresh_watch_outputs(session, watcher, watcher.poll(), out, {}, logging.getLogger("ddgpt"))
+
+    assert loaded == [["deck.txt", "lpa.txt"], ["lpa.txt"]]
+    flags = json.loads((out / "flags.json").read_text())
+    assert [f["type"] for f in flags] == ["MGMT_FEE_MISMATCH"]
+    assert [d["doc_name"] for d in json.loads((out / "extracted.json").read_text())] == ["deck.txt", "lpa.txt"]
+    summary = json.loads((out / "run_summary.json").read_text())
+    assert summary["documents_extracted"] == 1
+    assert summary["timings_s"]["arrival_to_flags_s"] == 2.5
+
+
+def test_failing_file_is_retried_without_holding_up_its_batch(tmp_path):
+    room = tmp_path / "room"
+    room.mkdir()
+    out = tmp_path / "out"
+    out.mkdir()
+    (room / "bad.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 1.5%\n")
+    (room / "good.txt").write_text("Fund AUM: $1.2B\nManagement Fee: 2.0%\n")
+
+    broken = {"bad.txt"}
+
+    def load_docs(paths):
+        if any(os.path.basename(p) in broken for p in paths):
+            raise ValueError("truncated PDF")
+        return load_documents(paths, ocr_enabled=False)
+
+    pipeline = DiligencePipeline([RegexExtractor()], [NumericMismatchRule(0.03, 0.25, 2.0)])
+    clock = _Clock()
+    watcher = _watcher(room, clock)
+    session = WatchSession(pipeline, load_docs, clock=clock)
+    watcher.poll()
+    clock.now += 3
+    cli._refresh_watch_outputs(session, watcher, watcher.poll(), out, {}, logging.getLogger("ddgpt"))
+
+    assert [d["doc_name"] for d in json.loads((out / "extracted.json").read_text())] == ["good.txt"]
+    assert json.loads((out / "run_summary.json").read_text())["documents_failed"] == [str(room / "bad.txt")]
+
+    # The failed file comes back on its own after another quiet period,
+    # without being touched.
+    broken.clear()
+    assert watcher.poll() is None
+    clock.now += 3
+    batch = watcher.poll()
+    assert [os.path.basename(p) for p in batch.changed] == ["bad.txt"]
+    assert batch.first_seen == 1000.0
+    cli._refresh_watch_outputs(session, watcher, batch, out, {}, logging.getLogger("ddgpt"))
+
+    assert [d["doc_name"] for d in json.loads((out / "extracted.json").read_text())] == ["bad.txt", "good.txt"]
+    assert [f["type"] for f in json.loads((out / "flags.json").read_text())] == ["MGMT_FEE_MISMATCH"]